@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+    batch_normality
+    ~~~~~~~~~~~~~~~
+    Perform the chi-squared test on every numeric column, or the selected
+    columns, of many CSV files using a pool of worker processes. One JSON
+    object is written per line for each column as its result becomes
+    available.
+
+
+    Application: The object defining the overall application entry point.
+"""
+import argparse
+import json
+import sys
+
+from lib import normality
+
+
+class Application(object):
+    """Entry point for the application"""
+
+    def execute(self):
+        """Handle parsing command-line arguments and running program"""
+        parser = argparse.ArgumentParser()
+        parser.add_argument(
+            'files', nargs='+', help='CSV files containing the data to test')
+        parser.add_argument(
+            '--columns', nargs='+', default=None,
+            help='Columns to test, defaults to every numeric column')
+        parser.add_argument(
+            '--processes', type=int, default=None,
+            help='Number of worker processes, defaults to the number of CPUs')
+        args = parser.parse_args()
+
+        test = normality.BatchNormalityTest(args.processes)
+        for result in test.execute(args.files, args.columns):
+            sys.stdout.write(json.dumps(result, sort_keys=True) + '\n')
+            sys.stdout.flush()
+
+if __name__ == '__main__':
+    Application().execute()
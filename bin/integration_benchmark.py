@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+    integration_benchmark
+    ~~~~~~~~~~~~~~~~~~~~~
+    Compare the number of function evaluations each integrator needs to reach
+    the acceptable error on the distributions used throughout the library and
+    on a sharply peaked function. The t-distributions are summarized over
+    every degree of freedom from 1 to 100.
+
+
+    Application: The object defining the overall application entry point.
+    DisplayBenchmarkReport: Display report containing the evaluation counts
+        and results of each integrator.
+"""
+import argparse
+import math
+
+from lib import display_table
+from lib import integration
+from lib import statistics
+
+
+class DisplayBenchmarkReport(object):
+    """Display integrator benchmark report"""
+
+    # [int] Initial number of segments given to each integrator
+    NUMBER_OF_SEGMENTS = 10
+    # [list] Degrees of freedom of the benchmarked t-distributions
+    DEGREES_OF_FREEDOM = range(1, 101)
+
+    def __init__(self, upper_limit, acceptable_error):
+        self.upper_limit = upper_limit
+        self.acceptable_error = acceptable_error
+
+    def get_integrands(self):
+        """Returns the integrands to be benchmarked individually.
+
+        Returns:
+            list: Contains (name, function) pairs.
+        """
+        return [
+            ('normal', statistics.normal_distribution),
+            ('peak', lambda x: math.exp(-1000 * (x - 0.3) ** 2)),
+        ]
+
+    def get_integrators(self):
+        """Returns the integrators to be benchmarked.
+
+        Returns:
+            list: Contains (name, integrator) pairs.
+        """
+        return [
+            ('simpson', integration.Integrator(
+                self.NUMBER_OF_SEGMENTS, self.acceptable_error)),
+            ('romberg', integration.RombergIntegrator(
+                self.NUMBER_OF_SEGMENTS, self.acceptable_error)),
+            ('adaptive', integration.AdaptiveIntegrator(
+                self.NUMBER_OF_SEGMENTS, self.acceptable_error)),
+            ('gauss-kronrod', integration.GaussKronrodIntegrator(
+                1, self.acceptable_error)),
+        ]
+
+    def execute(self):
+        """Integrate each function with each integrator and display the
+        evaluation counts."""
+        table = display_table.DisplayTable([
+            'Function', 'Integrator', 'Evaluations', 'Result'])
+        for function_name, func in self.get_integrands():
+            for integrator_name, integrator in self.get_integrators():
+                result = integrator.integrate(func, 0, self.upper_limit)
+                table.add_row([
+                    function_name, integrator_name,
+                    str(integrator.evaluation_count),
+                    '{:0.12f}'.format(result)])
+        table.display()
+        print
+        self.display_t_distribution_summary()
+
+    def display_t_distribution_summary(self):
+        """Integrate the t-distribution for every benchmarked degree of
+        freedom with each integrator and display the total, minimum and
+        maximum evaluation counts."""
+        print 't-distributions with {} to {} degrees of freedom'.format(
+            self.DEGREES_OF_FREEDOM[0], self.DEGREES_OF_FREEDOM[-1])
+        table = display_table.DisplayTable(
+            ['Integrator', 'Total', 'Min', 'Max'])
+        for integrator_name, integrator in self.get_integrators():
+            counts = []
+            for degrees_of_freedom in self.DEGREES_OF_FREEDOM:
+                integrator.integrate(
+                    statistics.make_t_distribution(degrees_of_freedom),
+                    0, self.upper_limit)
+                counts.append(integrator.evaluation_count)
+            table.add_row([
+                integrator_name, str(sum(counts)), str(min(counts)),
+                str(max(counts))])
+        table.display()
+
+
+class Application(object):
+    """Entry point for the application"""
+
+    def execute(self):
+        """Handle parsing command-line arguments and running program"""
+        parser = argparse.ArgumentParser()
+        parser.add_argument(
+            '--upper-limit', type=float, default=2.5,
+            help='Upper limit of integration')
+        parser.add_argument(
+            '--error', type=float, default=1E-10,
+            help='Acceptable error of each integrator')
+        args = parser.parse_args()
+        DisplayBenchmarkReport(args.upper_limit, args.error).execute()
+
+if __name__ == '__main__':
+    Application().execute()
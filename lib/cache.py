@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+    lib.cache
+    ~~~~~~~~~
+    Bounded caches for memoizing the results of expensive computations.
+
+    LRUCache: A bounded, least-recently-used cache with hit/miss counters.
+"""
+import collections
+import threading
+
+
+class LRUCache(object):
+    """A bounded mapping that evicts the least-recently-used entry once it
+    holds more than its maximum number of entries. The cache is safe to share
+    between threads.
+
+    Usage:
+    >>> cache = LRUCache(128)
+    >>> cache.lookup((8, 0.85), lambda: expensive(8, 0.85))
+    >>> cache.hits, cache.misses
+    """
+
+    def __init__(self, max_size):
+        """Initialize the cache.
+
+        Arguments:
+            max_size(int): The maximum number of entries to retain.
+
+        Raises:
+            ValueError: If the maximum size is less than 1.
+        """
+        if max_size < 1:
+            raise ValueError(
+                'Cache size must be at least 1, found {}'.format(max_size))
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Return the value cached for the given key, marking it as the most
+        recently used entry.
+
+        Arguments:
+            key(hashable): The cache key.
+            default(object): Value returned if the key is not cached.
+
+        Returns:
+            object: The cached value or the default.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            value = self._entries.pop(key)
+            self._entries[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store the value under the given key, evicting the least recently
+        used entry if the cache is full.
+
+        Arguments:
+            key(hashable): The cache key.
+            value(object): The value to be cached.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def lookup(self, key, compute):
+        """Return the value cached for the given key, computing and caching it
+        first if it is not present.
+
+        Arguments:
+            key(hashable): The cache key.
+            compute(callable): Function of no arguments returning the value.
+
+        Returns:
+            object: The cached or newly computed value.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Remove every entry and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
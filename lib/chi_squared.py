@@ -9,11 +9,107 @@
     GeneralChiSquaredTest: Reusable service component for performing
         chi-squared test that does not require data be equally divisible into
         segments.
+    StreamingChiSquaredTest: Reusable service component for performing the
+        general chi-squared test on data too large to be held in memory.
+    count_in_buckets(): Counts the values falling into each bucket given the
+        sorted bucket boundaries.
+    table_normal_quantiles(): Returns the boundaries of equal-probability
+        segments from the precomputed table.
+    integrator_key(): Returns a cache key identifying the configuration of an
+        integrator.
 """
+import bisect
+import functools
+import itertools
 import math
 
-from lib import statistics
+from lib import cache
+from lib import distributions
 from lib import integration
+from lib import io
+from lib import statistics
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# [Boolean] Whether or not to count buckets with numpy
+USE_NUMPY = numpy is not None
+# [LRUCache] Bucket upper bounds keyed by number of items, number of segments
+# and integrator configuration
+BOUNDARY_CACHE = cache.LRUCache(256)
+# [Dict] Standard normal quantiles of i / k for i > k / 2, keyed by the number
+# of equal-probability segments k. The lower half follows by symmetry.
+NORMAL_QUANTILE_TABLE = {
+    5: (
+        0.2533471031357998, 0.8416212335729144,
+    ),
+    10: (
+        0.2533471031357998, 0.5244005127080407, 0.8416212335729144,
+        1.2815515655446008,
+    ),
+    15: (
+        0.08365173390712907, 0.2533471031357998, 0.43072729929545733,
+        0.6229257232100878, 0.8416212335729144, 1.1107716166367856,
+        1.5010859460440247,
+    ),
+    20: (
+        0.12566134685507413, 0.2533471031357998, 0.3853204664075676,
+        0.5244005127080407, 0.6744897501960817, 0.8416212335729144,
+        1.0364333894937894, 1.2815515655446008, 1.6448536269514715,
+    ),
+    25: (
+        0.050153583464733656, 0.1509692154967774, 0.2533471031357998,
+        0.35845879325119373, 0.46769879911450835, 0.5828415072712162,
+        0.7063025628400875, 0.8416212335729144, 0.9944578832097528,
+        1.17498679206609, 1.4050715603096327, 1.7506860712521695,
+    ),
+    30: (
+        0.08365173390712907, 0.1678940047881054, 0.2533471031357998,
+        0.34069482708779536, 0.43072729929545733, 0.5244005127080407,
+        0.6229257232100878, 0.7279132908816445, 0.8416212335729144,
+        0.9674215661017014, 1.1107716166367856, 1.2815515655446008,
+        1.5010859460440247, 1.8339146358159142,
+    ),
+    35: (
+        0.03581663166006947, 0.107634392383102, 0.18001236979270493,
+        0.2533471031357998, 0.3280721075316511, 0.40467790453004754,
+        0.4837385530461031, 0.5659488219328631, 0.6521789863427864,
+        0.7435597568794307, 0.8416212335729144, 0.9485350408266378,
+        1.0675705238781414, 1.2040469600267019, 1.3676279233156883,
+        1.5792195192835738, 1.9022164957820151,
+    ),
+    40: (
+        0.06270677794321383, 0.12566134685507413, 0.18911842627279238,
+        0.2533471031357998, 0.31863936396437514, 0.3853204664075676,
+        0.4537621901698796, 0.5244005127080407, 0.5977601260424784,
+        0.6744897501960817, 0.7554150263604693, 0.8416212335729144,
+        0.9345892910734798, 1.0364333894937894, 1.1503493803760079,
+        1.2815515655446008, 1.439531470938456, 1.6448536269514715,
+        1.9599639845400536,
+    ),
+    45: (
+        0.027855026985458626, 0.08365173390712907, 0.1397102988818621,
+        0.1962117336451834, 0.2533471031357998, 0.3113223796441413,
+        0.37036424480675967, 0.43072729929545733, 0.49270333306004116,
+        0.5566336210672109, 0.6229257232100878, 0.6920771366140133,
+        0.7647096737863872, 0.8416212335729144, 0.9238670207443123,
+        1.0128933374446916, 1.1107716166367856, 1.2206403488473494,
+        1.3476288775748857, 1.5010859460440247, 1.7012881668522597,
+        2.0098747721953845,
+    ),
+    50: (
+        0.050153583464733656, 0.1004337205114699, 0.1509692154967774,
+        0.20189347914185077, 0.2533471031357998, 0.3054807880993974,
+        0.35845879325119373, 0.41246312944140484, 0.46769879911450835,
+        0.5244005127080407, 0.5828415072712162, 0.6433454053929168,
+        0.7063025628400875, 0.7721932141886849, 0.8416212335729144,
+        0.9153650878428139, 0.9944578832097528, 1.080319340814956,
+        1.17498679206609, 1.2815515655446008, 1.4050715603096327,
+        1.5547735945968528, 1.7506860712521695, 2.053748910631822,
+    ),
+}
 
 
 class SegmentRange(object):
@@ -60,12 +156,24 @@ class SegmentRange(object):
 class ChiSquaredTest(object):
     """Reusable service interface that performs the chi-squared test."""
 
-    def execute(self, data):
+    def __init__(self, integrator=None):
+        """Initialize.
+
+        Arguments:
+            integrator(BaseIntegrator): Integrator used for the normal
+                distribution bucket boundaries, None = use the closed-form
+                distribution.
+        """
+        self.integrator = integrator
+
+    def execute(self, data, budget=None):
         """Performs the chi-squared test on the given data returning the
         results.
 
         Arguments:
             data(list): A list of data points to be evaluated.
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
 
         Returns:
             (float, float): A tuple containing the chi-squared sum and the
@@ -74,6 +182,7 @@ class ChiSquaredTest(object):
 
         Raises:
             ValueError: If there is insufficient data.
+            BudgetExhausted: If the budget runs out, see evaluate().
         """
         if len(data) < 20:
             raise ValueError('Fewer than 20 items in data set')
@@ -82,10 +191,31 @@ class ChiSquaredTest(object):
 
         normalized_data = self.normalized_data(data)
         num_segments = self.get_number_of_segments(len(data))
-        chi_squared = self.get_chi_squared(normalized_data, num_segments)
-        p_value = self.get_p_value(chi_squared, num_segments)
+        return self.evaluate(normalized_data, num_segments, budget)
 
-        return (chi_squared, p_value)
+    def evaluate(self, normalized_data, num_segments, budget=None):
+        """Computes the chi-squared value and p-value of the given data.
+
+        Arguments:
+            normalized_data(list): The data in normalized form
+            num_segments(int): The number of segments
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
+
+        Returns:
+            (float, float): The chi-squared value and p-value.
+
+        Raises:
+            BudgetExhausted: If the budget runs out while computing the bucket
+                boundaries, its result holds no estimate.
+        """
+        try:
+            chi_squared = self.get_chi_squared(
+                normalized_data, num_segments, budget)
+        except integration.BudgetExhausted as exhausted:
+            raise integration.BudgetExhausted(integration.NumericalResult(
+                None, None, exhausted.result.evaluation_count))
+        return (chi_squared, self.get_p_value(chi_squared, num_segments))
 
     def normalized_data(self, data):
         """Return the given data in normalized form.
@@ -113,58 +243,91 @@ class ChiSquaredTest(object):
         """
         return 5.0 * math.ceil(math.sqrt(float(num_items)) / 5.0)
 
-    def get_normal_distribution_buckets(self, num_segments):
+    def get_normal_distribution_buckets(self, num_segments, budget=None):
         """This routine returns a dict with segment ranges corresponding to
         each of the buckets the normal distribution is divided into.
 
         Arguments:
             num_segments(float): The number of buckets required.
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
 
         Returns:
             dict: A hash map with a segment range for each bucket.
         """
         segment_probability = 1.0 / num_segments
-        integrator = integration.Integrator(20, 1E-10)
-        func = lambda x: integrator.integrate_minus_infinity_to(
-            statistics.normal_distribution, x)
+        upper_bounds = self.get_upper_bounds(
+            None, num_segments,
+            [i * segment_probability for i in range(1, int(num_segments))],
+            budget)
 
         results = {}
         previous_upper_bound = None
-        for i in range(1, int(num_segments)):
-            next_upper_bound = integration.approximate_inverse(
-                func, i * segment_probability)
+        for next_upper_bound in upper_bounds:
             results[SegmentRange(previous_upper_bound, next_upper_bound)] = 0
             previous_upper_bound = next_upper_bound
 
         results[SegmentRange(previous_upper_bound, None)] = 0
         return results
 
-    def get_chi_squared(self, normalized_data, num_segments):
+    def get_upper_bounds(self, num_items, num_segments,
+                         cumulative_probabilities, budget=None):
+        """Returns the upper bounds of the buckets, which are the normal
+        quantiles of the given cumulative probabilities. The bounds are taken
+        from the precomputed table where possible, otherwise they are
+        computed once and cached per number of items, number of segments and
+        integrator configuration.
+
+        Arguments:
+            num_items(int): The number of items the probabilities depend on,
+                None if they depend on the number of segments alone.
+            num_segments(int): The number of segments.
+            cumulative_probabilities(list): The cumulative probability at the
+                upper bound of every bucket but the last.
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
+
+        Returns:
+            list: The upper bound of every bucket but the last.
+        """
+        upper_bounds = table_normal_quantiles(
+            num_segments, cumulative_probabilities)
+        if upper_bounds is not None:
+            return upper_bounds
+
+        key = (num_items, int(num_segments), integrator_key(self.integrator))
+        return list(BOUNDARY_CACHE.lookup(key, lambda: tuple(
+            statistics.normal_ppf_many(
+                cumulative_probabilities, self.integrator, budget))))
+
+    def get_chi_squared(self, normalized_data, num_segments, budget=None):
         """Return the chi-squared value for the given data.
 
         Arguments:
             normalized_data(list): The data in normalized form
             num_segments(int): The number of segments
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
 
         Returns:
             float: The chi-squared result
         """
-        buckets = self.get_normal_distribution_buckets(num_segments)
-
-        for item in normalized_data:
-            for segment_range in buckets.keys():
-                if segment_range.in_range(item):
-                    buckets[segment_range] += 1
+        buckets = self.get_normal_distribution_buckets(num_segments, budget)
+        upper_bounds = sorted(
+            each.upper_bound for each in buckets
+            if each.upper_bound is not None)
+        items_per_bucket = count_in_buckets(normalized_data, upper_bounds)
 
         expected_items_per_bucket = len(normalized_data) / num_segments
         return sum([
             (expected_items_per_bucket - each)**2 / expected_items_per_bucket
-            for each in buckets.values()
+            for each in items_per_bucket
         ])
 
     def get_p_value(self, chi_squared, num_segments):
         """Return the probability that the given values are NOT normally
-        distributed.
+        distributed. This is the chi-squared cumulative distribution with one
+        fewer degrees of freedom than segments, evaluated in closed form.
 
         Arguments:
             chi_squared(float): The chi-squared test result
@@ -173,9 +336,7 @@ class ChiSquaredTest(object):
         Returns:
             float: The probability that the data is not normally distributed.
         """
-        integrator = integration.Integrator(20, 1E-10)
-        func = statistics.make_t_distribution(num_segments - 1)
-        return integrator.integrate_minus_infinity_to(func, chi_squared)
+        return distributions.chi_squared_cdf(chi_squared, num_segments - 1)
 
 
 class GeneralChiSquaredTest(ChiSquaredTest):
@@ -193,12 +354,14 @@ class GeneralChiSquaredTest(ChiSquaredTest):
     class TooFewItems(Exception):
         pass
 
-    def execute(self, data):
+    def execute(self, data, budget=None):
         """Perform the chi-squared test and return the resulting chi-squared
         and p value.
 
         Arguments:
             data(list): List of numeric values to be tested for normality.
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
 
         Returns:
             (float, float): In order: the Q value and p value.
@@ -206,6 +369,7 @@ class GeneralChiSquaredTest(ChiSquaredTest):
         Raises:
             TooFewItems: Error if too few items are provided for the test to
                 be properly performed.
+            BudgetExhausted: If the budget runs out, see evaluate().
         """
         if len(data) < self.MINIMUM_ITEMS_REQUIRED:
             raise self.TooFewItems(
@@ -214,12 +378,9 @@ class GeneralChiSquaredTest(ChiSquaredTest):
 
         normalized_data = self.normalized_data(data)
         num_segments = self.get_number_of_segments(len(data))
-        chi_squared = self.get_chi_squared(normalized_data, num_segments)
-        p_value = self.get_p_value(chi_squared, num_segments)
+        return self.evaluate(normalized_data, num_segments, budget)
 
-        return (chi_squared, p_value)
-
-    def get_chi_squared(self, normalized_data, num_segments):
+    def get_chi_squared(self, normalized_data, num_segments, budget=None):
         """This routine performs the chi-squared test and returns the value
         representing the probability that the data is not normally distributed.
 
@@ -227,6 +388,8 @@ class GeneralChiSquaredTest(ChiSquaredTest):
             normalized_data(list): The normalized data to be tested.
             num_segments(int): The number of segments to divide the normal
                 distribution into.
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
 
         Returns:
             float: The resulting chi-squared test value.
@@ -235,16 +398,28 @@ class GeneralChiSquaredTest(ChiSquaredTest):
                "Expected num_segments > 0, found {}".format(num_segments))
 
         buckets = self.get_normal_distribution_buckets(
-            len(normalized_data), num_segments)
-        items_per_bucket = [0] * len(buckets)
+            len(normalized_data), num_segments, budget)
+        items_per_bucket = count_in_buckets(
+            normalized_data, [bucket.upper_bound for bucket in buckets[:-1]])
+        return self.get_chi_squared_from_counts(
+            len(normalized_data), num_segments, items_per_bucket)
 
-        for item in normalized_data:
-            for bucket_index, bucket in enumerate(buckets):
-                if bucket.in_range(item):
-                    items_per_bucket[bucket_index] += 1
+    def get_chi_squared_from_counts(self, num_items, num_segments,
+                                    items_per_bucket):
+        """Returns the chi-squared value given the number of items counted in
+        each bucket.
 
+        Arguments:
+            num_items(int): The number of items tested.
+            num_segments(int): The number of segments the normal distribution
+                is divided into.
+            items_per_bucket(list): The number of items in each bucket.
+
+        Returns:
+            float: The resulting chi-squared test value.
+        """
         segment_allocation = self.get_segment_allocation(
-            len(normalized_data), num_segments)
+            num_items, num_segments)
 
         return sum([
             (expected - actual)**2 / float(expected)
@@ -317,7 +492,8 @@ class GeneralChiSquaredTest(ChiSquaredTest):
         ratio = num_items / float(num_segments)
         return int(ratio) == ratio
 
-    def get_normal_distribution_buckets(self, num_items, num_segments):
+    def get_normal_distribution_buckets(self, num_items, num_segments,
+                                        budget=None):
         """This routine divides the normal distribution into the given number
         of segments. It then creates a segment range for each segment based on
         the number of items expected to fall within it. It returns a list of
@@ -327,6 +503,8 @@ class GeneralChiSquaredTest(ChiSquaredTest):
             num_items(int): The number of items to be tested.
             num_segments(int): The number of segments to divide the normal
                 distribution into.
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
 
         Returns:
             list: A list of SegmentRange objects for each segment.
@@ -334,22 +512,188 @@ class GeneralChiSquaredTest(ChiSquaredTest):
         assert(num_segments > 0,
                "number of segments is less than 1: {}".format(num_segments))
 
-        integrator = integration.Integrator(20, 1E-10)
-        func = lambda x: integrator.integrate_minus_infinity_to(
-            statistics.normal_distribution, x)
-
-        results = []
         cumulative_probability = 0
-        previous_upper_bound = None
+        cumulative_probabilities = []
         segment_allocation = self.get_segment_allocation(
             num_items, num_segments)
-
         for items_in_segment in segment_allocation[:-1]:
             cumulative_probability += items_in_segment / float(num_items)
-            upper_bound = integration.approximate_inverse(
-                func, cumulative_probability)
+            cumulative_probabilities.append(cumulative_probability)
+        upper_bounds = self.get_upper_bounds(
+            num_items, num_segments, cumulative_probabilities, budget)
+
+        results = []
+        previous_upper_bound = None
+        for upper_bound in upper_bounds:
             results.append(SegmentRange(previous_upper_bound, upper_bound))
             previous_upper_bound = upper_bound
 
         results.append(SegmentRange(previous_upper_bound, None))
         return results
+
+
+class StreamingChiSquaredTest(GeneralChiSquaredTest):
+    """Reusable service interface that performs the general chi-squared test
+    in two passes over the data without holding it in memory. The first pass
+    accumulates the count, mean and standard deviation. The second normalizes
+    each value on the fly and counts it into its bucket, so memory use grows
+    with the number of buckets rather than the number of items.
+
+    Usage:
+    >>> test = StreamingChiSquaredTest()
+    >>> chi_squared, p_value = test.execute('latencies.txt')
+    >>> chi_squared, p_value = test.execute(lambda: open_values_generator())
+    """
+
+    # [Integer] The number of normalized values counted into buckets at once
+    CHUNK_SIZE = 65536
+
+    def execute(self, source, budget=None):
+        """Perform the chi-squared test and return the resulting chi-squared
+        and p value.
+
+        Arguments:
+            source(basestring or callable): The path to a file containing one
+                number per line, or a function of no arguments returning a new
+                iterable over the values each time it is called.
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
+
+        Returns:
+            (float, float): In order: the Q value and p value.
+
+        Raises:
+            TooFewItems: Error if too few items are provided for the test to
+                be properly performed.
+            BudgetExhausted: If the budget runs out, its result holds no
+                estimate.
+        """
+        if isinstance(source, basestring):
+            source = functools.partial(io.iterate_numbers_from_file, source)
+
+        moments = statistics.RunningMoments.from_iterable(source())
+        if moments.count < self.MINIMUM_ITEMS_REQUIRED:
+            raise self.TooFewItems(
+                'Expected {} items, found {}'.format(
+                    self.MINIMUM_ITEMS_REQUIRED, moments.count))
+
+        num_segments = self.get_number_of_segments(moments.count)
+        try:
+            buckets = self.get_normal_distribution_buckets(
+                moments.count, num_segments, budget)
+        except integration.BudgetExhausted as exhausted:
+            raise integration.BudgetExhausted(integration.NumericalResult(
+                None, None, exhausted.result.evaluation_count))
+
+        items_per_bucket = self.count_normalized_values(
+            source(), moments.get_mean(), moments.get_standard_deviation(),
+            [bucket.upper_bound for bucket in buckets[:-1]])
+        chi_squared = self.get_chi_squared_from_counts(
+            moments.count, num_segments, items_per_bucket)
+        return (chi_squared, self.get_p_value(chi_squared, num_segments))
+
+    def count_normalized_values(self, values, mean, stddev, upper_bounds):
+        """Normalizes the given values and counts them into buckets, a chunk
+        at a time.
+
+        Arguments:
+            values(iterable): The values to be counted.
+            mean(float): The mean of the values.
+            stddev(float): The standard deviation of the values.
+            upper_bounds(list): The sorted upper bounds of every bucket but
+                the last, which is unbounded.
+
+        Returns:
+            list: The number of normalized values in each bucket.
+        """
+        items_per_bucket = [0] * (len(upper_bounds) + 1)
+        iterator = iter(values)
+        while True:
+            chunk = [
+                (each - mean) / stddev
+                for each in itertools.islice(iterator, self.CHUNK_SIZE)]
+            if not chunk:
+                return items_per_bucket
+            for i, count in enumerate(count_in_buckets(chunk, upper_bounds)):
+                items_per_bucket[i] += count
+
+
+def count_in_buckets(values, upper_bounds):
+    """Counts the values falling into each of the buckets bounded by the
+    given sorted upper bounds. Each value is placed by binary search, a
+    value equal to a bound falls into the bucket below it.
+
+    Arguments:
+        values(list): The values to be counted.
+        upper_bounds(list): The sorted upper bounds of every bucket but the
+            last, which is unbounded.
+
+    Returns:
+        list: The number of values in each of the len(upper_bounds) + 1
+            buckets, in order.
+    """
+    num_buckets = len(upper_bounds) + 1
+    if USE_NUMPY:
+        indices = numpy.searchsorted(
+            numpy.asarray(upper_bounds, dtype=float),
+            numpy.asarray(values, dtype=float), side='left')
+        return [int(each) for each in numpy.bincount(
+            indices, minlength=num_buckets)]
+
+    counts = [0] * num_buckets
+    for value in values:
+        counts[bisect.bisect_left(upper_bounds, value)] += 1
+    return counts
+
+
+def table_normal_quantiles(num_segments, cumulative_probabilities):
+    """Returns the standard normal quantiles of the given cumulative
+    probabilities from NORMAL_QUANTILE_TABLE, if they divide the
+    distribution into equal-probability segments.
+
+    Arguments:
+        num_segments(int): The number of segments.
+        cumulative_probabilities(list): The cumulative probability at the
+            upper bound of every segment but the last.
+
+    Returns:
+        list: The quantiles, None if the table does not cover them.
+    """
+    num_segments = int(num_segments)
+    upper_half = NORMAL_QUANTILE_TABLE.get(num_segments)
+    if (upper_half is None or
+            len(cumulative_probabilities) != num_segments - 1):
+        return None
+
+    # The index of the first upper half quantile is one past the middle
+    offset = num_segments // 2 + 1
+    results = []
+    for i, probability in enumerate(cumulative_probabilities, 1):
+        if abs(probability - i / float(num_segments)) > 1E-12:
+            return None
+        if 2 * i == num_segments:
+            results.append(0.0)
+        elif 2 * i > num_segments:
+            results.append(upper_half[i - offset])
+        else:
+            results.append(-upper_half[num_segments - i - offset])
+    return results
+
+
+def integrator_key(integrator):
+    """Returns a key identifying the configuration of the given integrator, so
+    that equally configured integrators share cached results without the
+    cache keeping them alive.
+
+    Arguments:
+        integrator(BaseIntegrator): The integrator, None = the closed-form
+            distribution.
+
+    Returns:
+        tuple: The integrator class, number of segments and acceptable error,
+            None for the closed-form distribution.
+    """
+    if integrator is None:
+        return None
+    return (type(integrator), integrator.number_of_segments,
+            integrator.acceptable_error)
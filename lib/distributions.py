@@ -0,0 +1,532 @@
+# -*- coding: utf-8 -*-
+"""
+    lib.distributions
+    ~~~~~~~~~~~~~~~~~
+    Closed-form cumulative distribution and quantile functions for the normal,
+    t and chi-squared distributions. These replace numerical integration of
+    the probability density functions in lib.statistics and lib.chi_squared.
+
+    Accuracy: normal_cdf() and t_cdf() are accurate to roughly 1E-14 absolute.
+    normal_ppf() has a relative error near machine precision after its Halley
+    refinement. t_ppf() is refined until the tail probability of the returned
+    value is within a relative 1E-12 of the requested tail probability.
+    incomplete_gamma() and chi_squared_cdf() are accurate to roughly 1E-15
+    absolute.
+
+    incomplete_beta(): Returns the regularized incomplete beta function.
+    incomplete_gamma(): Returns the regularized lower incomplete gamma
+        function.
+    normal_pdf(): Returns the standard normal probability density.
+    normal_cdf(): Returns the standard normal cumulative distribution.
+    normal_ppf(): Returns the standard normal quantile (inverse cdf).
+    t_pdf(): Returns the t-distribution probability density.
+    t_cdf(): Returns the t-distribution cumulative distribution.
+    t_ppf(): Returns the t-distribution quantile (inverse cdf).
+    chi_squared_cdf(): Returns the chi-squared cumulative distribution.
+    cached_t_ppf(): Memoized t_ppf(), consulting the precomputed table first.
+    load_t_quantile_table(): Load precomputed t quantiles from a CSV file.
+    write_t_quantile_table(): Write precomputed t quantiles to a CSV file.
+
+    The precomputed quantile table named by the DSE_T_QUANTILE_TABLE
+    environment variable, if any, is loaded when this module is imported.
+"""
+import csv
+import math
+import os
+import threading
+
+from lib import cache
+
+
+# [Float] Relative precision used when evaluating continued fractions.
+EPSILON = 1E-15
+
+# [Float] Smallest representable magnitude used to avoid division by zero.
+TINY = 1E-300
+
+# [Integer] The maximum number of continued fraction or refinement steps.
+MAX_ITERATIONS = 1000
+
+# [Float] Acceptable relative error in the tail probability of a quantile.
+QUANTILE_TOLERANCE = 1E-12
+
+# [String] Environment variable naming a quantile table to load at startup.
+T_QUANTILE_TABLE_VARIABLE = 'DSE_T_QUANTILE_TABLE'
+
+# [List] Column names used in precomputed quantile table files.
+T_QUANTILE_TABLE_COLUMNS = ['Degrees of Freedom', 'Probability', 'Quantile']
+
+# [Dict] Precomputed quantiles keyed by (degrees of freedom, probability).
+T_QUANTILE_TABLE = {}
+
+# [Integer] Number of quantiles served from T_QUANTILE_TABLE.
+T_QUANTILE_TABLE_HITS = 0
+
+# [Lock] Guards updates to T_QUANTILE_TABLE_HITS.
+T_QUANTILE_TABLE_LOCK = threading.Lock()
+
+# [LRUCache] Process-wide cache of quantiles keyed by (df, probability).
+T_QUANTILE_CACHE = cache.LRUCache(1024)
+
+# Coefficients for Acklam's rational approximation to the normal quantile.
+_A = (-3.969683028665376e+01, 2.209460984245205e+02,
+      -2.759285104469687e+02, 1.383577518672690e+02,
+      -3.066479806614716e+01, 2.506628277459239e+00)
+_B = (-5.447609879822406e+01, 1.615858368580409e+02,
+      -1.556989798598866e+02, 6.680131188771972e+01,
+      -1.328068155288572e+01)
+_C = (-7.784894002430293e-03, -3.223964580411365e-01,
+      -2.400758277161838e+00, -2.549732539343734e+00,
+      4.374664141464968e+00, 2.938163982698783e+00)
+_D = (7.784695709041462e-03, 3.224671290700398e-01,
+      2.445134137142996e+00, 3.754408661907416e+00)
+
+
+def _check_probability(p):
+    """Raises an error if the given value is not a probability strictly
+    between 0 and 1.
+
+    Arguments:
+        p(float): The value to be checked.
+
+    Raises:
+        ValueError: If the value is out of range.
+    """
+    if not 0.0 < p < 1.0:
+        raise ValueError('Probability must be in (0, 1), found {}'.format(p))
+
+
+def _beta_continued_fraction(x, a, b):
+    """Evaluates the continued fraction for the incomplete beta function
+    using the modified Lentz method.
+
+    Arguments:
+        x(float): The upper limit, in [0, 1].
+        a(float): The first shape parameter.
+        b(float): The second shape parameter.
+
+    Returns:
+        float: The value of the continued fraction.
+
+    Raises:
+        RuntimeError: If the continued fraction fails to converge.
+    """
+    qab = a + b
+    qap = a + 1.0
+    qam = a - 1.0
+    c = 1.0
+    d = 1.0 - qab * x / qap
+    if abs(d) < TINY:
+        d = TINY
+    d = 1.0 / d
+    result = d
+
+    for m in range(1, MAX_ITERATIONS + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        if abs(d) < TINY:
+            d = TINY
+        c = 1.0 + aa / c
+        if abs(c) < TINY:
+            c = TINY
+        d = 1.0 / d
+        result *= d * c
+
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        if abs(d) < TINY:
+            d = TINY
+        c = 1.0 + aa / c
+        if abs(c) < TINY:
+            c = TINY
+        d = 1.0 / d
+        delta = d * c
+        result *= delta
+
+        if abs(delta - 1.0) < EPSILON:
+            return result
+
+    raise RuntimeError('Incomplete beta continued fraction did not converge')
+
+
+def incomplete_beta(x, a, b):
+    """Computes the regularized incomplete beta function I_x(a, b).
+
+    Arguments:
+        x(float): The upper limit, in [0, 1].
+        a(float): The first shape parameter, greater than 0.
+        b(float): The second shape parameter, greater than 0.
+
+    Returns:
+        float: The regularized incomplete beta function value.
+
+    Raises:
+        ValueError: If x is outside of [0, 1].
+    """
+    if x < 0.0 or x > 1.0:
+        raise ValueError('x must be in [0, 1], found {}'.format(x))
+    if x == 0.0 or x == 1.0:
+        return x
+
+    log_front = (
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) +
+        a * math.log(x) + b * math.log(1.0 - x)
+    )
+    front = math.exp(log_front)
+
+    # The continued fraction converges rapidly only on one side of the mean,
+    # use the symmetry relation I_x(a, b) = 1 - I_(1-x)(b, a) on the other.
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _beta_continued_fraction(x, a, b) / a
+    return 1.0 - front * _beta_continued_fraction(1.0 - x, b, a) / b
+
+
+def _gamma_series(a, x):
+    """Evaluates the series for the regularized lower incomplete gamma
+    function, which converges rapidly for x < a + 1.
+
+    Arguments:
+        a(float): The shape parameter, greater than 0.
+        x(float): The upper limit, greater than 0.
+
+    Returns:
+        float: The regularized lower incomplete gamma function value.
+
+    Raises:
+        RuntimeError: If the series fails to converge.
+    """
+    term = 1.0 / a
+    total = term
+    denominator = a
+    for _ in range(MAX_ITERATIONS):
+        denominator += 1.0
+        term *= x / denominator
+        total += term
+        if abs(term) < abs(total) * EPSILON:
+            return total * math.exp(-x + a * math.log(x) - math.lgamma(a))
+
+    raise RuntimeError('Incomplete gamma series did not converge')
+
+
+def _gamma_continued_fraction(a, x):
+    """Evaluates the continued fraction for the regularized upper incomplete
+    gamma function using the modified Lentz method. It converges rapidly for
+    x >= a + 1.
+
+    Arguments:
+        a(float): The shape parameter, greater than 0.
+        x(float): The lower limit, greater than 0.
+
+    Returns:
+        float: The regularized upper incomplete gamma function value.
+
+    Raises:
+        RuntimeError: If the continued fraction fails to converge.
+    """
+    b = x + 1.0 - a
+    c = 1.0 / TINY
+    d = 1.0 / b
+    result = d
+
+    for i in range(1, MAX_ITERATIONS + 1):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        if abs(d) < TINY:
+            d = TINY
+        c = b + an / c
+        if abs(c) < TINY:
+            c = TINY
+        d = 1.0 / d
+        delta = d * c
+        result *= delta
+
+        if abs(delta - 1.0) < EPSILON:
+            return result * math.exp(-x + a * math.log(x) - math.lgamma(a))
+
+    raise RuntimeError('Incomplete gamma continued fraction did not converge')
+
+
+def incomplete_gamma(a, x):
+    """Computes the regularized lower incomplete gamma function P(a, x).
+
+    Arguments:
+        a(float): The shape parameter, greater than 0.
+        x(float): The upper limit, at least 0.
+
+    Returns:
+        float: The regularized lower incomplete gamma function value.
+
+    Raises:
+        ValueError: If a is not positive or x is negative.
+    """
+    if a <= 0.0:
+        raise ValueError('a must be greater than 0, found {}'.format(a))
+    if x < 0.0:
+        raise ValueError('x must be at least 0, found {}'.format(x))
+    if x == 0.0:
+        return 0.0
+
+    # The series converges rapidly below a + 1 and the continued fraction
+    # above it.
+    if x < a + 1.0:
+        return _gamma_series(a, x)
+    return 1.0 - _gamma_continued_fraction(a, x)
+
+
+def normal_pdf(x):
+    """Computes the standard normal probability density at x.
+
+    Arguments:
+        x(float): The x value.
+
+    Returns:
+        float: The probability density.
+    """
+    return math.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
+
+
+def normal_cdf(x):
+    """Computes the standard normal cumulative distribution at x.
+
+    Arguments:
+        x(float): The x value.
+
+    Returns:
+        float: The probability of a value less than or equal to x.
+    """
+    return 0.5 * math.erfc(-x / math.sqrt(2))
+
+
+def normal_ppf(p):
+    """Computes the standard normal quantile for the given probability. Uses
+    Acklam's rational approximation refined with a single Halley step.
+
+    Arguments:
+        p(float): A probability in (0, 1).
+
+    Returns:
+        float: The value x such that normal_cdf(x) = p.
+
+    Raises:
+        ValueError: If the probability is out of range.
+    """
+    _check_probability(p)
+
+    p_low = 0.02425
+    if p < p_low:
+        q = math.sqrt(-2 * math.log(p))
+        x = (
+            (((((_C[0] * q + _C[1]) * q + _C[2]) * q + _C[3]) * q + _C[4]) *
+             q + _C[5]) /
+            ((((_D[0] * q + _D[1]) * q + _D[2]) * q + _D[3]) * q + 1)
+        )
+    elif p <= 1 - p_low:
+        q = p - 0.5
+        r = q * q
+        x = (
+            (((((_A[0] * r + _A[1]) * r + _A[2]) * r + _A[3]) * r + _A[4]) *
+             r + _A[5]) * q /
+            (((((_B[0] * r + _B[1]) * r + _B[2]) * r + _B[3]) * r + _B[4]) *
+             r + 1)
+        )
+    else:
+        q = math.sqrt(-2 * math.log(1 - p))
+        x = -(
+            (((((_C[0] * q + _C[1]) * q + _C[2]) * q + _C[3]) * q + _C[4]) *
+             q + _C[5]) /
+            ((((_D[0] * q + _D[1]) * q + _D[2]) * q + _D[3]) * q + 1)
+        )
+
+    # Halley refinement brings the relative error down to machine precision
+    error = normal_cdf(x) - p
+    u = error * math.sqrt(2 * math.pi) * math.exp(0.5 * x * x)
+    return x - u / (1 + 0.5 * x * u)
+
+
+def t_pdf(t, degrees_of_freedom):
+    """Computes the t-distribution probability density at t.
+
+    Arguments:
+        t(float): The t value.
+        degrees_of_freedom(float): The degrees of freedom.
+
+    Returns:
+        float: The probability density.
+    """
+    df = float(degrees_of_freedom)
+    log_const = (
+        math.lgamma((df + 1) / 2.0) - math.lgamma(df / 2.0) -
+        0.5 * math.log(df * math.pi)
+    )
+    return math.exp(log_const - ((df + 1) / 2.0) * math.log1p(t * t / df))
+
+
+def _t_upper_tail(t, degrees_of_freedom):
+    """Computes the probability of a t value greater than |t|.
+
+    Arguments:
+        t(float): The t value.
+        degrees_of_freedom(float): The degrees of freedom.
+
+    Returns:
+        float: The upper tail probability.
+    """
+    df = float(degrees_of_freedom)
+    return 0.5 * incomplete_beta(df / (df + t * t), df / 2.0, 0.5)
+
+
+def t_cdf(t, degrees_of_freedom):
+    """Computes the t-distribution cumulative distribution at t.
+
+    Arguments:
+        t(float): The t value.
+        degrees_of_freedom(float): The degrees of freedom.
+
+    Returns:
+        float: The probability of a value less than or equal to t.
+    """
+    tail = _t_upper_tail(t, degrees_of_freedom)
+    if t > 0:
+        return 1.0 - tail
+    return tail
+
+
+def t_ppf(p, degrees_of_freedom):
+    """Computes the t-distribution quantile for the given probability. The
+    starting point is a Cornish-Fisher expansion about the normal quantile,
+    which is then refined by Newton steps on the upper tail probability,
+    safeguarded by bisection.
+
+    Arguments:
+        p(float): A probability in (0, 1).
+        degrees_of_freedom(float): The degrees of freedom.
+
+    Returns:
+        float: The value t such that t_cdf(t, degrees_of_freedom) = p.
+
+    Raises:
+        ValueError: If the probability is out of range.
+    """
+    _check_probability(p)
+    df = float(degrees_of_freedom)
+
+    if p == 0.5:
+        return 0.0
+    if p < 0.5:
+        return -t_ppf(1.0 - p, df)
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+
+    z = normal_ppf(p)
+    guess = (
+        z +
+        (z**3 + z) / (4 * df) +
+        (5 * z**5 + 16 * z**3 + 3 * z) / (96 * df**2) +
+        (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * df**3)
+    )
+
+    # Bracket the root of upper_tail(t) - tail, which is decreasing in t
+    tail = 1.0 - p
+    lower, upper = 0.0, max(guess, 1.0)
+    while _t_upper_tail(upper, df) > tail:
+        lower, upper = upper, 2 * upper
+
+    t = guess if lower < guess < upper else 0.5 * (lower + upper)
+    for _ in range(MAX_ITERATIONS):
+        error = _t_upper_tail(t, df) - tail
+        if abs(error) <= QUANTILE_TOLERANCE * tail:
+            return t
+        if error > 0:
+            lower = t
+        else:
+            upper = t
+        next_t = t + error / t_pdf(t, df)
+        if not lower < next_t < upper:
+            next_t = 0.5 * (lower + upper)
+        if next_t == t:
+            return t
+        t = next_t
+
+    return t
+
+
+def chi_squared_cdf(q, degrees_of_freedom):
+    """Computes the chi-squared cumulative distribution at q.
+
+    Arguments:
+        q(float): The chi-squared value.
+        degrees_of_freedom(float): The degrees of freedom, greater than 0.
+
+    Returns:
+        float: The probability of a value less than or equal to q.
+    """
+    if q <= 0.0:
+        return 0.0
+    return incomplete_gamma(degrees_of_freedom / 2.0, q / 2.0)
+
+
+def cached_t_ppf(p, degrees_of_freedom):
+    """Computes the t-distribution quantile for the given probability. Values
+    are taken from the precomputed T_QUANTILE_TABLE when present, counted in
+    T_QUANTILE_TABLE_HITS, otherwise they are memoized in T_QUANTILE_CACHE.
+
+    Arguments:
+        p(float): A probability in (0, 1).
+        degrees_of_freedom(float): The degrees of freedom.
+
+    Returns:
+        float: The value t such that t_cdf(t, degrees_of_freedom) = p.
+    """
+    global T_QUANTILE_TABLE_HITS
+    key = (float(degrees_of_freedom), float(p))
+    if key in T_QUANTILE_TABLE:
+        with T_QUANTILE_TABLE_LOCK:
+            T_QUANTILE_TABLE_HITS += 1
+        return T_QUANTILE_TABLE[key]
+    return T_QUANTILE_CACHE.lookup(key, lambda: t_ppf(p, degrees_of_freedom))
+
+
+def load_t_quantile_table(file_path):
+    """Loads precomputed t quantiles from a CSV file into T_QUANTILE_TABLE.
+
+    Arguments:
+        file_path(basestring): Path to a file written by
+            write_t_quantile_table().
+
+    Returns:
+        int: The number of quantiles loaded.
+    """
+    df_column, p_column, quantile_column = T_QUANTILE_TABLE_COLUMNS
+    num_loaded = 0
+    with open(file_path) as table_file:
+        for row in csv.DictReader(table_file):
+            key = (float(row[df_column]), float(row[p_column]))
+            T_QUANTILE_TABLE[key] = float(row[quantile_column])
+            num_loaded += 1
+    return num_loaded
+
+
+def write_t_quantile_table(file_path, degrees_of_freedom, probabilities):
+    """Computes t quantiles for every combination of the given degrees of
+    freedom and probabilities, and writes them to a CSV file.
+
+    Arguments:
+        file_path(basestring): Path to the file to be written.
+        degrees_of_freedom(list): The degrees of freedom to tabulate.
+        probabilities(list): The probabilities to tabulate.
+    """
+    with open(file_path, 'w') as table_file:
+        writer = csv.writer(table_file)
+        writer.writerow(T_QUANTILE_TABLE_COLUMNS)
+        for df in degrees_of_freedom:
+            for p in probabilities:
+                writer.writerow([repr(float(df)), repr(float(p)),
+                                 repr(t_ppf(p, df))])
+
+
+if os.environ.get(T_QUANTILE_TABLE_VARIABLE):
+    load_t_quantile_table(os.environ[T_QUANTILE_TABLE_VARIABLE])
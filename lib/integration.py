@@ -4,22 +4,356 @@
     ~~~~~~~~~~~~~~~
     Module for handling numerical integration.
 
+    NumericalResult: The best estimate reached by a numerical routine.
+    BudgetExhausted: Error raised when a numerical routine runs out of its
+        budget.
+    Budget: Limits on the function evaluations and time numerical routines
+        may spend.
+    BaseIntegrator: Interface shared by every numerical integrator.
     Integrator: Interface that uses Simpson's Rule to numerically integrate a
-        function.
+        function, reusing function values between refinement levels.
+    RombergIntegrator: Interface that uses Romberg extrapolation of the
+        trapezoid rule to numerically integrate a function.
+    AdaptiveIntegrator: Interface that uses locally adaptive Simpson's Rule to
+        numerically integrate a function.
+    GaussKronrodIntegrator: Interface that uses the 15-point Gauss-Kronrod
+        rule to numerically integrate a function.
+    CumulativeDistribution: Cumulative distribution of a probability density
+        that reuses previously integrated ranges.
     is_even(): Indicates whether or not the given integer value is even.
+    simpson(): Apply Simpson's Rule to a single pair of segments.
+    gauss_kronrod(): Apply the 7-point Gauss and 15-point Kronrod rules to a
+        single segment.
+    tail_substitution(): Returns an integrand over [0, 1] equivalent to
+        integrating a function over a semi-infinite range.
     derivative(): Return a function that returns derivative of given function.
     newton_raphson(): Uses the Newton-Raphson method to compute fixed point
         of the given function.
+    find_root(): Find a root of the given function with safeguarded Newton
+        or secant steps, falling back to bisection.
     approximate_inverse(): Approximate the inverse of a function at the given
         point.
+    approximate_inverse_many(): Approximate the inverse of an increasing
+        function at many points.
 """
+import bisect
+import time
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
-class Integrator(object):
+# [Integer] The default maximum number of iterations of find_root().
+MAX_ITERATIONS = 100
+# [Float] Distance of the second point of the first secant step.
+INITIAL_SECANT_STEP = 0.1
+# [Float] Distance from t = 1 at which tail_substitution() integrands are
+# evaluated in place of the end point.
+TAIL_OFFSET = 1E-8
+
+# [List] Kronrod nodes on [-1, 1] in decreasing order, the odd entries are
+# also the 7-point Gauss nodes
+KRONROD_NODES = [
+    0.991455371120812639206854697526329,
+    0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926,
+    0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013,
+    0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245,
+    0.000000000000000000000000000000000,
+]
+# [List] 15-point Kronrod weights matching KRONROD_NODES
+KRONROD_WEIGHTS = [
+    0.022935322010529224963732008058970,
+    0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518,
+    0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550,
+    0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649,
+    0.209482141084727828012999174891714,
+]
+# [List] 7-point Gauss weights matching the odd entries of KRONROD_NODES
+GAUSS_WEIGHTS = [
+    0.129484966168869693270611432679082,
+    0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975,
+    0.417959183673469387755102040816327,
+]
+
+
+class NumericalResult(object):
+    """The best estimate reached by a numerical routine."""
+
+    def __init__(self, value, error, evaluation_count):
+        """Initialize.
+
+        Arguments:
+            value(object): The best estimate, None if there is none.
+            error(float): The estimated error of the value, None if unknown.
+            evaluation_count(int): The number of function evaluations made.
+        """
+        self.value = value
+        self.error = error
+        self.evaluation_count = evaluation_count
+
+    def __repr__(self):
+        return 'NumericalResult({}, {}, {})'.format(
+            self.value, self.error, self.evaluation_count)
+
+    def derive(self, func, error_scale=1.0):
+        """Returns the result for a value computed from this one.
+
+        Arguments:
+            func(callable): Computes the derived value from this value.
+            error_scale(float): The factor by which the derived value changes
+                per unit change in this value.
+
+        Returns:
+            NumericalResult: The derived result.
+        """
+        value = None if self.value is None else func(self.value)
+        error = None if self.error is None else abs(error_scale) * self.error
+        return NumericalResult(value, error, self.evaluation_count)
+
+
+class BudgetExhausted(RuntimeError):
+    """Raised when a numerical routine runs out of its evaluation or time
+    budget before converging. The best estimate reached is available as
+    result.
+    """
+
+    def __init__(self, result):
+        """Initialize.
+
+        Arguments:
+            result(NumericalResult): The best estimate reached.
+        """
+        super(BudgetExhausted, self).__init__(
+            'Budget exhausted after {} evaluations, estimate {} with error '
+            '{}'.format(result.evaluation_count, result.value, result.error))
+        self.result = result
+
+
+class Budget(object):
+    """Limits on the function evaluations and wall-clock time that may be
+    spent by the numerical routines sharing the budget. Routines check the
+    budget before evaluating their function and raise BudgetExhausted rather
+    than exceed it.
+
+    Evaluations are charged where they are made. A root finder whose function
+    integrates against the same budget is charged only for the integrand
+    evaluations, not again for its own calls.
+
+    Usage:
+    >>> budget = Budget(max_evaluations=5000, timeout=0.05)
+    >>> integrator.integrate(normal_distribution, 0, 2.5, budget)
+    """
+
+    def __init__(self, max_evaluations=None, timeout=None):
+        """Initialize.
+
+        Arguments:
+            max_evaluations(int): The maximum number of function evaluations,
+                None = unlimited.
+            timeout(float): The number of seconds from now after which no
+                more evaluations may be made, None = unlimited.
+        """
+        self.max_evaluations = max_evaluations
+        self.deadline = None if timeout is None else time.time() + timeout
+        # The number of function evaluations charged so far
+        self.evaluation_count = 0
+
+    def can_afford(self, count):
+        """Indicates whether the given number of evaluations may be made.
+
+        Arguments:
+            count(int): The number of evaluations.
+
+        Returns:
+            bool: True if the evaluations fit in the budget, False otherwise.
+        """
+        if (self.max_evaluations is not None and
+                self.evaluation_count + count > self.max_evaluations):
+            return False
+        return self.deadline is None or time.time() < self.deadline
+
+    def charge(self, count):
+        """Record the given number of evaluations.
+
+        Arguments:
+            count(int): The number of evaluations made.
+        """
+        self.evaluation_count += count
+
+
+class BaseIntegrator(object):
+    """Interface shared by every numerical integrator. Implementations
+    provide integrate(func, lower_limit, upper_limit, budget=None), which
+    returns the approximate integral of func between the limits, raises
+    BudgetExhausted if the budget or any limit of the integrator runs out
+    before the integral converges and records the number of function
+    evaluations it made in evaluation_count.
+    """
+
+    # The number of function evaluations made by the last integration
+    evaluation_count = 0
+
+    def integrate_minus_infinity_to(self, func, upper_limit, symmetric=True,
+                                    budget=None):
+        """Integrate the given function from negative infinity to the
+        given upper limit.
+
+        A probability density symmetric about zero only needs to be
+        integrated between zero and the upper limit. Any other function is
+        integrated over the whole range by substituting x = u - t / (1 - t),
+        which maps it onto t in [0, 1].
+
+        Arguments:
+            func(callable): The function to be integrated
+            upper_limit(float): THe upper limit for the integration.
+            symmetric(bool): Whether the function is a probability density
+                that is symmetric about zero.
+            budget(Budget): Limits the work done, None = unlimited.
+
+        Returns:
+            float: The approximation to the integral.
+
+        Raises:
+            BudgetExhausted: If the budget runs out before the integral
+                converges.
+        """
+        if not symmetric:
+            return self.integrate(
+                tail_substitution(func, upper_limit, -1), 0.0, 1.0, budget)
+        sign = -1 if upper_limit < 0 else 1
+        try:
+            result = self.integrate(func, 0, abs(upper_limit), budget)
+        except BudgetExhausted as exhausted:
+            raise BudgetExhausted(
+                exhausted.result.derive(lambda value: 0.5 + sign * value))
+        return 0.5 + sign * result
+
+    def integrate_to_infinity(self, func, lower_limit, budget=None):
+        """Integrate the given function from the given lower limit to
+        infinity, by substituting x = l + t / (1 - t), which maps the range
+        onto t in [0, 1].
+
+        Arguments:
+            func(callable): The function to be integrated
+            lower_limit(float): The lower limit for the integration.
+            budget(Budget): Limits the work done, None = unlimited.
+
+        Returns:
+            float: The approximation to the integral.
+
+        Raises:
+            BudgetExhausted: If the budget runs out before the integral
+                converges.
+        """
+        return self.integrate(
+            tail_substitution(func, lower_limit, 1), 0.0, 1.0, budget)
+
+    def cumulative(self, func, limits, symmetric=True, budget=None):
+        """Integrate the given function from negative infinity to each of the
+        given upper limits.
+
+        For a probability density symmetric about zero the limits are swept
+        in order of their distance from zero, otherwise they are swept in
+        increasing order starting with the tail below the smallest one. Only
+        the range between consecutive limits is integrated, so the cost is
+        proportional to the span covered rather than to the sum of the
+        ranges. Each range is integrated to the acceptable error.
+
+        Arguments:
+            func(callable): The function to be integrated
+            limits(list): The upper limits for the integration.
+            symmetric(bool): Whether the function is a probability density
+                that is symmetric about zero.
+            budget(Budget): Limits the work done, None = unlimited.
+
+        Returns:
+            list: The approximations to the integrals, in the order of the
+                given limits.
+
+        Raises:
+            BudgetExhausted: If the budget runs out before every integral
+                converges. Its result holds the list of integrals, with None
+                for the limits that were not reached.
+        """
+        if not symmetric:
+            return self._cumulative_from_tail(func, limits, budget)
+
+        results = [None] * len(limits)
+        order = sorted(range(len(limits)), key=lambda i: abs(limits[i]))
+        evaluation_count = 0
+        area = 0.0
+        previous_distance = 0.0
+        for index in order:
+            distance = abs(limits[index])
+            if distance > previous_distance:
+                try:
+                    area += self.integrate(
+                        func, previous_distance, distance, budget)
+                except BudgetExhausted as exhausted:
+                    raise BudgetExhausted(NumericalResult(
+                        results, exhausted.result.error,
+                        evaluation_count + exhausted.result.evaluation_count))
+                evaluation_count += self.evaluation_count
+                previous_distance = distance
+            results[index] = 0.5 - area if limits[index] < 0 else 0.5 + area
+        self.evaluation_count = evaluation_count
+        return results
+
+    def _cumulative_from_tail(self, func, limits, budget=None):
+        """Integrate the given function from negative infinity to each of the
+        given upper limits, sweeping the limits in increasing order.
+
+        Arguments:
+            func(callable): The function to be integrated
+            limits(list): The upper limits for the integration.
+            budget(Budget): Limits the work done, None = unlimited.
+
+        Returns:
+            list: The approximations to the integrals, in the order of the
+                given limits.
+
+        Raises:
+            BudgetExhausted: If the budget runs out before every integral
+                converges.
+        """
+        results = [None] * len(limits)
+        order = sorted(range(len(limits)), key=lambda i: limits[i])
+        evaluation_count = 0
+        area = previous_limit = None
+        for index in order:
+            try:
+                if area is None:
+                    area = self.integrate_minus_infinity_to(
+                        func, limits[index], False, budget)
+                    evaluation_count += self.evaluation_count
+                elif limits[index] > previous_limit:
+                    area += self.integrate(
+                        func, previous_limit, limits[index], budget)
+                    evaluation_count += self.evaluation_count
+            except BudgetExhausted as exhausted:
+                raise BudgetExhausted(NumericalResult(
+                    results, exhausted.result.error,
+                    evaluation_count + exhausted.result.evaluation_count))
+            previous_limit = limits[index]
+            results[index] = area
+        self.evaluation_count = evaluation_count
+        return results
+
+
+class Integrator(BaseIntegrator):
     """Interface that uses Simpson's Rule to numerically integrate a function.
     """
 
-    def __init__(self, number_of_segments, acceptable_error):
+    def __init__(self, number_of_segments, acceptable_error,
+                 vectorized=False):
         """Initialize the integrator with tolerance values.
 
         Arguments:
@@ -27,55 +361,510 @@ class Integrator(object):
                 segments to initially divide ranges into.
             acceptable_error(float): The acceptable degree of error in the
                 result.
+            vectorized(bool): Whether the integrand accepts a numpy array of
+                points and returns an array of values. Each refinement level
+                is then evaluated with a single call. Ignored if numpy is not
+                installed.
         """
         if not is_even(number_of_segments):
             raise ValueError(
                 "Simpson's rule requires an even number of segments")
         self.number_of_segments = number_of_segments
         self.acceptable_error = acceptable_error
+        self.vectorized = vectorized
+        # The number of function evaluations made by the last integration
+        self.evaluation_count = 0
 
-    def integrate(self, func, lower_limit, upper_limit):
+    def integrate(self, func, lower_limit, upper_limit, budget=None):
         """Integrate the given function from lower limit to higher limit.
 
+        Each refinement doubles the number of segments. Every point of the
+        previous level is a point of the next, so the sums of previously
+        evaluated points are kept and only the new midpoints are evaluated.
+
         Arguments:
             func(callable): The function to be integrated
             lower_limit(float): The lower limit for the integration.
             upper_limit(float): The upper limit for the integration.
+            budget(Budget): Limits the work done, None = unlimited.
 
         Returns:
             float: The approximation to the integral.
+
+        Raises:
+            BudgetExhausted: If the budget runs out before successive levels
+                agree. Its result holds the last level and the difference
+                from the level before it.
         """
-        previous_result = 0
         num_segments = self.number_of_segments
+        segment_width = (upper_limit - lower_limit) / float(num_segments)
+        self.evaluation_count = 0
+        if budget is not None and not budget.can_afford(num_segments + 1):
+            raise BudgetExhausted(NumericalResult(None, None, 0))
+
+        # Simpson's rule weights the end points by 1, the even interior
+        # points by 2 and the odd points by 4.
+        end_sum = func(lower_limit) + func(upper_limit)
+        even_sum = self._sum_points(
+            func, lower_limit, segment_width, 2, num_segments // 2 - 1)
+        odd_sum = self._sum_points(
+            func, lower_limit, segment_width, 1, num_segments // 2)
+        self.evaluation_count = num_segments + 1
+        if budget is not None:
+            budget.charge(num_segments + 1)
+
+        previous_result = 0
+        refined = False
         while True:
-            segment_width = (upper_limit - lower_limit) / num_segments
-            result = func(lower_limit) + func(upper_limit)
-            for point in range(1, (num_segments / 2)):
-                result += 2 * func(lower_limit + (2 * point * segment_width))
-            for point in range(1, (num_segments / 2) + 1):
-                result += 4 * func(
-                    lower_limit + ((2 * point - 1) * segment_width))
-            result *= (segment_width / 3)
+            result = (end_sum + 2 * even_sum + 4 * odd_sum) * (
+                segment_width / 3)
             if abs(result - previous_result) < self.acceptable_error:
                 return result
+
+            # The refined level evaluates one new point per current segment
+            if budget is not None and not budget.can_afford(num_segments):
+                error = abs(result - previous_result) if refined else None
+                raise BudgetExhausted(NumericalResult(
+                    result, error, self.evaluation_count))
             previous_result = result
+            refined = True
+
+            # The old odd points become even points of the refined level
+            even_sum += odd_sum
             num_segments = 2 * num_segments
+            segment_width = segment_width / 2
+            odd_sum = self._sum_points(
+                func, lower_limit, segment_width, 1, num_segments // 2)
+            self.evaluation_count += num_segments // 2
+            if budget is not None:
+                budget.charge(num_segments // 2)
 
-    def integrate_minus_infinity_to(self, func, upper_limit):
-        """Integrate the given function from negative infinity to the
-        given upper limit.
+    def _sum_points(self, func, lower_limit, segment_width, first, count):
+        """Sums the function over every other segment boundary, starting
+        with the given boundary.
 
         Arguments:
             func(callable): The function to be integrated
-            upper_limit(float): THe upper limit for the integration.
+            lower_limit(float): The lower limit for the integration.
+            segment_width(float): The width of each segment.
+            first(int): The index of the first boundary.
+            count(int): The number of boundaries to sum.
+
+        Returns:
+            float: The sum of the function values.
+        """
+        if self.vectorized and numpy is not None:
+            if count < 1:
+                return 0.0
+            indices = first + 2 * numpy.arange(count)
+            points = lower_limit + indices * segment_width
+            return float(numpy.sum(func(points)))
+        total = 0.0
+        for point in range(count):
+            total += func(lower_limit + ((first + 2 * point) * segment_width))
+        return total
+
+
+class RombergIntegrator(Integrator):
+    """Interface that uses Romberg's method to numerically integrate a
+    function. Each level halves the trapezoid segments, reusing every
+    earlier function value, and Richardson extrapolation over the levels
+    cancels successive error terms. The second column of the tableau is
+    Simpson's rule. Smooth integrands such as the normal and t densities
+    converge in far fewer evaluations, but sharply peaked ones may need more:
+    with 10 segments and an acceptable error of 1E-10, exp(-1000(x - 0.3)^2)
+    over [0, 2.5] takes 2561 evaluations against Simpson's 641.
+    """
+
+    # [Integer] The maximum number of trapezoid levels. The last level has
+    # 2**(MAX_LEVELS - 1) times the initial number of segments.
+    MAX_LEVELS = 12
+
+    def integrate(self, func, lower_limit, upper_limit, budget=None):
+        """Integrate the given function from lower limit to higher limit.
+
+        The result is accepted once the diagonal of the tableau changes by
+        less than the acceptable error.
+
+        Arguments:
+            func(callable): The function to be integrated
+            lower_limit(float): The lower limit for the integration.
+            upper_limit(float): The upper limit for the integration.
+            budget(Budget): Limits the work done, None = unlimited.
+
+        Returns:
+            float: The approximation to the integral.
+
+        Raises:
+            BudgetExhausted: If the budget runs out, or the maximum number of
+                levels is reached, before the diagonal converges. Its result
+                holds the last diagonal entry and its change from the one
+                before.
+        """
+        num_segments = self.number_of_segments
+        segment_width = (upper_limit - lower_limit) / float(num_segments)
+        self.evaluation_count = 0
+        if budget is not None and not budget.can_afford(num_segments + 1):
+            raise BudgetExhausted(NumericalResult(None, None, 0))
+
+        interior_sum = self._sum_points(
+            func, lower_limit, segment_width / 2, 2, num_segments - 1)
+        trapezoid = segment_width * (
+            (func(lower_limit) + func(upper_limit)) / 2.0 + interior_sum)
+        self.evaluation_count = num_segments + 1
+        if budget is not None:
+            budget.charge(num_segments + 1)
+
+        previous_row = [trapezoid]
+        error = None
+        for level in range(1, self.MAX_LEVELS):
+            if budget is not None and not budget.can_afford(num_segments):
+                raise BudgetExhausted(NumericalResult(
+                    previous_row[-1], error, self.evaluation_count))
+
+            # The midpoints of the current segments are the new points
+            segment_width = segment_width / 2
+            midpoint_sum = self._sum_points(
+                func, lower_limit, segment_width, 1, num_segments)
+            self.evaluation_count += num_segments
+            if budget is not None:
+                budget.charge(num_segments)
+            num_segments = 2 * num_segments
+
+            row = [previous_row[0] / 2 + segment_width * midpoint_sum]
+            for column in range(1, level + 1):
+                row.append(row[column - 1] + (
+                    row[column - 1] - previous_row[column - 1]) / (
+                        4 ** column - 1))
+
+            error = abs(row[-1] - previous_row[-1])
+            previous_row = row
+            if level > 1 and error < self.acceptable_error:
+                return row[-1]
+
+        raise BudgetExhausted(NumericalResult(
+            previous_row[-1], error, self.evaluation_count))
+
+
+class AdaptiveIntegrator(BaseIntegrator):
+    """Interface that uses locally adaptive Simpson's Rule to numerically
+    integrate a function. Only the segments whose local error estimate
+    exceeds their share of the acceptable error are subdivided, so sharply
+    peaked integrands do not force refinement of the whole range.
+    """
+
+    # [Integer] The maximum number of times a segment may be halved.
+    MAX_DEPTH = 50
+
+    def __init__(self, number_of_segments, acceptable_error,
+                 max_evaluations=None):
+        """Initialize the integrator with tolerance values.
+
+        Arguments:
+            number_of_segments(int): Even number indicating the number of
+                segments to initially divide ranges into.
+            acceptable_error(float): The acceptable degree of error in the
+                result.
+            max_evaluations(int): The maximum number of function evaluations
+                per integration, at least one more than the number of
+                segments, None = unlimited.
+
+        Raises:
+            ValueError: If the number of segments is odd, or there are too
+                few evaluations to apply the rule once to each segment.
+        """
+        if not is_even(number_of_segments):
+            raise ValueError(
+                "Simpson's rule requires an even number of segments")
+        if (max_evaluations is not None and
+                max_evaluations < number_of_segments + 1):
+            raise ValueError(
+                'At least {} evaluations are required, found {}'.format(
+                    number_of_segments + 1, max_evaluations))
+        self.number_of_segments = number_of_segments
+        self.acceptable_error = acceptable_error
+        self.max_evaluations = max_evaluations
+        # The number of function evaluations made by the last integration
+        self.evaluation_count = 0
+
+    def integrate(self, func, lower_limit, upper_limit, budget=None):
+        """Integrate the given function from lower limit to higher limit.
+
+        Arguments:
+            func(callable): The function to be integrated
+            lower_limit(float): The lower limit for the integration.
+            upper_limit(float): The upper limit for the integration.
+            budget(Budget): Limits the work done, None = unlimited.
+
+        Returns:
+            float: The approximation to the integral.
+
+        Raises:
+            BudgetExhausted: If the budget or the maximum number of
+                evaluations runs out, or a segment reaches the maximum depth,
+                before every segment meets its tolerance. Its result holds
+                the sum of every segment and their estimated error.
+        """
+        num_panels = self.number_of_segments // 2
+        panel_width = (upper_limit - lower_limit) / float(num_panels)
+        tolerance = self.acceptable_error / num_panels
+        self.evaluation_count = 0
+        if budget is not None and not budget.can_afford(
+                self.number_of_segments + 1):
+            raise BudgetExhausted(NumericalResult(None, None, 0))
+
+        points = [lower_limit + i * panel_width for i in range(num_panels)]
+        points.append(upper_limit)
+        values = [func(point) for point in points]
+        self.evaluation_count = len(points)
+
+        segments = []
+        for i in range(num_panels):
+            middle = points[i] + panel_width / 2
+            middle_value = func(middle)
+            self.evaluation_count += 1
+            whole = simpson(
+                points[i], points[i + 1],
+                values[i], middle_value, values[i + 1])
+            # The error of an unrefined segment is not known yet
+            segments.append((
+                points[i], points[i + 1], values[i], middle_value,
+                values[i + 1], whole, float('inf'), tolerance, 0))
+        if budget is not None:
+            budget.charge(self.evaluation_count)
+
+        result = 0.0
+        unresolved_error = 0.0
+        exhausted = False
+        while segments:
+            (lower, upper, lower_value, middle_value, upper_value, whole,
+             error, tolerance, depth) = segments.pop()
+
+            if ((self.max_evaluations is not None and
+                 self.evaluation_count + 2 > self.max_evaluations) or
+                    (budget is not None and not budget.can_afford(2))):
+                exhausted = True
+                result += whole
+                unresolved_error += error
+                continue
+
+            middle = (lower + upper) / 2.0
+            left_value = func((lower + middle) / 2.0)
+            right_value = func((middle + upper) / 2.0)
+            self.evaluation_count += 2
+            if budget is not None:
+                budget.charge(2)
+            left = simpson(
+                lower, middle, lower_value, left_value, middle_value)
+            right = simpson(
+                middle, upper, middle_value, right_value, upper_value)
+            delta = left + right - whole
+
+            if abs(delta) <= 15 * tolerance or depth >= self.MAX_DEPTH:
+                if abs(delta) > 15 * tolerance:
+                    exhausted = True
+                    unresolved_error += abs(delta) / 15.0
+                result += left + right + delta / 15.0
+            else:
+                # Each half carries about half of the error of the pair
+                error = abs(delta) / 30.0
+                segments.append((
+                    lower, middle, lower_value, left_value, middle_value,
+                    left, error, tolerance / 2, depth + 1))
+                segments.append((
+                    middle, upper, middle_value, right_value, upper_value,
+                    right, error, tolerance / 2, depth + 1))
+
+        if exhausted:
+            raise BudgetExhausted(NumericalResult(
+                result, unresolved_error, self.evaluation_count))
+        return result
+
+
+class GaussKronrodIntegrator(BaseIntegrator):
+    """Interface that uses the 15-point Gauss-Kronrod rule to numerically
+    integrate a function. The difference between the embedded 7-point Gauss
+    result and the Kronrod result estimates the error of each segment, and
+    segments that miss their share of the acceptable error are halved. Smooth
+    integrands usually need a single rule application per segment.
+    """
+
+    # [Integer] The maximum number of times a segment may be halved.
+    MAX_DEPTH = 50
+
+    def __init__(self, number_of_segments, acceptable_error,
+                 max_evaluations=None):
+        """Initialize the integrator with tolerance values.
+
+        Arguments:
+            number_of_segments(int): Number of segments to initially divide
+                ranges into.
+            acceptable_error(float): The acceptable degree of error in the
+                result.
+            max_evaluations(int): The maximum number of function evaluations
+                per integration, at least 15 per segment, None = unlimited.
+
+        Raises:
+            ValueError: If there are no segments, or too few evaluations to
+                apply the rule once to each segment.
+        """
+        if number_of_segments < 1:
+            raise ValueError(
+                'At least one segment is required, found {}'.format(
+                    number_of_segments))
+        if (max_evaluations is not None and
+                max_evaluations < 15 * number_of_segments):
+            raise ValueError(
+                'At least {} evaluations are required, found {}'.format(
+                    15 * number_of_segments, max_evaluations))
+        self.number_of_segments = number_of_segments
+        self.acceptable_error = acceptable_error
+        self.max_evaluations = max_evaluations
+        self.evaluation_count = 0
+
+    def integrate(self, func, lower_limit, upper_limit, budget=None):
+        """Integrate the given function from lower limit to higher limit.
+
+        Arguments:
+            func(callable): The function to be integrated
+            lower_limit(float): The lower limit for the integration.
+            upper_limit(float): The upper limit for the integration.
+            budget(Budget): Limits the work done, None = unlimited.
 
         Returns:
             float: The approximation to the integral.
+
+        Raises:
+            BudgetExhausted: If the budget or the maximum number of
+                evaluations runs out, or a segment reaches the maximum depth,
+                before every segment meets its tolerance. Its result holds
+                the sum of every segment and their estimated error.
+        """
+        width = (upper_limit - lower_limit) / float(self.number_of_segments)
+        tolerance = self.acceptable_error / self.number_of_segments
+        self.evaluation_count = 0
+        if budget is not None and not budget.can_afford(
+                15 * self.number_of_segments):
+            raise BudgetExhausted(NumericalResult(None, None, 0))
+
+        segments = []
+        for i in range(self.number_of_segments):
+            lower = lower_limit + i * width
+            upper = (upper_limit if i == self.number_of_segments - 1
+                     else lower_limit + (i + 1) * width)
+            kronrod, error = gauss_kronrod(func, lower, upper)
+            segments.append((lower, upper, kronrod, error, tolerance, 0))
+        self.evaluation_count = 15 * self.number_of_segments
+        if budget is not None:
+            budget.charge(self.evaluation_count)
+
+        result = 0.0
+        unresolved_error = 0.0
+        exhausted = False
+        while segments:
+            lower, upper, kronrod, error, tolerance, depth = segments.pop()
+            if error <= tolerance:
+                result += kronrod
+                continue
+
+            if (depth >= self.MAX_DEPTH or
+                    (self.max_evaluations is not None and
+                     self.evaluation_count + 30 > self.max_evaluations) or
+                    (budget is not None and not budget.can_afford(30))):
+                exhausted = True
+            else:
+                middle = (lower + upper) / 2.0
+                left, left_error = gauss_kronrod(func, lower, middle)
+                right, right_error = gauss_kronrod(func, middle, upper)
+                self.evaluation_count += 30
+                if budget is not None:
+                    budget.charge(30)
+                segments.append((
+                    lower, middle, left, left_error, tolerance / 2,
+                    depth + 1))
+                segments.append((
+                    middle, upper, right, right_error, tolerance / 2,
+                    depth + 1))
+                continue
+
+            result += kronrod
+            unresolved_error += error
+
+        if exhausted:
+            raise BudgetExhausted(NumericalResult(
+                result, unresolved_error, self.evaluation_count))
+        return result
+
+
+class CumulativeDistribution(object):
+    """Cumulative distribution of a probability density, computed by
+    integrating the density from the nearest point already evaluated. Nearby
+    evaluations, such as the iterates of a root finder or the boundaries of
+    neighbouring buckets, therefore only integrate the short range between
+    them. Errors of the individual integrations accumulate along the chain of
+    evaluated points.
+
+    Usage:
+    >>> cdf = CumulativeDistribution(integrator, normal_distribution)
+    >>> approximate_inverse_many(cdf, [0.2, 0.4, 0.6, 0.8])
+    """
+
+    def __init__(self, integrator, func, origin=0.0, origin_value=0.5,
+                 budget=None):
+        """Initialize.
+
+        Arguments:
+            integrator(BaseIntegrator): Integrator used for the density.
+            func(callable): The probability density function.
+            origin(float): A point at which the distribution is known.
+            origin_value(float): The distribution at the origin, the default
+                is correct for densities symmetric about zero.
+            budget(Budget): Limits the work done by every evaluation, None =
+                unlimited.
+        """
+        self.integrator = integrator
+        self.func = func
+        self.budget = budget
+        self.points = [origin]
+        self.values = [origin_value]
+        # The total number of density evaluations made
+        self.evaluation_count = 0
+
+    def __call__(self, x):
+        """Returns the cumulative distribution at x.
+
+        Arguments:
+            x(float): The upper limit of the distribution.
+
+        Returns:
+            float: The approximation to the cumulative distribution.
+
+        Raises:
+            BudgetExhausted: If the budget runs out before the integral
+                converges.
         """
-        result = self.integrate(func, 0, abs(upper_limit))
-        if upper_limit < 0:
-            return 0.5 - result
-        return 0.5 + result
+        index = bisect.bisect_left(self.points, x)
+        if index < len(self.points) and self.points[index] == x:
+            return self.values[index]
+
+        nearest = index
+        if index == len(self.points) or (
+                index > 0 and
+                x - self.points[index - 1] < self.points[index] - x):
+            nearest = index - 1
+        start = self.values[nearest]
+        try:
+            value = start + self.integrator.integrate(
+                self.func, self.points[nearest], x, self.budget)
+        except BudgetExhausted as exhausted:
+            self.evaluation_count += self.integrator.evaluation_count
+            raise BudgetExhausted(
+                exhausted.result.derive(lambda integral: start + integral))
+        self.evaluation_count += self.integrator.evaluation_count
+
+        self.points.insert(index, x)
+        self.values.insert(index, value)
+        return value
 
 
 def is_even(x):
@@ -90,6 +879,79 @@ def is_even(x):
     return (x % 2 == 0)
 
 
+def simpson(lower_limit, upper_limit, lower_value, middle_value,
+            upper_value):
+    """Applies Simpson's Rule to a single pair of segments.
+
+    Arguments:
+        lower_limit(float): The lower limit of the segment pair.
+        upper_limit(float): The upper limit of the segment pair.
+        lower_value(float): The function value at the lower limit.
+        middle_value(float): The function value at the midpoint.
+        upper_value(float): The function value at the upper limit.
+
+    Returns:
+        float: The approximation to the integral over the segment pair.
+    """
+    return (upper_limit - lower_limit) / 6.0 * (
+        lower_value + 4 * middle_value + upper_value)
+
+
+def gauss_kronrod(func, lower_limit, upper_limit):
+    """Applies the 7-point Gauss and 15-point Kronrod rules to a single
+    segment. The Kronrod rule reuses every Gauss node, so both results cost
+    15 function evaluations.
+
+    Arguments:
+        func(callable): The function to be integrated
+        lower_limit(float): The lower limit of the segment.
+        upper_limit(float): The upper limit of the segment.
+
+    Returns:
+        tuple: The Kronrod approximation to the integral over the segment and
+            its estimated error.
+    """
+    center = (lower_limit + upper_limit) / 2.0
+    half_width = (upper_limit - lower_limit) / 2.0
+
+    center_value = func(center)
+    kronrod = center_value * KRONROD_WEIGHTS[-1]
+    gauss = center_value * GAUSS_WEIGHTS[-1]
+    for i, node in enumerate(KRONROD_NODES[:-1]):
+        offset = half_width * node
+        pair_sum = func(center - offset) + func(center + offset)
+        kronrod += pair_sum * KRONROD_WEIGHTS[i]
+        if i % 2 == 1:
+            gauss += pair_sum * GAUSS_WEIGHTS[i // 2]
+    return kronrod * half_width, abs((kronrod - gauss) * half_width)
+
+
+def tail_substitution(func, limit, direction):
+    """Returns the integrand for integrating the given function from the
+    given limit to infinity in the given direction, substituting
+    x = limit + direction * t / (1 - t) so the range maps onto t in [0, 1].
+    At t = 1 the integrand is evaluated just short of it, which gives its
+    limit for heavy-tailed functions as well as for fast decaying ones.
+
+    Arguments:
+        func(callable): The function to be integrated
+        limit(float): The finite limit of the integration.
+        direction(int): 1 to integrate up to infinity, -1 to integrate down
+            to negative infinity.
+
+    Returns:
+        callable: The integrand over t, which also accepts a numpy array if
+            the function does.
+    """
+    def integrand(t):
+        if numpy is not None and isinstance(t, numpy.ndarray):
+            t = numpy.minimum(t, 1 - TAIL_OFFSET)
+        else:
+            t = min(t, 1 - TAIL_OFFSET)
+        return func(limit + direction * t / (1 - t)) / (1 - t)**2
+    return integrand
+
+
 def derivative(f, dx=10E-8):
     """Returns a function that will compute the value of the derivative of the
     given function at any point x.
@@ -106,7 +968,7 @@ def derivative(f, dx=10E-8):
     return df
 
 
-def newton_raphson(f, guess, tolerance=1E-8):
+def newton_raphson(f, guess, tolerance=1E-8, budget=None):
     """Use the Newton-Raphson method to compute the fixed-point of the given
     function.
 
@@ -114,29 +976,272 @@ def newton_raphson(f, guess, tolerance=1E-8):
         f(callable): A function that takes a single variable x.
         guess(float): The initial guess
         tolerance(float): The acceptable tolerance for an answer.
+        budget(Budget): Limits the work done, None = unlimited. Each step
+            makes three calls to f. If f charges the budget itself only its
+            evaluations are counted, otherwise each step is charged three.
 
     Returns:
         float: The approximate fixed point for the given function.
+
+    Raises:
+        BudgetExhausted: If the budget runs out, including inside f, before
+            the steps converge. Its result holds the latest guess, the size
+            of the last step and the evaluations made.
     """
     df = derivative(f)
     newton = lambda x: (x - (f(x) / df(x)))
-    current_guess = guess
-    next_guess = newton(guess)
-    while abs(next_guess - current_guess) > tolerance:
-        current_guess = next_guess
-        next_guess = newton(current_guess)
+    current_guess = None
+    next_guess = guess
+    evaluation_count = 0
+    while (current_guess is None or
+           abs(next_guess - current_guess) > tolerance):
+        error = (None if current_guess is None
+                 else abs(next_guess - current_guess))
+        if budget is not None and not budget.can_afford(3):
+            raise BudgetExhausted(NumericalResult(
+                next_guess, error, evaluation_count))
+        charged = 0 if budget is None else budget.evaluation_count
+        try:
+            step_guess = newton(next_guess)
+        except BudgetExhausted as exhausted:
+            raise BudgetExhausted(NumericalResult(
+                next_guess, error, evaluation_count +
+                _evaluations_inside(exhausted, budget, charged)))
+        evaluation_count += _charge_calls(budget, charged, 3)
+        current_guess, next_guess = next_guess, step_guess
     return next_guess
 
 
-def approximate_inverse(f, point):
+def _evaluations_inside(exhausted, budget, charged):
+    """Returns the number of evaluations made by a function that ran out of
+    budget.
+
+    Arguments:
+        exhausted(BudgetExhausted): The error raised by the function.
+        budget(Budget): The budget of the caller, None = unlimited.
+        charged(int): The evaluations charged to the budget before the
+            function was called.
+
+    Returns:
+        int: The evaluations charged to the budget by the function, or those
+            reported by the error if the caller has no budget.
+    """
+    if budget is None:
+        return exhausted.result.evaluation_count
+    return budget.evaluation_count - charged
+
+
+def _charge_calls(budget, charged, calls):
+    """Charges the budget for calls to a function that does not charge it
+    itself, so evaluations made inside the function are never counted twice.
+
+    Arguments:
+        budget(Budget): The budget to be charged, None = unlimited.
+        charged(int): The evaluations charged to the budget before the
+            function was called.
+        calls(int): The number of calls made to the function.
+
+    Returns:
+        int: The number of evaluations made by the calls.
+    """
+    if budget is None:
+        return calls
+    spent = budget.evaluation_count - charged
+    if spent == 0:
+        budget.charge(calls)
+        spent = calls
+    return spent
+
+
+def find_root(f, guess, df=None, lower_limit=None, upper_limit=None,
+              tolerance=1E-8, max_iterations=MAX_ITERATIONS, budget=None):
+    """Find a root of the given function.
+
+    Each iteration takes a Newton step using the given derivative, or a
+    secant step through the last two points if there is none. Once points on
+    both sides of the root have been seen they bracket it, and any step that
+    leaves the bracket or fails to halve the step before last is replaced by
+    bisection. The function is evaluated once per iteration.
+
+    Arguments:
+        f(callable): A function that takes a single variable x.
+        guess(float): The initial guess
+        df(callable): The derivative of the function, None = use secant
+            steps.
+        lower_limit(float): The lowest point at which f may be evaluated,
+            None = unbounded.
+        upper_limit(float): The highest point at which f may be evaluated,
+            None = unbounded.
+        tolerance(float): The acceptable tolerance for an answer.
+        max_iterations(int): The maximum number of function evaluations.
+        budget(Budget): Limits the work done, None = unlimited. If f charges
+            the budget itself only its evaluations are counted, otherwise
+            each call to f is charged once.
+
+    Returns:
+        float: The approximate root of the function.
+
+    Raises:
+        RuntimeError: If no root is found within the maximum number of
+            iterations.
+        BudgetExhausted: If the budget runs out, including inside f, before
+            a root is found. Its result holds the latest point, the width of
+            the bracket, or the size of the last step if there is none, and
+            the evaluations made.
+    """
+    # The most recent points at which f was negative and positive
+    negative = positive = None
+    previous_x = previous_value = None
+    step = step_before = None
+    x = guess
+    evaluation_count = 0
+
+    def exhausted(evaluation_count):
+        if negative is not None and positive is not None:
+            error = abs(positive - negative)
+        else:
+            error = None if step is None else abs(step)
+        return BudgetExhausted(NumericalResult(x, error, evaluation_count))
+
+    for _ in range(max_iterations):
+        if budget is not None and not budget.can_afford(1):
+            raise exhausted(evaluation_count)
+        charged = 0 if budget is None else budget.evaluation_count
+        try:
+            value = f(x)
+        except BudgetExhausted as error:
+            raise exhausted(evaluation_count +
+                            _evaluations_inside(error, budget, charged))
+        evaluation_count += _charge_calls(budget, charged, 1)
+        if value == 0:
+            return x
+        if value < 0:
+            negative = x
+        else:
+            positive = x
+
+        if df is not None:
+            slope = df(x)
+        elif previous_x is not None and previous_x != x:
+            slope = (value - previous_value) / (x - previous_x)
+        else:
+            slope = None
+        candidate = x - value / slope if slope else None
+
+        if negative is not None and positive is not None:
+            low, high = min(negative, positive), max(negative, positive)
+            if high - low < tolerance:
+                return x
+            if step_before is None:
+                step_before = high - low
+            if (candidate is None or not low < candidate < high or
+                    abs(candidate - x) > abs(step_before) / 2):
+                candidate = (low + high) / 2.0
+        else:
+            if candidate is None:
+                candidate = x + (2 * step if step else INITIAL_SECANT_STEP)
+            if lower_limit is not None and candidate < lower_limit:
+                candidate = (x + lower_limit) / 2.0
+            if upper_limit is not None and candidate > upper_limit:
+                candidate = (x + upper_limit) / 2.0
+
+        step_before, step = step, candidate - x
+        previous_x, previous_value = x, value
+        x = candidate
+        if abs(step) < tolerance:
+            return x
+
+    raise RuntimeError(
+        'No root found within {} iterations'.format(max_iterations))
+
+
+def approximate_inverse(f, point, df=None, guess=0.5, lower_limit=None,
+                        upper_limit=None, tolerance=1E-8,
+                        max_iterations=MAX_ITERATIONS, budget=None):
     """Approximate the inverse of the function for the given point.
 
     Arguments:
         f(callable): A function
         point(float): The point to compute the inverse of
+        df(callable): The derivative of the function, None = use secant
+            steps. For a cumulative distribution this is the probability
+            density.
+        guess(float): The initial guess
+        lower_limit(float): The lowest value the inverse may take, None =
+            unbounded.
+        upper_limit(float): The highest value the inverse may take, None =
+            unbounded.
+        tolerance(float): The acceptable tolerance for an answer.
+        max_iterations(int): The maximum number of evaluations of f.
+        budget(Budget): Limits the work done, None = unlimited.
 
     Returns:
         float: The approximate inverse
+
+    Raises:
+        RuntimeError: If the inverse is not found within the maximum number
+            of iterations.
+        BudgetExhausted: If the budget runs out before the inverse is found.
     """
     h = lambda x: f(x) - point
-    return newton_raphson(h, 0.5)
+    return find_root(
+        h, guess, df, lower_limit, upper_limit, tolerance, max_iterations,
+        budget)
+
+
+def approximate_inverse_many(f, points, df=None, guess=0.5,
+                             lower_limit=None, upper_limit=None,
+                             tolerance=1E-8, max_iterations=MAX_ITERATIONS,
+                             budget=None):
+    """Approximate the inverse of an increasing function for many points.
+
+    The points are solved in increasing order. Each solve starts from the
+    previous inverse, which also bounds it from below.
+
+    Arguments:
+        f(callable): An increasing function
+        points(list): The points to compute the inverse of
+        df(callable): The derivative of the function, None = use secant
+            steps.
+        guess(float): The initial guess for the smallest point
+        lower_limit(float): The lowest value the inverse may take, None =
+            unbounded.
+        upper_limit(float): The highest value the inverse may take, None =
+            unbounded.
+        tolerance(float): The acceptable tolerance for an answer.
+        max_iterations(int): The maximum number of evaluations of f per
+            point.
+        budget(Budget): Limits the work done for all of the points, None =
+            unlimited.
+
+    Returns:
+        list: The approximate inverses, in the order of the given points.
+
+    Raises:
+        RuntimeError: If an inverse is not found within the maximum number
+            of iterations.
+        BudgetExhausted: If the budget runs out before every inverse is
+            found. Its result holds the list of inverses, with the estimate
+            for the point being solved and None for the points not reached.
+    """
+    results = [None] * len(points)
+    order = sorted(range(len(points)), key=lambda i: points[i])
+    previous_point = None
+    charged = 0 if budget is None else budget.evaluation_count
+    for index in order:
+        if previous_point is not None and points[index] == previous_point:
+            results[index] = guess
+            continue
+        try:
+            guess = approximate_inverse(
+                f, points[index], df, guess, lower_limit, upper_limit,
+                tolerance, max_iterations, budget)
+        except BudgetExhausted as exhausted:
+            results[index] = exhausted.result.value
+            raise BudgetExhausted(NumericalResult(
+                results, exhausted.result.error,
+                _evaluations_inside(exhausted, budget, charged)))
+        results[index] = guess
+        lower_limit = guess
+        previous_point = points[index]
+    return results
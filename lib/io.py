@@ -17,6 +17,8 @@
     write_numbers_to_file(): Write numbers to given file one per line.
     read_numbers_from_file(): Read numbers from file, one per line, and return
         in a list.
+    iterate_numbers_from_file(): Read numbers from file, one per line, one at
+        a time.
     find_files_matching(): Find all files matching pattern in path and its
         subdirectories.
     is_valid_file_name(): Indicates whether or not a file name is valid.
@@ -225,13 +227,24 @@ def read_numbers_from_file(file_name):
     Returns:
         list: The numbers from the file as float values.
     """
+    return list(iterate_numbers_from_file(file_name))
+
+
+def iterate_numbers_from_file(file_name):
+    """Reads numbers from a file one line at a time, so the file is never
+    held in memory.
+
+    Arguments:
+        file_name(str): The path to the file to read.
+
+    Returns:
+        generator: Yields the numbers from the file as float values.
+    """
     with open(file_name, 'r') as in_file:
-        results = []
-        for line in in_file.readlines():
+        for line in in_file:
             stripped_line = line.strip()
             if stripped_line:
-                results.append(float(stripped_line))
-        return results
+                yield float(stripped_line)
 
 
 def find_files_matching(path, pattern):
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+    lib.normality
+    ~~~~~~~~~~~~~
+    Batch normality testing of the columns of many CSV files. Each column is
+    tested in a pool of worker processes and the results are returned as they
+    become available. Only a bounded number of columns are read ahead of the
+    results, so memory does not grow with the number of files.
+
+    BatchNormalityTest: Reusable service component that performs the
+        chi-squared test on every selected column of the given files.
+    numeric_columns(): Returns the columns of CSV data containing numeric
+        values.
+    evaluate_column(): Performs the chi-squared test on a single column.
+"""
+import collections
+import multiprocessing
+
+from lib import chi_squared
+from lib import io
+
+
+class BatchNormalityTest(object):
+    """Reusable service interface that performs the chi-squared test on the
+    columns of many CSV files using a pool of worker processes.
+
+    Usage:
+    >>> for result in BatchNormalityTest().execute(['a.csv', 'b.csv']):
+    ...     print result['file'], result['column'], result['p_value']
+    """
+
+    # [Integer] The number of columns submitted per worker process that have
+    # not yet been returned.
+    PENDING_COLUMNS_PER_PROCESS = 4
+
+    def __init__(self, processes=None):
+        """Initialize.
+
+        Arguments:
+            processes(int): The number of worker processes, None = the number
+                of CPUs.
+        """
+        self.processes = processes
+
+    def get_max_pending(self):
+        """Returns the number of columns that may be submitted to the pool
+        before the oldest result has been returned.
+
+        Returns:
+            int: The maximum number of pending columns.
+        """
+        processes = self.processes or multiprocessing.cpu_count()
+        return self.PENDING_COLUMNS_PER_PROCESS * processes
+
+    def execute(self, file_paths, columns=None):
+        """Tests each selected column of each file, yielding one result per
+        column in the order the columns are read. A column is only read once
+        fewer than get_max_pending() columns are awaiting results, so results
+        stream out while later files are still to be read.
+
+        Arguments:
+            file_paths(list): Paths of the CSV files to be tested.
+            columns(list): Names of the columns to be tested, None = every
+                numeric column.
+
+        Returns:
+            generator: Yields a result dict for each column, see
+                evaluate_column().
+        """
+        max_pending = self.get_max_pending()
+        pool = multiprocessing.Pool(self.processes)
+        try:
+            # Pool.imap would read every task up front, so submit them here
+            pending = collections.deque()
+            for task in self.get_tasks(file_paths, columns):
+                pending.append(pool.apply_async(evaluate_column, (task,)))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    def get_tasks(self, file_paths, columns=None):
+        """Reads the given files and returns the columns to be tested.
+
+        Arguments:
+            file_paths(list): Paths of the CSV files to be tested.
+            columns(list): Names of the columns to be tested, None = every
+                numeric column.
+
+        Returns:
+            generator: Yields (file path, column name, values) tuples. The
+                values are None if the column is missing or not entirely
+                numeric.
+        """
+        for file_path in file_paths:
+            data = io.read_csv_file(file_path)
+            numeric_data = numeric_columns(data)
+            if columns is None:
+                for column_name in sorted(numeric_data):
+                    yield (file_path, column_name, numeric_data[column_name])
+            else:
+                for column_name in columns:
+                    yield (file_path, column_name,
+                           numeric_data.get(column_name))
+
+
+def numeric_columns(data):
+    """Returns the columns of the given CSV data containing numeric values.
+    Blank cells are skipped. A column with numeric values that also has
+    non-numeric cells is kept with None as its values, so that it is reported
+    rather than silently left out.
+
+    Arguments:
+        data(list): The CSV data as a list of dicts, see io.read_csv_file().
+
+    Returns:
+        dict: An association column name => list of float values, or None if
+            some of the values are not numeric.
+    """
+    if not data:
+        return {}
+
+    columns = {}
+    for column_name in data[0].keys():
+        # csv.DictReader collects cells beyond the header under None
+        if column_name is None:
+            continue
+        values = []
+        has_invalid_values = False
+        for each in data:
+            value = each.get(column_name)
+            if value is None or not value.strip():
+                continue
+            try:
+                values.append(float(value))
+            except ValueError:
+                has_invalid_values = True
+        if values:
+            columns[column_name] = None if has_invalid_values else values
+    return columns
+
+
+def evaluate_column(task):
+    """Performs the chi-squared test on a single column. The chi-squared test
+    is used if the number of items is a multiple of 10, otherwise the general
+    chi-squared test is used.
+
+    Arguments:
+        task((str, str, list)): The file path, column name and values to be
+            tested. The values are None if the column is missing or not
+            entirely numeric.
+
+    Returns:
+        dict: Holds the file, column, number of items and test performed. On
+            success it holds the chi-squared value and the p-value giving the
+            probability that the data is NOT normally distributed, otherwise
+            it holds an error message.
+    """
+    file_path, column_name, values = task
+    result = {'file': file_path, 'column': column_name}
+    if values is None:
+        result['error'] = 'Column is missing or not numeric'
+        return result
+
+    result['items'] = len(values)
+    if len(values) >= 20 and len(values) % 10 == 0:
+        result['test'] = 'chi-squared'
+        test = chi_squared.ChiSquaredTest()
+    else:
+        result['test'] = 'general chi-squared'
+        test = chi_squared.GeneralChiSquaredTest()
+
+    try:
+        result['chi_squared'], result['p_value'] = test.execute(values)
+    except (ValueError,
+            chi_squared.GeneralChiSquaredTest.TooFewItems) as error:
+        result['error'] = str(error)
+    except ZeroDivisionError:
+        result['error'] = 'Column has no variation'
+    return result
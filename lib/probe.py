@@ -6,7 +6,8 @@
 
 
     trim_to_equal_length(): Trim two lists to be of equal length.
-    collect(): Collect key values into a list from a dict.
+    group_indices(): Group the indices of list items by item.
+    column_property(): Property giving the non-blank values of a column.
     HistoricalData: Represents historical estimation data.
     NoPredictionIntervalMixin: Prediction interval mixin that does nothing.
     CorrelationMixin: Mixin that adds correlation and significance
@@ -17,6 +18,7 @@
         using historical productivity.
     EstimationMethod: Base class for all size and time estimation methods.
     ProbeEstimation: Interface for perform probe size and time estimation.
+    Estimate: Size and time estimates for a single proxy value.
     ProbeSizeA: The linear regression proxy and actual size estimation.
     ProbeSizeB: The linear regression planned and actual size estimation.
     ProbeSizeC: Simple average between planned and actual size estimation.
@@ -26,7 +28,9 @@
     ProbeTimeC2: The average planned size and actual time.
     ProbeTimeC3: The average actual size and actual time.
 """
-from lib import io
+import array
+import csv
+
 from lib import statistics
 
 
@@ -49,22 +53,58 @@ def trim_to_equal_length(x_data, y_data):
         return x_data, y_data[-len(x_data):]
 
 
-def collect(key, data):
-    """Collects all the values from the given key into a single list
-    of values.
+def group_indices(items):
+    """Groups the indices of the given items by item, ignoring None.
+
+    Arguments:
+        items(list): A list of hashable items
+
+    Returns:
+        dict: Association item => list of indices at which it appears.
+    """
+    groups = {}
+    for index, item in enumerate(items):
+        if item is not None:
+            groups.setdefault(item, []).append(index)
+    return groups
+
+
+def column_property(attribute):
+    """Returns a read-only property giving the non-blank values of a column
+    of historical data.
 
     Arguments:
-        key: The key to be collected
-        data(list): A list of dictionaries
+        attribute(str): The name of the column.
 
     Returns:
-        list: A list of values under the given key.
+        property: The column property.
     """
-    return map(float, filter(None, [each.get(key) for each in data]))
+    return property(
+        lambda self: self.get_column(attribute),
+        doc='array: The non-blank {} in row order.'.format(
+            attribute.replace('_', ' ')))
 
 
 class HistoricalData(object):
-    """Interface for storing historical data"""
+    """Interface for storing historical data. Each column is stored as an
+    array of doubles with a parallel validity mask marking blank cells, so a
+    row costs five doubles and five bytes.
+    """
+
+    # [List] Each column as a (attribute name, CSV column name) pair.
+    COLUMNS = [
+        ('planned_sizes', 'Planned A+M Size'),
+        ('proxy_sizes', 'Proxy Size Estimate'),
+        ('actual_sizes', 'Actual A+M Size'),
+        ('planned_times', 'Planned Time'),
+        ('actual_times', 'Actual Time'),
+    ]
+
+    planned_sizes = column_property('planned_sizes')
+    proxy_sizes = column_property('proxy_sizes')
+    actual_sizes = column_property('actual_sizes')
+    planned_times = column_property('planned_times')
+    actual_times = column_property('actual_times')
 
     def __init__(self,
                  planned_sizes,
@@ -72,16 +112,41 @@ class HistoricalData(object):
                  actual_sizes,
                  planned_times,
                  actual_times):
-        """Initialize."""
-        self.planned_sizes = planned_sizes
-        self.proxy_sizes = proxy_sizes
-        self.actual_sizes = actual_sizes
-        self.planned_times = planned_times
-        self.actual_times = actual_times
+        """Initialize from lists of values. Lists shorter than the longest
+        are taken to be missing their earliest values, matching the behaviour
+        of trim_to_equal_length().
+        """
+        self.num_rows = 0
+        self.values = {}
+        self.masks = {}
+        self.num_valid = {}
+        self.compacted = {}
+        self.paired = {}
+        for attribute, _ in self.COLUMNS:
+            self.values[attribute] = array.array('d')
+            self.masks[attribute] = array.array('B')
+            self.num_valid[attribute] = 0
+
+        given = {
+            'planned_sizes': planned_sizes,
+            'proxy_sizes': proxy_sizes,
+            'actual_sizes': actual_sizes,
+            'planned_times': planned_times,
+            'actual_times': actual_times,
+        }
+        num_rows = max([len(each) for each in given.values()])
+        for attribute, column in given.items():
+            padding = num_rows - len(column)
+            self.values[attribute].extend([0.0] * padding)
+            self.values[attribute].extend([float(each) for each in column])
+            self.masks[attribute].extend([0] * padding + [1] * len(column))
+            self.num_valid[attribute] = len(column)
+        self.num_rows = num_rows
 
     @classmethod
     def from_csv_file(cls, filename):
-        """Reads historical data from a CSV file.
+        """Reads historical data from a CSV file in a single pass, filling
+        every column directly. Blank cells are recorded as missing.
 
         Arguments:
             filename(str): A file name
@@ -89,17 +154,124 @@ class HistoricalData(object):
         Returns:
             HistoricalData: Historical data read from CSV file.
         """
-        data = io.read_csv_file(filename)
-        planned_sizes = collect('Planned A+M Size', data)
-        proxy_sizes = collect('Proxy Size Estimate', data)
-        actual_sizes = collect('Actual A+M Size', data)
-        planned_times = collect('Planned Time', data)
-        actual_times = collect('Actual Time', data)
-        return cls(planned_sizes=planned_sizes,
-                   proxy_sizes=proxy_sizes,
-                   actual_sizes=actual_sizes,
-                   planned_times=planned_times,
-                   actual_times=actual_times)
+        historical_data = cls([], [], [], [], [])
+        with open(filename) as csv_file:
+            reader = csv.reader(csv_file)
+            header = [each.strip() for each in next(reader, [])]
+            indices = [
+                header.index(name) if name in header else None
+                for _, name in cls.COLUMNS
+            ]
+            for row in reader:
+                historical_data.add_row([
+                    row[index] if index is not None and index < len(row)
+                    else None
+                    for index in indices
+                ])
+        return historical_data
+
+    def add_row(self, row):
+        """Append a row of historical data.
+
+        Arguments:
+            row(list): A value for each column in COLUMNS order. None or
+                blank strings mark missing values.
+        """
+        for (attribute, _), value in zip(self.COLUMNS, row):
+            if isinstance(value, basestring):
+                value = value.strip() or None
+            if value is None:
+                self.values[attribute].append(0.0)
+                self.masks[attribute].append(0)
+            else:
+                self.values[attribute].append(float(value))
+                self.masks[attribute].append(1)
+                self.num_valid[attribute] += 1
+        self.num_rows += 1
+        self.compacted.clear()
+        self.paired.clear()
+
+    def set_value(self, attribute, row_index, value):
+        """Replace a single value of historical data.
+
+        Arguments:
+            attribute(str): The name of the column.
+            row_index(int): The index of the row.
+            value(float): The new value, None marks the value as missing.
+        """
+        self.num_valid[attribute] -= self.masks[attribute][row_index]
+        if value is None:
+            self.values[attribute][row_index] = 0.0
+            self.masks[attribute][row_index] = 0
+        else:
+            self.values[attribute][row_index] = float(value)
+            self.masks[attribute][row_index] = 1
+            self.num_valid[attribute] += 1
+        self.compacted.pop(attribute, None)
+        self.paired.clear()
+
+    def get_column(self, attribute):
+        """Returns the non-blank values of the given column in row order. The
+        underlying array is returned without copying if no cells are blank.
+
+        Arguments:
+            attribute(str): The name of the column.
+
+        Returns:
+            array: The non-blank values.
+        """
+        if attribute not in self.compacted:
+            values = self.values[attribute]
+            if self.num_valid[attribute] == self.num_rows:
+                self.compacted[attribute] = values
+            else:
+                mask = self.masks[attribute]
+                self.compacted[attribute] = array.array('d', [
+                    value for value, is_valid in zip(values, mask)
+                    if is_valid
+                ])
+        return self.compacted[attribute]
+
+    def pairs(self, x_column, y_column):
+        """Returns the values of two columns for only those rows in which
+        both values are present, so that the values remain aligned by row.
+        The underlying arrays are returned without copying if neither column
+        has blank cells, otherwise the paired arrays are built once and
+        reused until the data changes.
+
+        Example:
+            >>> x, y = data.pairs('Proxy Size Estimate', 'Actual Time')
+            >>> x, y = data.pairs('proxy_sizes', 'actual_times')
+
+        Arguments:
+            x_column(str): Attribute or CSV name of the first column.
+            y_column(str): Attribute or CSV name of the second column.
+
+        Returns:
+            tuple: Arrays of the paired first and second column values.
+        """
+        names = dict((name, attribute) for attribute, name in self.COLUMNS)
+        x_column = names.get(x_column, x_column)
+        y_column = names.get(y_column, y_column)
+
+        key = (x_column, y_column)
+        if key not in self.paired:
+            x_values = self.values[x_column]
+            y_values = self.values[y_column]
+            if (self.num_valid[x_column] == self.num_rows and
+                    self.num_valid[y_column] == self.num_rows):
+                self.paired[key] = (x_values, y_values)
+            else:
+                x_mask = self.masks[x_column]
+                y_mask = self.masks[y_column]
+                rows = [
+                    index for index in range(self.num_rows)
+                    if x_mask[index] and y_mask[index]
+                ]
+                self.paired[key] = (
+                    array.array('d', [x_values[index] for index in rows]),
+                    array.array('d', [y_values[index] for index in rows]))
+        return self.paired[key]
 
 
 class CorrelationMixin(object):
@@ -111,15 +283,20 @@ class CorrelationMixin(object):
         Returns:
             float: The correlation (R^2) value.
         """
-        return statistics.correlation(self.x_values, self.y_values)**2
+        return self.get_cached(
+            'correlation', lambda: self.get_summary().get_r_squared())
 
     def get_significance(self):
-        """Returns the correlation significance.
+        """Returns the correlation significance. A perfect correlation has
+        no chance of being random, so its significance is zero.
 
         Returns:
             float: The percent chance that values were generated randomly.
         """
-        return statistics.significance(self.x_values, self.y_values)
+        if self.get_correlation() >= 1:
+            return 0.0
+        return self.get_cached(
+            'significance', lambda: self.get_summary().get_significance())
 
 
 class NoPredictionIntervalMixin(object):
@@ -137,6 +314,9 @@ class NoPredictionIntervalMixin(object):
     def get_interval_percent(self):
         return "N/A"
 
+    def get_prediction_intervals(self, proxy_values):
+        return [("N/A", "N/A")] * len(proxy_values)
+
 
 class PredictionIntervalRangeMixin(object):
     """Mixin that produces prediction interval ranges."""
@@ -150,8 +330,7 @@ class PredictionIntervalRangeMixin(object):
         Returns:
             float: The prediction interval range.
         """
-        return statistics.prediction_range(
-            estimated_value, 0.85, self.x_values, self.y_values)
+        return self.get_summary().get_prediction_range(estimated_value, 0.85)
 
     def get_upi(self, estimated_value):
         """Return the upper prediction interval (UPI).
@@ -187,6 +366,26 @@ class PredictionIntervalRangeMixin(object):
         """
         return "70%"
 
+    def get_prediction_intervals(self, proxy_values):
+        """Return the upper and lower prediction intervals for each of the
+        given proxy values, fitting the regression only once.
+
+        Arguments:
+            proxy_values(list): The proxy size estimates.
+
+        Returns:
+            list: A (UPI, LPI) tuple for each proxy value.
+        """
+        summary = self.get_summary()
+        regression = self.get_regression()
+        results = []
+        for proxy_value in proxy_values:
+            predicted_value = regression.estimate(proxy_value)
+            interval_range = summary.get_prediction_range(proxy_value, 0.85)
+            results.append((predicted_value + interval_range,
+                            predicted_value - interval_range))
+        return results
+
 
 class PredictionIntervalProductivityMixin(object):
     """Prediction interval for time only, using historical productivity"""
@@ -227,31 +426,97 @@ class PredictionIntervalProductivityMixin(object):
     def get_interval_percent(self):
         return "N/A"
 
+    def get_prediction_intervals(self, proxy_values):
+        """Return the upper and lower prediction intervals for each of the
+        given proxy values using historical productivity.
+
+        Arguments:
+            proxy_values(list): The proxy size estimates.
+
+        Returns:
+            list: A (UPI, LPI) tuple for each proxy value.
+        """
+        productivities = self.get_productivities()
+        if not productivities:
+            return [("N/A", "N/A")] * len(proxy_values)
+        min_productivity = min(productivities)
+        max_productivity = max(productivities)
+        regression = self.get_regression()
+        return [
+            ((predicted_value / min_productivity) * 60.0,
+             (predicted_value / max_productivity) * 60.0)
+            for predicted_value in regression.estimate_many(proxy_values)
+        ]
+
     def get_productivities(self):
         """Return historical productivity data.
 
         Returns:
             list: List of productivity in LOC / Hour.
         """
-        actual_sizes = self.historical_data.actual_sizes
-        actual_times = self.historical_data.actual_times
-        return [
+        actual_sizes, actual_times = self.historical_data.pairs(
+            'actual_sizes', 'actual_times')
+        return self.get_cached('productivities', lambda: [
             (size / float(time)) * 60
             for size, time in zip(actual_sizes, actual_times)
-        ]
+        ])
 
 
 class EstimationMethod(CorrelationMixin):
     """Base class for all PROBE estimation methods"""
 
+    # [Float] Largest fraction of an estimate that beta0 may make up,
+    # None = no limit.
+    MAX_BETA0_FRACTION = None
+
+    # [String] HistoricalData attribute holding the x values.
+    X_ATTRIBUTE = None
+
+    # [String] HistoricalData attribute holding the y values.
+    Y_ATTRIBUTE = None
+
     def __init__(self, historical_data):
         """Initialize.
 
         Arguments:
             historical_data(HistoricalData): Historical data for estimation.
         """
-        self.historical_data = historical_data
         self.name = None
+        self.historical_data = historical_data
+
+    @property
+    def historical_data(self):
+        """HistoricalData: Historical data for estimation. Assigning new data
+        discards every cached fit."""
+        return self._historical_data
+
+    @historical_data.setter
+    def historical_data(self, historical_data):
+        self._historical_data = historical_data
+        self.invalidate()
+
+    def invalidate(self):
+        """Discard every cached fit and reselect the x and y values. Must be
+        called after the historical data is modified in place.
+        """
+        self.cache = {}
+        self.x_values, self.y_values = self.historical_data.pairs(
+            self.X_ATTRIBUTE, self.Y_ATTRIBUTE)
+
+    def get_cached(self, key, compute):
+        """Return the value cached under the given key, computing it on first
+        use. Cached values live until the next call to invalidate().
+
+        Arguments:
+            key(hashable): The cache key.
+            compute(callable): Function of no arguments returning the value.
+
+        Returns:
+            object: The cached value.
+        """
+        if key not in self.cache:
+            self.cache[key] = compute()
+        return self.cache[key]
 
     def get_name(self):
         """Return the name of this estimation method.
@@ -261,6 +526,83 @@ class EstimationMethod(CorrelationMixin):
         """
         return self.name
 
+    def get_summary(self):
+        """Return the regression summary of this method's x and y values.
+
+        Returns:
+            RegressionSummary: Summary statistics computed in one data scan.
+        """
+        return self.get_cached(
+            'summary',
+            lambda: statistics.RegressionSummary.from_data(
+                self.x_values, self.y_values))
+
+    def get_regression(self):
+        """Returns the linear regression for this estimation method, fitting
+        it on first use.
+
+        Returns:
+            LinearRegression: A linear regression
+        """
+        return self.get_cached('regression', self.compute_regression)
+
+    def is_applicable(self):
+        """Indicates whether or not the historical data allows this method to
+        be used, independent of any particular proxy value.
+
+        Returns:
+            bool: True if this method can be used, False otherwise.
+        """
+        return True
+
+    def accepts_proxy_values(self, proxy_values):
+        """Indicates, for each of the given proxy values, whether or not this
+        method's estimate for it is acceptable. The regression is fit once for
+        the whole list of values.
+
+        Arguments:
+            proxy_values(list): The proxy size estimates
+
+        Returns:
+            list: A bool for each proxy value, True if acceptable.
+        """
+        if self.MAX_BETA0_FRACTION is None:
+            return [True] * len(proxy_values)
+        regression = self.get_regression()
+        limit = self.MAX_BETA0_FRACTION
+        return [
+            not regression.beta0 > limit * estimate
+            for estimate in regression.estimate_many(proxy_values)
+        ]
+
+    @classmethod
+    def satisfies_preconditions(cls, historical_data, proxy_value):
+        """Indicates whether or not the historical data allows this method to
+        be used for the given proxy value.
+
+        Arguments:
+            historical_data(HistoricalData): The historical estimation data
+            proxy_value(float): The proxy size estimate
+
+        Returns:
+            bool: True if this method can be used, False otherwise.
+        """
+        return cls(historical_data).is_usable_for(proxy_value)
+
+    def is_usable_for(self, proxy_value):
+        """Indicates whether or not this method can be used for the given
+        proxy value.
+
+        Arguments:
+            proxy_value(float): The proxy size estimate
+
+        Returns:
+            bool: True if this method can be used, False otherwise.
+        """
+        if not self.is_applicable():
+            return False
+        return self.accepts_proxy_values([proxy_value])[0]
+
 
 class ProbeEstimation(object):
     """Interface for performing PROBE size and time estimations"""
@@ -290,9 +632,9 @@ class ProbeEstimation(object):
             EstimationMethod: The appropriate estimation method.
         """
         for size_method in self.size_estimation_methods:
-            if size_method.satisfies_preconditions(
-                    self.historical_data, proxy_value):
-                return size_method(self.historical_data)
+            method = size_method(self.historical_data)
+            if method.is_usable_for(proxy_value):
+                return method
 
     def get_time_method(self, proxy_value):
         """Return the appropriate time estimation method for the given proxy
@@ -305,63 +647,152 @@ class ProbeEstimation(object):
             EstimationMethod: The appropriate estimation method.
         """
         for time_method in self.time_estimation_methods:
-            if time_method.satisfies_preconditions(
-                    self.historical_data, proxy_value):
-                return time_method(self.historical_data)
+            method = time_method(self.historical_data)
+            if method.is_usable_for(proxy_value):
+                return method
+
+    def estimate_many(self, proxy_values):
+        """Perform size and time estimation for every one of the given proxy
+        values. Each candidate method is fit at most once for the whole batch.
+
+        Arguments:
+            proxy_values(list): The proxy size estimates
+
+        Returns:
+            list: An Estimate for each proxy value, in the order given.
+        """
+        proxy_values = list(proxy_values)
+        size_estimates = self.apply_methods(
+            self.choose_methods(self.size_estimation_methods, proxy_values),
+            proxy_values)
+        time_estimates = self.apply_methods(
+            self.choose_methods(self.time_estimation_methods, proxy_values),
+            proxy_values)
+
+        results = []
+        for proxy_value, size_estimate, time_estimate in zip(
+                proxy_values, size_estimates, time_estimates):
+            estimate = Estimate(proxy_value)
+            (estimate.size_method, estimate.size_projection,
+             estimate.size_upi, estimate.size_lpi) = size_estimate
+            (estimate.time_method, estimate.time_projection,
+             estimate.time_upi, estimate.time_lpi) = time_estimate
+            results.append(estimate)
+        return results
+
+    def apply_methods(self, methods, proxy_values):
+        """Compute the projection and prediction interval for each proxy value
+        using the method chosen for it. Each distinct method is evaluated once
+        for all of the values it was chosen for.
+
+        Arguments:
+            methods(list): An EstimationMethod, or None, for each proxy value.
+            proxy_values(list): The proxy size estimates
+
+        Returns:
+            list: A (method name, projection, UPI, LPI) tuple for each proxy
+                value, containing only None where no method was chosen.
+        """
+        results = [(None, None, None, None)] * len(proxy_values)
+        for method, indices in group_indices(methods).items():
+            values = [proxy_values[i] for i in indices]
+            projections = method.get_regression().estimate_many(values)
+            intervals = method.get_prediction_intervals(values)
+            for i, projection, (upi, lpi) in zip(
+                    indices, projections, intervals):
+                results[i] = (method.get_name(), projection, upi, lpi)
+        return results
+
+    def choose_methods(self, method_classes, proxy_values):
+        """Return the most desirable applicable method for each proxy value.
+
+        Arguments:
+            method_classes(list): Estimation method classes in order of
+                desirability.
+            proxy_values(list): The proxy size estimates
+
+        Returns:
+            list: An EstimationMethod for each proxy value, or None if no
+                method can be used for it.
+        """
+        choices = [None] * len(proxy_values)
+        for method_class in method_classes:
+            pending = [i for i, choice in enumerate(choices) if choice is None]
+            if not pending:
+                break
+            method = method_class(self.historical_data)
+            if not method.is_applicable():
+                continue
+            accepted = method.accepts_proxy_values(
+                [proxy_values[i] for i in pending])
+            for i, is_accepted in zip(pending, accepted):
+                if is_accepted:
+                    choices[i] = method
+        return choices
+
+
+class Estimate(object):
+    """The size and time estimates for a single proxy value. Methods and
+    values are None if no estimation method could be used."""
+
+    def __init__(self, proxy_value):
+        """Initialize.
+
+        Arguments:
+            proxy_value(float): The proxy size estimate
+        """
+        self.proxy_value = proxy_value
+        self.size_method = None
+        self.size_projection = None
+        self.size_upi = None
+        self.size_lpi = None
+        self.time_method = None
+        self.time_projection = None
+        self.time_upi = None
+        self.time_lpi = None
 
 
 class ProbeSizeA(EstimationMethod, PredictionIntervalRangeMixin):
     """The proxy size estimate linear regression method for size."""
 
+    # [Float] Largest fraction of an estimate that beta0 may make up.
+    MAX_BETA0_FRACTION = 0.25
+
+    X_ATTRIBUTE = 'proxy_sizes'
+    Y_ATTRIBUTE = 'actual_sizes'
+
     def __init__(self, historical_data):
         super(ProbeSizeA, self).__init__(historical_data)
         self.name = 'A'
-        self.x_values, self.y_values = trim_to_equal_length(
-            self.historical_data.proxy_sizes,
-            self.historical_data.actual_sizes)
 
-    def get_regression(self):
-        """Returns the linear regression for this estimation method.
+    def compute_regression(self):
+        """Fits the linear regression for this estimation method.
 
         Returns:
             LinearRegression: A linear regression
         """
-        return statistics.LinearRegression(
-            statistics.beta_0(self.x_values, self.y_values),
-            statistics.beta_1(self.x_values, self.y_values)
-        )
+        return self.get_summary().get_regression()
 
-    @classmethod
-    def satisfies_preconditions(cls, historical_data, proxy_value):
+    def is_applicable(self):
         """Indicates whether or not the historical data allows this method to
-        be used for the given proxy value.
-
-        Arguments:
-            historical_data(HistoricalData): The historical estimation data
-            proxy_value(float): The proxy size estimate
+        be used, independent of any particular proxy value.
 
         Returns:
             bool: True if this method can be used, False otherwise.
         """
-        proxy_sizes, actual_sizes = trim_to_equal_length(
-            historical_data.proxy_sizes, historical_data.actual_sizes
-        )
+        summary = self.get_summary()
         # Too few data points
-        if len(actual_sizes) < 3:
-            return False
-        regression = cls(historical_data).get_regression()
-        estimated_size = regression.estimate(proxy_value)
-        # Beta0 is not close to zero
-        if regression.beta0 > 0.25 * estimated_size:
+        if summary.get_num_items() < 3:
             return False
+        regression = self.get_regression()
         # Beta1 is out of bounds
         if regression.beta1 < 0.5 or regression.beta1 > 2.0:
             return False
         # Weakly correlated
-        if statistics.correlation(proxy_sizes, actual_sizes)**2 < 0.5:
+        if self.get_correlation() < 0.5:
             return False
         # Weak statistical significance
-        if statistics.significance(proxy_sizes, actual_sizes) > 0.05:
+        if self.get_significance() > 0.05:
             return False
         return True
 
@@ -369,50 +800,40 @@ class ProbeSizeA(EstimationMethod, PredictionIntervalRangeMixin):
 class ProbeSizeB(EstimationMethod, PredictionIntervalRangeMixin):
     """Estimation method using linear regression on planned and actual size"""
 
+    # [Float] Largest fraction of an estimate that beta0 may make up.
+    MAX_BETA0_FRACTION = 0.25
+
+    X_ATTRIBUTE = 'planned_sizes'
+    Y_ATTRIBUTE = 'actual_sizes'
+
     def __init__(self, historical_data):
         super(ProbeSizeB, self).__init__(historical_data)
         self.name = 'B'
-        self.x_values, self.y_values = trim_to_equal_length(
-            self.historical_data.planned_sizes,
-            self.historical_data.actual_sizes)
 
-    def get_regression(self):
-        """Returns the linear regression for this estimation method.
+    def compute_regression(self):
+        """Fits the linear regression for this estimation method.
 
         Returns:
             LinearRegression: A linear regression
         """
-        return statistics.LinearRegression(
-            statistics.beta_0(self.x_values, self.y_values),
-            statistics.beta_1(self.x_values, self.y_values)
-        )
+        return self.get_summary().get_regression()
 
-    @classmethod
-    def satisfies_preconditions(cls, historical_data, proxy_value):
+    def is_applicable(self):
         """Indicates whether or not the historical data allows this method to
-        be used for the given proxy value.
-
-        Arguments:
-            historical_data(HistoricalData): The historical estimation data
-            proxy_value(float): The proxy size estimate
+        be used, independent of any particular proxy value.
 
         Returns:
             bool: True if this method can be used, False otherwise.
         """
-        planned_sizes, actual_sizes = trim_to_equal_length(
-            historical_data.planned_sizes, historical_data.actual_sizes
-        )
-        if len(actual_sizes) < 3:
-            return False
-        regression = cls(historical_data).get_regression()
-        estimated_size = regression.estimate(proxy_value)
-        if regression.beta0 > 0.25 * estimated_size:
+        summary = self.get_summary()
+        if summary.get_num_items() < 3:
             return False
+        regression = self.get_regression()
         if regression.beta1 < 0.5 or regression.beta1 > 2.0:
             return False
-        if statistics.correlation(planned_sizes, actual_sizes)**2 < 0.5:
+        if self.get_correlation() < 0.5:
             return False
-        if statistics.significance(planned_sizes, actual_sizes) > 0.05:
+        if self.get_significance() > 0.05:
             return False
         return True
 
@@ -421,16 +842,15 @@ class ProbeSizeC(EstimationMethod, NoPredictionIntervalMixin):
     """Estimation method using historical average between planned and actual
     size."""
 
+    X_ATTRIBUTE = 'actual_sizes'
+    Y_ATTRIBUTE = 'planned_sizes'
+
     def __init__(self, historical_data):
         super(ProbeSizeC, self).__init__(historical_data)
         self.name = 'C'
-        self.x_values, self.y_values = trim_to_equal_length(
-            self.historical_data.actual_sizes,
-            self.historical_data.planned_sizes
-        )
 
-    def get_regression(self):
-        """Returns the linear regression for this estimation method.
+    def compute_regression(self):
+        """Fits the linear regression for this estimation method.
 
         Returns:
             LinearRegression: A linear regression
@@ -438,81 +858,62 @@ class ProbeSizeC(EstimationMethod, NoPredictionIntervalMixin):
         average = (sum(self.x_values) / float(sum(self.y_values)))
         return statistics.LinearRegression(0, average)
 
-    @classmethod
-    def satisfies_preconditions(cls, historical_data, proxy_value):
+    def is_applicable(self):
         """Indicates whether or not the historical data allows this method to
-        be used for the given proxy value.
-
-        Arguments:
-            historical_data(HistoricalData): The historical estimation data
-            proxy_value(float): The proxy size estimate
+        be used, independent of any particular proxy value.
 
         Returns:
             bool: True if this method can be used, False otherwise.
         """
-        if not historical_data.actual_sizes:
-            return False
-        if not historical_data.planned_sizes:
-            return False
-        if (len(historical_data.planned_sizes) !=
-                len(historical_data.actual_sizes)):
-            return False
-        return True
+        # Rows missing either size are skipped rather than disqualifying
+        x_values, _ = self.historical_data.pairs(
+            'planned_sizes', 'actual_sizes')
+        return len(x_values) > 0
 
 
 class ProbeTimeA(EstimationMethod, PredictionIntervalRangeMixin):
     """The proxy size estimate linear regression method for time."""
 
+    # [Float] Largest fraction of an estimate that beta0 may make up.
+    MAX_BETA0_FRACTION = 0.25
+
+    X_ATTRIBUTE = 'proxy_sizes'
+    Y_ATTRIBUTE = 'actual_times'
+
     def __init__(self, historical_data):
         super(ProbeTimeA, self).__init__(historical_data)
         self.name = 'A'
-        self.x_values, self.y_values = trim_to_equal_length(
-            self.historical_data.proxy_sizes,
-            self.historical_data.actual_times
-        )
 
-    def get_regression(self):
-        """Returns the linear regression for this estimation method.
+    def compute_regression(self):
+        """Fits the linear regression for this estimation method.
 
         Returns:
             LinearRegression: A linear regression
         """
-        return statistics.LinearRegression(
-            statistics.beta_0(self.x_values, self.y_values),
-            statistics.beta_1(self.x_values, self.y_values))
+        return self.get_summary().get_regression()
 
-    @classmethod
-    def satisfies_preconditions(cls, historical_data, proxy_value):
+    def is_applicable(self):
         """Indicates whether or not the historical data allows this method to
-        be used for the given proxy value.
-
-        Arguments:
-            historical_data(HistoricalData): The historical estimation data
-            proxy_value(float): The proxy size estimate
+        be used, independent of any particular proxy value.
 
         Returns:
             bool: True if this method can be used, False otherwise.
         """
-        proxy_sizes, actual_times = trim_to_equal_length(
-            historical_data.proxy_sizes, historical_data.actual_times)
-        if len(proxy_sizes) < 3:
-            return False
-        regression = cls(historical_data).get_regression()
-        # Beta0 should be small
-        expected_time = regression.estimate(proxy_value)
-        if regression.beta0 > 0.25 * expected_time:
+        summary = self.get_summary()
+        if summary.get_num_items() < 3:
             return False
+        regression = self.get_regression()
         # Beta1 one should be close to historical productivity
-        productivity = 1.0 / (float(sum(proxy_sizes)) / sum(actual_times))
+        productivity = summary.sums.sum_y / summary.sums.sum_x
         beta1_range = 0.5 * productivity
         if (regression.beta1 < (productivity - beta1_range) or
                 regression.beta1 > (productivity + beta1_range)):
             return False
         # Correlation should be strong
-        if statistics.correlation(proxy_sizes, actual_times)**2 < 0.5:
+        if self.get_correlation() < 0.5:
             return False
         # Correlation should be significant
-        if statistics.significance(proxy_sizes, actual_times) > 0.05:
+        if self.get_significance() > 0.05:
             return False
         return True
 
@@ -520,52 +921,43 @@ class ProbeTimeA(EstimationMethod, PredictionIntervalRangeMixin):
 class ProbeTimeB(EstimationMethod, PredictionIntervalRangeMixin):
     """The planned size estimate linear regression method for time."""
 
+    # [Float] Largest fraction of an estimate that beta0 may make up.
+    MAX_BETA0_FRACTION = 0.25
+
+    X_ATTRIBUTE = 'planned_sizes'
+    Y_ATTRIBUTE = 'actual_times'
+
     def __init__(self, historical_data):
         super(ProbeTimeB, self).__init__(historical_data)
         self.name = 'B'
-        self.x_values, self.y_values = trim_to_equal_length(
-            self.historical_data.planned_sizes,
-            self.historical_data.actual_times
-        )
 
-    def get_regression(self):
-        """Returns the linear regression for this estimation method.
+    def compute_regression(self):
+        """Fits the linear regression for this estimation method.
 
         Returns:
             LinearRegression: A linear regression
         """
-        return statistics.LinearRegression(
-            statistics.beta_0(self.x_values, self.y_values),
-            statistics.beta_1(self.x_values, self.y_values))
+        return self.get_summary().get_regression()
 
-    @classmethod
-    def satisfies_preconditions(cls, historical_data, proxy_value):
+    def is_applicable(self):
         """Indicates whether or not the historical data allows this method to
-        be used for the given proxy value.
-
-        Arguments:
-            historical_data(HistoricalData): The historical estimation data
-            proxy_value(float): The proxy size estimate
+        be used, independent of any particular proxy value.
 
         Returns:
             bool: True if this method can be used, False otherwise.
         """
-        planned_sizes, actual_times = trim_to_equal_length(
-            historical_data.proxy_sizes, historical_data.actual_times)
-        if len(planned_sizes) < 3:
-            return False
-        regression = cls(historical_data).get_regression()
-        expected_time = regression.estimate(proxy_value)
-        if regression.beta0 > 0.25 * expected_time:
+        summary = self.get_summary()
+        if summary.get_num_items() < 3:
             return False
-        productivity = 1.0 / (sum(planned_sizes) / sum(actual_times))
+        regression = self.get_regression()
+        productivity = summary.sums.sum_y / summary.sums.sum_x
         beta1_range = 0.5 * productivity
         if (regression.beta1 < (productivity - beta1_range) or
-                regression.beta > (productivity + beta1_range)):
+                regression.beta1 > (productivity + beta1_range)):
             return False
-        if statistics.correlation(planned_sizes, actual_times)**2 < 0.5:
+        if self.get_correlation() < 0.5:
             return False
-        if statistics.significance(planned_sizes, actual_times) > 0.05:
+        if self.get_significance() > 0.05:
             return False
         return True
 
@@ -573,16 +965,15 @@ class ProbeTimeB(EstimationMethod, PredictionIntervalRangeMixin):
 class ProbeTimeC1(EstimationMethod, PredictionIntervalProductivityMixin):
     """Estimation method using average of proxy sizes and actual times"""
 
+    X_ATTRIBUTE = 'actual_times'
+    Y_ATTRIBUTE = 'proxy_sizes'
+
     def __init__(self, historical_data):
         super(ProbeTimeC1, self).__init__(historical_data)
         self.name = 'C1'
-        self.x_values, self.y_values = trim_to_equal_length(
-            self.historical_data.actual_times,
-            self.historical_data.proxy_sizes
-        )
 
-    def get_regression(self):
-        """Returns the linear regression for this estimation method.
+    def compute_regression(self):
+        """Fits the linear regression for this estimation method.
 
         Returns:
             LinearRegression: A linear regression
@@ -590,19 +981,15 @@ class ProbeTimeC1(EstimationMethod, PredictionIntervalProductivityMixin):
         return statistics.LinearRegression(
             0, sum(self.x_values) / float(sum(self.y_values)))
 
-    @classmethod
-    def satisfies_preconditions(cls, historical_data, proxy_value):
+    def is_applicable(self):
         """Indicates whether or not the historical data allows this method to
-        be used for the given proxy value.
-
-        Arguments:
-            historical_data(HistoricalData): The historical estimation data
-            proxy_value(float): The proxy size estimate
+        be used, independent of any particular proxy value.
 
         Returns:
             bool: True if this method can be used, False otherwise.
         """
-        if not historical_data.proxy_sizes or not historical_data.actual_times:
+        if (not self.historical_data.proxy_sizes or
+                not self.historical_data.actual_times):
             return False
         return True
 
@@ -610,16 +997,15 @@ class ProbeTimeC1(EstimationMethod, PredictionIntervalProductivityMixin):
 class ProbeTimeC2(EstimationMethod, PredictionIntervalProductivityMixin):
     """Estimation method using average of planned sizes and actual times"""
 
+    X_ATTRIBUTE = 'actual_times'
+    Y_ATTRIBUTE = 'planned_sizes'
+
     def __init__(self, historical_data):
         super(ProbeTimeC2, self).__init__(historical_data)
         self.name = 'C2'
-        self.x_values, self.y_values = trim_to_equal_length(
-            self.historical_data.actual_times,
-            self.historical_data.planned_sizes
-        )
 
-    def get_regression(self):
-        """Returns the linear regression for this estimation method.
+    def compute_regression(self):
+        """Fits the linear regression for this estimation method.
 
         Returns:
             LinearRegression: A linear regression
@@ -627,20 +1013,15 @@ class ProbeTimeC2(EstimationMethod, PredictionIntervalProductivityMixin):
         return statistics.LinearRegression(
             0, sum(self.x_values) / float(sum(self.y_values)))
 
-    @classmethod
-    def satisfies_preconditions(cls, historical_data, proxy_value):
+    def is_applicable(self):
         """Indicates whether or not the historical data allows this method to
-        be used for the given proxy value.
-
-        Arguments:
-            historical_data(HistoricalData): The historical estimation data
-            proxy_value(float): The proxy size estimate
+        be used, independent of any particular proxy value.
 
         Returns:
             bool: True if this method can be used, False otherwise.
         """
-        if (not historical_data.planned_sizes or
-                not historical_data.actual_times):
+        if (not self.historical_data.planned_sizes or
+                not self.historical_data.actual_times):
             return False
         return True
 
@@ -648,16 +1029,15 @@ class ProbeTimeC2(EstimationMethod, PredictionIntervalProductivityMixin):
 class ProbeTimeC3(EstimationMethod, PredictionIntervalProductivityMixin):
     """Estimation method using average of actual sizes and actual times"""
 
+    X_ATTRIBUTE = 'actual_times'
+    Y_ATTRIBUTE = 'actual_sizes'
+
     def __init__(self, historical_data):
         super(ProbeTimeC3, self).__init__(historical_data)
         self.name = 'C3'
-        self.x_values, self.y_values = trim_to_equal_length(
-            self.historical_data.actual_times,
-            self.historical_data.actual_sizes
-        )
 
-    def get_regression(self):
-        """Returns the linear regression for this estimation method.
+    def compute_regression(self):
+        """Fits the linear regression for this estimation method.
 
         Returns:
             LinearRegression: A linear regression
@@ -665,19 +1045,14 @@ class ProbeTimeC3(EstimationMethod, PredictionIntervalProductivityMixin):
         return statistics.LinearRegression(
             0, sum(self.x_values) / float(sum(self.y_values)))
 
-    @classmethod
-    def satisfies_preconditions(cls, historical_data, proxy_value):
+    def is_applicable(self):
         """Indicates whether or not the historical data allows this method to
-        be used for the given proxy value.
-
-        Arguments:
-            historical_data(HistoricalData): The historical estimation data
-            proxy_value(float): The proxy size estimate
+        be used, independent of any particular proxy value.
 
         Returns:
             bool: True if this method can be used, False otherwise.
         """
-        if (not historical_data.actual_sizes or
-                not historical_data.actual_times):
+        if (not self.historical_data.actual_sizes or
+                not self.historical_data.actual_times):
             return False
         return True
@@ -18,6 +18,8 @@
         values.
     remove_outliers(): Returns lists of values with outliers removed.
     size_ranges(): Computes log-normal size ranges for a given set of data.
+    regression_sums(): Computes the sufficient statistics for a linear
+        regression in a single pass.
     beta_0(): Returns the beta0 linear regression parameter
     beta_1(): Returns the beta1 linear regression parameter
     beta_0_warnings(): Returns warning messages for beta_0 value.
@@ -26,6 +28,14 @@
         distribution at a given x value.
     make_t_distribution(): Construct a t-distribution function with the given
         number of degrees of freedom.
+    t_cdf(): Returns the t-distribution cumulative distribution, optionally by
+        numerical integration.
+    t_ppf(): Returns the t-distribution quantile, optionally by numerical
+        integration.
+    normal_ppf(): Returns the normal distribution quantile, optionally by
+        numerical integration.
+    normal_ppf_many(): Returns the normal distribution quantiles of many
+        probabilities, optionally by numerical integration.
     variance_around_regression(): Computes the variance around the regression
         of the given values.
     standard_deviation_around_regression(): Computes the standard deviation
@@ -35,12 +45,29 @@
     correlation(): Computes the correlation between two data sets.
     significance(): Returns the correlation significance of the given data
         sets.
+    RunningMoments: Single-pass accumulator of count, mean and central
+        moments.
+    RegressionSums: Sufficient statistics for a linear regression.
+    RegressionSummary: Regression parameters, correlation, significance and
+        prediction ranges derived from one pass over the data.
+    OnlineLinearRegression: Regression summary that can be updated one
+        observation at a time.
     LinearRegression: Represents a linear regression.
 """
 import math
 
+from lib import distributions
 from lib import integration
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# [Boolean] Whether regression sums are computed with the NumPy backend.
+USE_NUMPY = numpy is not None
+
 
 def mean(iterable):
     """Computes the mean of the numerical values in an iterable.
@@ -54,21 +81,12 @@ def mean(iterable):
     Raises:
         RuntimeError: If no values are given
     """
-    total = 0
-    num_items = 0
-
-    for each in iterable:
-        total += float(each)
-        num_items += 1
-
-    if num_items == 0:
-        raise RuntimeError('No values given to mean')
-
-    return total / num_items
+    return RunningMoments.from_iterable(iterable).get_mean()
 
 
 def standard_deviation(iterable):
     """Computes the standard deviation for an iterable of numerical values.
+    The values are only iterated once, so generators may be given.
 
     Arguments:
         iterable(iterable): An iterable containing numerical values.
@@ -79,18 +97,7 @@ def standard_deviation(iterable):
     Raises:
         RuntimeError: If any less than 2 values are given.
     """
-    total = 0
-    num_items = 0
-    average = mean(iterable)
-
-    for each in iterable:
-        total += (float(each) - average)**2
-        num_items += 1
-
-    if num_items < 2:
-        raise RuntimeError('Too few values given to standard deviation')
-
-    return math.sqrt(total / (num_items - 1))
+    return RunningMoments.from_iterable(iterable).get_standard_deviation()
 
 
 def median(data):
@@ -236,15 +243,15 @@ def size_ranges(data):
     """Computes size ranges characterizing given data set.
 
     Arguments:
-        data(list): A list of real numbered values
+        data(iterable): An iterable of real numbered values
 
     Returns:
         list: A list containing size ranges characterizing data organized as
             [Very Small, Small, Medium, Large, Very Large]
     """
-    log_normal_data = [math.log(each) for each in data]
-    log_avg = mean(log_normal_data)
-    std_dev = standard_deviation(log_normal_data)
+    moments = RunningMoments.from_iterable(math.log(each) for each in data)
+    log_avg = moments.get_mean()
+    std_dev = moments.get_standard_deviation()
     log_results = [
         log_avg - 2 * std_dev,
         log_avg - std_dev,
@@ -254,8 +261,44 @@ def size_ranges(data):
     return [math.exp(each) for each in log_results]
 
 
+def regression_sums(x_data, y_data):
+    """Computes the means of two sets of related data and the sums of squares
+    and products of their deviations from the means. When NumPy is installed
+    the sums are computed with vectorized operations, so lists, array.array
+    and NumPy buffers are all accepted.
+
+    Arguments:
+        x_data(list): A list of values
+        y_data(list): A list of values
+
+    Returns:
+        RegressionSums: The sufficient statistics for the data.
+    """
+    if USE_NUMPY:
+        x_array = numpy.asarray(x_data, dtype=float)
+        y_array = numpy.asarray(y_data, dtype=float)
+        if len(x_array) == 0:
+            return RegressionSums()
+        mean_x = x_array.mean()
+        mean_y = y_array.mean()
+        x_deviations = x_array - mean_x
+        y_deviations = y_array - mean_y
+        return RegressionSums(
+            num_items=len(x_array),
+            mean_x=float(mean_x),
+            mean_y=float(mean_y),
+            centered_xx=float(numpy.dot(x_deviations, x_deviations)),
+            centered_yy=float(numpy.dot(y_deviations, y_deviations)),
+            centered_xy=float(numpy.dot(x_deviations, y_deviations)))
+
+    sums = RegressionSums()
+    for x, y in zip(x_data, y_data):
+        sums.add(x, y)
+    return sums
+
+
 def beta_1(x_data, y_data):
-    """Calculate the beta_0 linear regression parameter for two sets of related
+    """Calculate the beta_1 linear regression parameter for two sets of related
     data.
 
     Arguments:
@@ -263,21 +306,14 @@ def beta_1(x_data, y_data):
         y_data(list): A list of values
 
     Returns:
-        float: The beta_0 linear regression parameter
+        float: The beta_1 linear regression parameter
 
     Raises:
         RuntimeError: If the data lists are of unequal length
     """
     if len(x_data) != len(y_data):
         raise RuntimeError('X and Y data do not have same number of items')
-    x_avg = mean(x_data)
-    y_avg = mean(y_data)
-    n = len(x_data)
-    dividend = sum([x * y for x, y in zip(x_data, y_data)])
-    dividend -= n * x_avg * y_avg
-    divisor = sum([x**2 for x in x_data])
-    divisor -= n * (x_avg)**2
-    return dividend / float(divisor)
+    return RegressionSummary.from_data(x_data, y_data).get_beta_1()
 
 
 def beta_0(x_data, y_data):
@@ -296,9 +332,7 @@ def beta_0(x_data, y_data):
     """
     if len(x_data) != len(y_data):
         raise RuntimeError('X and Y data do not have same number of items')
-    x_avg = mean(x_data)
-    y_avg = mean(y_data)
-    return y_avg - beta_1(x_data, y_data) * x_avg
+    return RegressionSummary.from_data(x_data, y_data).get_beta_0()
 
 
 def beta_0_warnings(beta0):
@@ -336,11 +370,15 @@ def normal_distribution(x):
     function at the given x value.
 
     Arguments:
-        x(float): The x value at which to compute the probability density.
+        x(float): The x value at which to compute the probability density, or
+            a numpy array of values.
 
     Returns:
-        float: The normal distribution value at the given x.
+        float: The normal distribution value at the given x, or an array of
+            values if given an array.
     """
+    if numpy is not None and isinstance(x, numpy.ndarray):
+        return (1 / math.sqrt(2 * math.pi)) * numpy.exp(-0.5 * x**2)
     return (1 / math.sqrt(2 * math.pi)) * math.exp(-0.5 * x**2)
 
 
@@ -352,7 +390,8 @@ def make_t_distribution(degrees_of_freedom):
         degrees_of_freedom(float): The degrees of freedom
 
     Returns:
-        callable: t-distribution function
+        callable: t-distribution function, which also accepts a numpy array
+            of values.
     """
     const = math.gamma((degrees_of_freedom + 1) / 2.0)
     const /= (
@@ -361,6 +400,10 @@ def make_t_distribution(degrees_of_freedom):
     )
 
     def tdist(x):
+        if numpy is not None and isinstance(x, numpy.ndarray):
+            return const * numpy.power(
+                1 + (x**2 / degrees_of_freedom),
+                -((degrees_of_freedom + 1) / 2.0))
         result = math.pow(
             1 + (x**2 / degrees_of_freedom),
             -((degrees_of_freedom + 1) / 2.0)
@@ -370,6 +413,110 @@ def make_t_distribution(degrees_of_freedom):
     return tdist
 
 
+def t_cdf(t, degrees_of_freedom, integrator=None, budget=None):
+    """Computes the t-distribution cumulative distribution at t.
+
+    Arguments:
+        t(float): The t value.
+        degrees_of_freedom(float): The degrees of freedom.
+        integrator(BaseIntegrator): Integrator used to integrate the
+            probability density, None = use the closed-form distribution.
+        budget(Budget): Limits the numerical integration, None =
+            unlimited.
+
+    Returns:
+        float: The probability of a value less than or equal to t.
+
+    Raises:
+        BudgetExhausted: If the budget runs out before the integration
+            converges.
+    """
+    if integrator is None:
+        return distributions.t_cdf(t, degrees_of_freedom)
+    tdist = make_t_distribution(degrees_of_freedom)
+    return integrator.integrate_minus_infinity_to(tdist, t, budget=budget)
+
+
+def t_ppf(p, degrees_of_freedom, integrator=None, budget=None):
+    """Computes the t-distribution quantile for the given probability.
+
+    Arguments:
+        p(float): A probability in (0, 1).
+        degrees_of_freedom(float): The degrees of freedom.
+        integrator(BaseIntegrator): Integrator used to integrate the
+            probability density, None = use the closed-form distribution.
+        budget(Budget): Limits the numerical integration, None =
+            unlimited.
+
+    Returns:
+        float: The value t such that t_cdf(t, degrees_of_freedom) = p.
+
+    Raises:
+        BudgetExhausted: If the budget runs out before the integration
+            converges.
+    """
+    if integrator is None:
+        return distributions.cached_t_ppf(p, degrees_of_freedom)
+    tdist = make_t_distribution(degrees_of_freedom)
+    return integration.approximate_inverse(
+        lambda x: integrator.integrate_minus_infinity_to(
+            tdist, x, budget=budget), p,
+        df=tdist, guess=0.0, budget=budget)
+
+
+def normal_ppf(p, integrator=None, budget=None):
+    """Computes the standard normal quantile for the given probability.
+
+    Arguments:
+        p(float): A probability in (0, 1).
+        integrator(BaseIntegrator): Integrator used to integrate the
+            probability density, None = use the closed-form distribution.
+        budget(Budget): Limits the numerical integration, None =
+            unlimited.
+
+    Returns:
+        float: The value x such that the normal cdf at x is p.
+
+    Raises:
+        BudgetExhausted: If the budget runs out before the integration
+            converges.
+    """
+    if integrator is None:
+        return distributions.normal_ppf(p)
+    return integration.approximate_inverse(
+        lambda x: integrator.integrate_minus_infinity_to(
+            normal_distribution, x, budget=budget), p,
+        df=normal_distribution, guess=0.0, budget=budget)
+
+
+def normal_ppf_many(probabilities, integrator=None, budget=None):
+    """Computes the standard normal quantiles for the given probabilities.
+    With an integrator the quantiles are solved in increasing order, each
+    starting from the previous one and sharing the integrated ranges.
+
+    Arguments:
+        probabilities(list): Probabilities in (0, 1).
+        integrator(BaseIntegrator): Integrator used to integrate the
+            probability density, None = use the closed-form distribution.
+        budget(Budget): Limits the numerical integration, None =
+            unlimited.
+
+    Returns:
+        list: The quantiles, in the order of the given probabilities.
+
+    Raises:
+        BudgetExhausted: If the budget runs out before the integration
+            converges.
+    """
+    if integrator is None:
+        return [distributions.normal_ppf(p) for p in probabilities]
+    cdf = integration.CumulativeDistribution(
+        integrator, normal_distribution, budget=budget)
+    return integration.approximate_inverse_many(
+        cdf, probabilities, df=normal_distribution, guess=0.0,
+        budget=budget)
+
+
 def variance_around_regression(xvalues, yvalues):
     """Compute the variance around the regression of the given values.
 
@@ -380,11 +527,7 @@ def variance_around_regression(xvalues, yvalues):
     Returns:
         float: The variance around the regression
     """
-    n = len(xvalues)
-    b0 = beta_0(xvalues, yvalues)
-    b1 = beta_1(xvalues, yvalues)
-    result = (1.0 / (n - 2))
-    return result * sum([(y - b0 - b1*x)**2 for x, y in zip(xvalues, yvalues)])
+    return RegressionSummary.from_data(xvalues, yvalues).get_variance()
 
 
 def standard_deviation_around_regression(xvalues, yvalues):
@@ -401,7 +544,8 @@ def standard_deviation_around_regression(xvalues, yvalues):
     return math.sqrt(variance_around_regression(xvalues, yvalues))
 
 
-def prediction_range(x_k, alpha, xvalues, yvalues):
+def prediction_range(x_k, alpha, xvalues, yvalues, integrator=None,
+                     budget=None):
     """Computes the prediction range for the given alpha value.
 
     Arguments:
@@ -409,26 +553,23 @@ def prediction_range(x_k, alpha, xvalues, yvalues):
         alpha(float): The t-distribution alpha value.
         xvalues(list): A list of values
         yvalues(list): A list of values
+        integrator(BaseIntegrator): Integrator used for the t-distribution,
+            None = use the closed-form distribution.
+        budget(Budget): Limits the numerical integration, None =
+            unlimited.
 
     Returns:
         float: The prediction range
+
+    Raises:
+        BudgetExhausted: If the budget runs out, its result holds the
+            prediction range for the best t value reached.
     """
     if len(xvalues) < 3 or len(yvalues) < 3:
         raise RuntimeError('Too few values to compute prediction interval')
 
-    n = len(xvalues)
-    tdist = make_t_distribution(n - 2)
-    integ = integration.Integrator(20, 0.00001)
-    h = lambda x: integ.integrate_minus_infinity_to(tdist, x)
-    std_dev = standard_deviation_around_regression(xvalues, yvalues)
-    t_value = integration.approximate_inverse(h, alpha)
-    x_avg = mean(xvalues)
-
-    const = t_value * std_dev
-    result = 1 + 1.0/n
-    result += (x_k - x_avg)**2 / sum([(x - x_avg)**2 for x in xvalues])
-
-    return const * math.sqrt(result)
+    summary = RegressionSummary.from_data(xvalues, yvalues)
+    return summary.get_prediction_range(x_k, alpha, integrator, budget)
 
 
 def correlation(x_data, y_data):
@@ -447,17 +588,7 @@ def correlation(x_data, y_data):
     if len(x_data) != len(y_data):
         raise RuntimeError('Size mismatch between data sets')
 
-    num_items = len(x_data)
-
-    numerator = num_items * sum([x*y for x, y in zip(x_data, y_data)])
-    numerator -= sum(x_data) * sum(y_data)
-
-    denominator = (
-        (num_items * sum([x**2 for x in x_data]) - sum(x_data)**2) *
-        (num_items * sum([y**2 for y in y_data]) - sum(y_data)**2)
-    )
-
-    return numerator / math.sqrt(denominator)
+    return RegressionSummary.from_data(x_data, y_data).get_correlation()
 
 
 def t_value(x_data, y_data):
@@ -476,24 +607,28 @@ def t_value(x_data, y_data):
     if len(x_data) != len(y_data):
         raise RuntimeError('Data sets must be of equal length')
 
-    corr = correlation(x_data, y_data)
-    if corr == 1:
-        raise RuntimeError('Invalid data, identical data sets.')
+    return RegressionSummary.from_data(x_data, y_data).get_t_value()
 
-    return abs(corr) * math.sqrt(len(x_data) - 2.0) / math.sqrt(1.0 - corr**2)
 
-
-def significance(x_data, y_data):
+def significance(x_data, y_data, integrator=None, budget=None):
     """Returns the significance of the correlation between the two data
     sets.
 
     Arguments:
         x_data(list): The first data set
         y_data(list): The second data set
+        integrator(BaseIntegrator): Integrator used for the t-distribution,
+            None = use the closed-form distribution.
+        budget(Budget): Limits the numerical integration, None =
+            unlimited.
 
     Returns:
         float: The probability of the correlation between the two data sets
             occurring by chance.
+
+    Raises:
+        BudgetExhausted: If the budget runs out, its result holds the
+            significance for the best p-value reached.
     """
     if len(x_data) < 3 or len(y_data) < 3:
         raise RuntimeError(
@@ -502,11 +637,583 @@ def significance(x_data, y_data):
     if len(x_data) != len(y_data):
         raise RuntimeError('Size mismatch between data sets')
 
-    t_val = t_value(x_data, y_data)
-    tdist = make_t_distribution(len(x_data) - 2)
-    integ = integration.Integrator(10, 10E-6)
-    p_value = integ.integrate_minus_infinity_to(tdist, t_val)
-    return 2 * (1 - p_value)
+    summary = RegressionSummary.from_data(x_data, y_data)
+    return summary.get_significance(integrator, budget)
+
+
+class RunningMoments(object):
+    """Accumulates the count, mean, minimum, maximum and second through
+    fourth central moments of a stream of values in a single pass using
+    Welford's method. Memory use is constant regardless of the number of
+    values seen.
+
+    Usage:
+    >>> moments = RunningMoments.from_iterable(open_values_generator())
+    >>> moments.get_mean(), moments.get_standard_deviation()
+    """
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Construct an accumulator fed with every value from the iterable.
+
+        Arguments:
+            iterable(iterable): An iterable containing numerical values.
+
+        Returns:
+            RunningMoments: The populated accumulator.
+        """
+        moments = cls()
+        moments.update(iterable)
+        return moments
+
+    def add(self, value):
+        """Add a single value to the accumulator.
+
+        Arguments:
+            value(float): The value to be added.
+        """
+        value = float(value)
+        n1 = self.count
+        self.count += 1
+        n = self.count
+        delta = value - self.mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n1
+
+        self.mean += delta_n
+        self.m4 += (
+            term1 * delta_n2 * (n * n - 3 * n + 3) +
+            6 * delta_n2 * self.m2 -
+            4 * delta_n * self.m3
+        )
+        self.m3 += term1 * delta_n * (n - 2) - 3 * delta_n * self.m2
+        self.m2 += term1
+
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def update(self, iterable):
+        """Add every value in the given iterable to the accumulator.
+
+        Arguments:
+            iterable(iterable): An iterable containing numerical values.
+        """
+        for each in iterable:
+            self.add(each)
+
+    def get_mean(self):
+        """Returns the mean of the values seen so far.
+
+        Returns:
+            float: The mean.
+
+        Raises:
+            RuntimeError: If no values have been added.
+        """
+        if self.count == 0:
+            raise RuntimeError('No values given to mean')
+        return self.mean
+
+    def get_variance(self):
+        """Returns the sample variance of the values seen so far.
+
+        Returns:
+            float: The sample variance.
+
+        Raises:
+            RuntimeError: If fewer than 2 values have been added.
+        """
+        if self.count == 0:
+            raise RuntimeError('No values given to mean')
+        if self.count < 2:
+            raise RuntimeError('Too few values given to standard deviation')
+        return self.m2 / (self.count - 1)
+
+    def get_standard_deviation(self):
+        """Returns the sample standard deviation of the values seen so far.
+
+        Returns:
+            float: The sample standard deviation.
+
+        Raises:
+            RuntimeError: If fewer than 2 values have been added.
+        """
+        return math.sqrt(self.get_variance())
+
+    def get_skewness(self):
+        """Returns the (population) skewness of the values seen so far.
+
+        Returns:
+            float: The skewness, 0 if the values have no spread.
+
+        Raises:
+            RuntimeError: If no values have been added.
+        """
+        if self.count == 0:
+            raise RuntimeError('No values given to mean')
+        if self.m2 == 0:
+            return 0.0
+        return math.sqrt(self.count) * self.m3 / self.m2**1.5
+
+    def get_kurtosis(self):
+        """Returns the (population) excess kurtosis of the values seen so far.
+
+        Returns:
+            float: The excess kurtosis, 0 if the values have no spread.
+
+        Raises:
+            RuntimeError: If no values have been added.
+        """
+        if self.count == 0:
+            raise RuntimeError('No values given to mean')
+        if self.m2 == 0:
+            return 0.0
+        return self.count * self.m4 / (self.m2 * self.m2) - 3.0
+
+
+class RegressionSums(object):
+    """The sufficient statistics for a simple linear regression: the number of
+    items, the means of x and y, and the sums of squares and products of
+    their deviations from the means. Values are accumulated with Welford's
+    method and merged with the pairwise update of Chan et al., so that data
+    far from the origin does not lose precision to cancellation.
+    """
+
+    def __init__(self, num_items=0, mean_x=0.0, mean_y=0.0, centered_xx=0.0,
+                 centered_yy=0.0, centered_xy=0.0):
+        """Initialize the sums, by default to an empty data set."""
+        self.num_items = num_items
+        self.mean_x = mean_x
+        self.mean_y = mean_y
+        self.centered_xx = centered_xx
+        self.centered_yy = centered_yy
+        self.centered_xy = centered_xy
+
+    @property
+    def sum_x(self):
+        """float: Σx"""
+        return self.num_items * self.mean_x
+
+    @property
+    def sum_y(self):
+        """float: Σy"""
+        return self.num_items * self.mean_y
+
+    @property
+    def sum_xx(self):
+        """float: Σx²"""
+        return self.centered_xx + self.num_items * self.mean_x**2
+
+    @property
+    def sum_yy(self):
+        """float: Σy²"""
+        return self.centered_yy + self.num_items * self.mean_y**2
+
+    @property
+    def sum_xy(self):
+        """float: Σxy"""
+        return self.centered_xy + self.num_items * self.mean_x * self.mean_y
+
+    def add(self, x, y):
+        """Add a single pair of values to the sums.
+
+        Arguments:
+            x(float): The x value.
+            y(float): The y value.
+        """
+        x = float(x)
+        y = float(y)
+        self.num_items += 1
+        delta_x = x - self.mean_x
+        delta_y = y - self.mean_y
+        self.mean_x += delta_x / self.num_items
+        self.mean_y += delta_y / self.num_items
+        self.centered_xx += delta_x * (x - self.mean_x)
+        self.centered_yy += delta_y * (y - self.mean_y)
+        self.centered_xy += delta_x * (y - self.mean_y)
+
+    def remove(self, x, y):
+        """Remove a single, previously added, pair of values from the sums.
+
+        Arguments:
+            x(float): The x value.
+            y(float): The y value.
+
+        Raises:
+            RuntimeError: If the sums are empty.
+        """
+        if self.num_items == 0:
+            raise RuntimeError('No values to remove from regression sums')
+        if self.num_items == 1:
+            self.__init__()
+            return
+        x = float(x)
+        y = float(y)
+        self.num_items -= 1
+        # Reverse add(), in which the deltas are taken from the earlier means
+        mean_x = self.mean_x - (x - self.mean_x) / self.num_items
+        mean_y = self.mean_y - (y - self.mean_y) / self.num_items
+        self.centered_xx -= (x - mean_x) * (x - self.mean_x)
+        self.centered_yy -= (y - mean_y) * (y - self.mean_y)
+        self.centered_xy -= (x - mean_x) * (y - self.mean_y)
+        self.mean_x = mean_x
+        self.mean_y = mean_y
+
+    def merge(self, other):
+        """Add every pair of values summarized by other sums to these sums.
+
+        Arguments:
+            other(RegressionSums): The sums to be merged in.
+        """
+        num_items = self.num_items + other.num_items
+        if num_items == 0:
+            return
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+        weight = self.num_items * other.num_items / float(num_items)
+        self.mean_x += delta_x * other.num_items / num_items
+        self.mean_y += delta_y * other.num_items / num_items
+        self.centered_xx += other.centered_xx + delta_x * delta_x * weight
+        self.centered_yy += other.centered_yy + delta_y * delta_y * weight
+        self.centered_xy += other.centered_xy + delta_x * delta_y * weight
+        self.num_items = num_items
+
+    def copy(self):
+        """Returns an independent copy of these sums.
+
+        Returns:
+            RegressionSums: The copied sums.
+        """
+        return RegressionSums(
+            num_items=self.num_items,
+            mean_x=self.mean_x,
+            mean_y=self.mean_y,
+            centered_xx=self.centered_xx,
+            centered_yy=self.centered_yy,
+            centered_xy=self.centered_xy)
+
+    def get_mean_x(self):
+        """Returns the mean of the x values.
+
+        Returns:
+            float: The mean of the x values.
+
+        Raises:
+            RuntimeError: If the data set is empty.
+        """
+        if self.num_items == 0:
+            raise RuntimeError('No values given to mean')
+        return self.mean_x
+
+    def get_mean_y(self):
+        """Returns the mean of the y values.
+
+        Returns:
+            float: The mean of the y values.
+
+        Raises:
+            RuntimeError: If the data set is empty.
+        """
+        if self.num_items == 0:
+            raise RuntimeError('No values given to mean')
+        return self.mean_y
+
+    def get_centered_xx(self):
+        """Returns the sum of squared deviations of x from its mean.
+
+        Returns:
+            float: Σ(x - x_avg)²
+        """
+        return self.centered_xx
+
+    def get_centered_yy(self):
+        """Returns the sum of squared deviations of y from its mean.
+
+        Returns:
+            float: Σ(y - y_avg)²
+        """
+        return self.centered_yy
+
+    def get_centered_xy(self):
+        """Returns the sum of products of the deviations of x and y from their
+        means.
+
+        Returns:
+            float: Σ(x - x_avg)(y - y_avg)
+        """
+        return self.centered_xy
+
+
+class RegressionSummary(object):
+    """Computes every statistic used by the PROBE methods from a single set of
+    regression sums, so the underlying data is only scanned once.
+
+    Usage:
+    >>> summary = RegressionSummary.from_data(x_data, y_data)
+    >>> summary.get_regression().estimate(proxy_value)
+    >>> summary.get_significance()
+    """
+
+    def __init__(self, sums):
+        """Initialize.
+
+        Arguments:
+            sums(RegressionSums): The sufficient statistics for the data.
+        """
+        self.sums = sums
+
+    @classmethod
+    def from_data(cls, x_data, y_data):
+        """Construct a summary from two sets of related data.
+
+        Arguments:
+            x_data(list): A list of values
+            y_data(list): A list of values
+
+        Returns:
+            RegressionSummary: The summary of the data.
+
+        Raises:
+            RuntimeError: If the data lists are of unequal length
+        """
+        if len(x_data) != len(y_data):
+            raise RuntimeError('Size mismatch between data sets')
+        return cls(regression_sums(x_data, y_data))
+
+    def get_num_items(self):
+        """Returns the number of data points summarized.
+
+        Returns:
+            int: The number of data points.
+        """
+        return self.sums.num_items
+
+    def get_beta_1(self):
+        """Returns the beta_1 linear regression parameter.
+
+        Returns:
+            float: The beta_1 linear regression parameter
+        """
+        return self.sums.get_centered_xy() / self.sums.get_centered_xx()
+
+    def get_beta_0(self):
+        """Returns the beta_0 linear regression parameter.
+
+        Returns:
+            float: The beta_0 linear regression parameter
+        """
+        return (
+            self.sums.get_mean_y() -
+            self.get_beta_1() * self.sums.get_mean_x()
+        )
+
+    def get_regression(self):
+        """Returns the linear regression fit to the data.
+
+        Returns:
+            LinearRegression: A linear regression
+        """
+        return LinearRegression(self.get_beta_0(), self.get_beta_1())
+
+    def get_correlation(self):
+        """Returns the correlation (r) between the data sets.
+
+        Returns:
+            float: The correlation between the two data sets.
+        """
+        return self.sums.get_centered_xy() / math.sqrt(
+            self.sums.get_centered_xx() * self.sums.get_centered_yy())
+
+    def get_r_squared(self):
+        """Returns the square of the correlation between the data sets.
+
+        Returns:
+            float: The correlation (R^2) value.
+        """
+        return self.get_correlation()**2
+
+    def get_t_value(self):
+        """Returns the t-distribution significance value for the correlation.
+
+        Returns:
+            float: The significance t value.
+
+        Raises:
+            RuntimeError: If the data sets are empty or perfectly correlated.
+        """
+        if self.sums.num_items == 0:
+            raise RuntimeError('Must have data in data set')
+
+        corr = self.get_correlation()
+        # Rounding can carry a perfect correlation slightly past one
+        if abs(corr) >= 1:
+            raise RuntimeError('Invalid data, identical data sets.')
+
+        return (
+            abs(corr) * math.sqrt(self.sums.num_items - 2.0) /
+            math.sqrt(1.0 - corr**2)
+        )
+
+    def get_significance(self, integrator=None, budget=None):
+        """Returns the significance of the correlation between the data sets.
+
+        Arguments:
+            integrator(BaseIntegrator): Integrator used for the t-distribution,
+                None = use the closed-form distribution.
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
+
+        Returns:
+            float: The probability of the correlation between the two data
+                sets occurring by chance.
+
+        Raises:
+            RuntimeError: If there are fewer than 3 data points.
+            BudgetExhausted: If the budget runs out, its result holds the
+                significance for the best p-value reached.
+        """
+        if self.sums.num_items < 3:
+            raise RuntimeError(
+                'Too few items to perform significance calculation')
+
+        try:
+            p_value = t_cdf(
+                self.get_t_value(), self.sums.num_items - 2, integrator,
+                budget)
+        except integration.BudgetExhausted as exhausted:
+            raise integration.BudgetExhausted(exhausted.result.derive(
+                lambda p_value: 2 * (1 - p_value), 2))
+        return 2 * (1 - p_value)
+
+    def get_variance(self):
+        """Returns the variance around the regression.
+
+        Returns:
+            float: The variance around the regression
+        """
+        residuals = (
+            self.sums.get_centered_yy() -
+            self.get_beta_1() * self.sums.get_centered_xy()
+        )
+        return max(residuals, 0.0) / (self.sums.num_items - 2)
+
+    def get_standard_deviation(self):
+        """Returns the standard deviation around the regression.
+
+        Returns:
+            float: The standard deviation around the regression
+        """
+        return math.sqrt(self.get_variance())
+
+    def get_prediction_range(self, x_k, alpha, integrator=None, budget=None):
+        """Computes the prediction range for the given estimated value.
+
+        Arguments:
+            x_k(float): An estimated value
+            alpha(float): The t-distribution alpha value.
+            integrator(BaseIntegrator): Integrator used for the t-distribution,
+                None = use the closed-form distribution.
+            budget(Budget): Limits the numerical integration, None =
+                unlimited.
+
+        Returns:
+            float: The prediction range
+
+        Raises:
+            RuntimeError: If there are fewer than 3 data points.
+            BudgetExhausted: If the budget runs out, its result holds the
+                prediction range for the best t value reached.
+        """
+        n = self.sums.num_items
+        if n < 3:
+            raise RuntimeError('Too few values to compute prediction interval')
+
+        x_avg = self.sums.get_mean_x()
+        result = 1 + 1.0/n
+        result += (x_k - x_avg)**2 / self.sums.get_centered_xx()
+        stddev = self.get_standard_deviation()
+        root = math.sqrt(result)
+
+        try:
+            t_value = t_ppf(alpha, n - 2, integrator, budget)
+        except integration.BudgetExhausted as exhausted:
+            raise integration.BudgetExhausted(exhausted.result.derive(
+                lambda t_value: t_value * stddev * root, stddev * root))
+        return t_value * stddev * root
+
+
+class OnlineLinearRegression(RegressionSummary):
+    """A regression summary whose observations can be added, removed and
+    merged in constant time. Every statistic is computed on demand from the
+    current sums, so no refit over the full history is ever required.
+
+    Usage:
+    >>> regression = OnlineLinearRegression()
+    >>> regression.add(proxy_size, actual_size)
+    >>> regression.merge(other_team_regression)
+    >>> regression.get_prediction_range(proxy_value, 0.85)
+    """
+
+    def __init__(self, sums=None):
+        """Initialize.
+
+        Arguments:
+            sums(RegressionSums): Initial sums, by default an empty data set.
+        """
+        super(OnlineLinearRegression, self).__init__(
+            sums if sums is not None else RegressionSums())
+
+    def add(self, x, y):
+        """Add an observation to the regression.
+
+        Arguments:
+            x(float): The x value.
+            y(float): The y value.
+        """
+        self.sums.add(x, y)
+
+    def remove(self, x, y):
+        """Remove a previously added observation from the regression.
+
+        Arguments:
+            x(float): The x value.
+            y(float): The y value.
+
+        Raises:
+            RuntimeError: If the regression has no observations.
+        """
+        self.sums.remove(x, y)
+
+    def merge(self, other):
+        """Add every observation of another regression to this one, for
+        example to combine regressions fit to separate shards of data.
+
+        Arguments:
+            other(RegressionSummary): The regression to be merged in.
+        """
+        self.sums.merge(other.sums)
+
+    def get_snapshot(self):
+        """Returns a summary of the current observations that is unaffected by
+        later updates.
+
+        Returns:
+            RegressionSummary: A summary of the current observations.
+        """
+        return RegressionSummary(self.sums.copy())
 
 
 class LinearRegression(object):
@@ -532,3 +1239,18 @@ class LinearRegression(object):
             float: The project value from the linear regression
         """
         return self.beta0 + self.beta1 * proxy_value
+
+    def estimate_many(self, proxy_values):
+        """Perform linear regression for each of the given estimation values.
+
+        Arguments:
+            proxy_values(list): The estimation values
+
+        Returns:
+            list: The projected value for each estimation value
+        """
+        if USE_NUMPY:
+            projections = self.beta0 + self.beta1 * numpy.asarray(
+                proxy_values, dtype=float)
+            return projections.tolist()
+        return [self.beta0 + self.beta1 * each for each in proxy_values]
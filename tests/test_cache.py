@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from lib import cache
+
+
+class TestLRUCache(unittest.TestCase):
+    def setUp(self):
+        super(TestLRUCache, self).setUp()
+        self.cache = cache.LRUCache(2)
+
+    def test_should_raise_error_for_invalid_size(self):
+        self.assertRaises(ValueError, cache.LRUCache, 0)
+
+    def test_should_count_hits_and_misses(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.cache.put('a', 1)
+        self.assertEqual(1, self.cache.get('a'))
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_should_evict_least_recently_used_entry(self):
+        self.cache.put('a', 1)
+        self.cache.put('b', 2)
+        self.cache.get('a')
+        self.cache.put('c', 3)
+        self.assertIn('a', self.cache)
+        self.assertNotIn('b', self.cache)
+        self.assertEqual(2, len(self.cache))
+
+    def test_should_only_compute_missing_values(self):
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+        self.assertEqual(1, self.cache.lookup('a', compute))
+        self.assertEqual(1, self.cache.lookup('a', compute))
+        self.assertEqual(1, len(calls))
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from lib import chi_squared
+from lib import integration
+from lib import io
+from lib import statistics
+
+
+class TestCountInBuckets(unittest.TestCase):
+    def setUp(self):
+        super(TestCountInBuckets, self).setUp()
+        self.use_numpy = chi_squared.USE_NUMPY
+        self.upper_bounds = [-1.0, 0.0, 1.5]
+        self.values = [-2.0, -1.0, -0.5, 0.0, 0.2, 1.5, 1.6, 8.0]
+
+    def tearDown(self):
+        super(TestCountInBuckets, self).tearDown()
+        chi_squared.USE_NUMPY = self.use_numpy
+
+    def test_should_count_without_numpy(self):
+        chi_squared.USE_NUMPY = False
+        self.assertEqual([2, 2, 2, 2], chi_squared.count_in_buckets(
+            self.values, self.upper_bounds))
+
+    @unittest.skipIf(chi_squared.numpy is None, 'NumPy is not installed')
+    def test_should_count_with_numpy(self):
+        chi_squared.USE_NUMPY = True
+        self.assertEqual([2, 2, 2, 2], chi_squared.count_in_buckets(
+            self.values, self.upper_bounds))
+
+    def test_should_count_into_single_bucket_without_bounds(self):
+        self.assertEqual([3], chi_squared.count_in_buckets([1, 2, 3], []))
+
+
+class TestGeneralChiSquaredTest(unittest.TestCase):
+    def test_should_match_segment_ranges(self):
+        generator = random.Random(7)
+        data = [generator.gauss(0, 1) for _ in range(137)]
+        test = chi_squared.GeneralChiSquaredTest()
+        num_segments = test.get_number_of_segments(len(data))
+        buckets = test.get_normal_distribution_buckets(
+            len(data), num_segments)
+        expected = [
+            len([each for each in data if bucket.in_range(each)])
+            for bucket in buckets]
+        self.assertEqual(expected, chi_squared.count_in_buckets(
+            data, [bucket.upper_bound for bucket in buckets[:-1]]))
+
+
+class TestPValue(unittest.TestCase):
+    def test_should_use_chi_squared_distribution(self):
+        # 95th percentile of the chi-squared distribution with 9 degrees of
+        # freedom
+        self.assertAlmostEqual(
+            0.95, chi_squared.ChiSquaredTest().get_p_value(16.919, 10), 4)
+
+    def test_should_not_integrate_p_value(self):
+        test = chi_squared.ChiSquaredTest(integration.Integrator(20, 1E-10))
+        data = [statistics.normal_ppf((i + 0.5) / 100.0) for i in range(100)]
+        budget = integration.Budget(max_evaluations=0)
+        chi_squared_value, p_value = test.execute(data, budget)
+        self.assertAlmostEqual(0.0, chi_squared_value, 10)
+        self.assertEqual(0.0, p_value)
+        self.assertEqual(0, budget.evaluation_count)
+
+
+class TestStreamingChiSquaredTest(unittest.TestCase):
+    def setUp(self):
+        super(TestStreamingChiSquaredTest, self).setUp()
+        generator = random.Random(11)
+        self.data = [generator.gauss(5, 2) for _ in range(1003)]
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        super(TestStreamingChiSquaredTest, self).tearDown()
+        shutil.rmtree(self.temp_dir)
+
+    def assert_matches_general_test(self, result):
+        expected = chi_squared.GeneralChiSquaredTest().execute(self.data)
+        self.assertAlmostEqual(expected[0], result[0], 10)
+        self.assertAlmostEqual(expected[1], result[1], 10)
+
+    def test_should_match_general_test_for_iterable_factory(self):
+        test = chi_squared.StreamingChiSquaredTest()
+        test.CHUNK_SIZE = 100
+        self.assert_matches_general_test(
+            test.execute(lambda: iter(self.data)))
+
+    def test_should_match_general_test_for_file(self):
+        file_path = os.path.join(self.temp_dir, 'values.txt')
+        io.write_numbers_to_file(file_path, self.data)
+        self.assert_matches_general_test(
+            chi_squared.StreamingChiSquaredTest().execute(file_path))
+
+    def test_should_raise_error_for_too_few_items(self):
+        test = chi_squared.StreamingChiSquaredTest()
+        self.assertRaises(
+            test.TooFewItems, test.execute, lambda: iter(self.data[:10]))
+
+
+class TestBucketBoundaries(unittest.TestCase):
+    def setUp(self):
+        super(TestBucketBoundaries, self).setUp()
+        chi_squared.BOUNDARY_CACHE.clear()
+
+    def test_should_look_up_equal_segments(self):
+        probabilities = [i / 10.0 for i in range(1, 10)]
+        results = chi_squared.table_normal_quantiles(10, probabilities)
+        for probability, result in zip(probabilities, results):
+            self.assertAlmostEqual(
+                statistics.normal_ppf(probability), result, 14)
+
+    def test_should_not_look_up_uncovered_segments(self):
+        self.assertIsNone(chi_squared.table_normal_quantiles(
+            55, [i / 55.0 for i in range(1, 55)]))
+        self.assertIsNone(chi_squared.table_normal_quantiles(
+            5, [0.2, 0.4, 0.65, 0.8]))
+
+    def test_should_not_integrate_table_boundaries(self):
+        test = chi_squared.GeneralChiSquaredTest(
+            integration.Integrator(20, 1E-10))
+        buckets = test.get_normal_distribution_buckets(
+            100, 10, integration.Budget(max_evaluations=0))
+        self.assertEqual(10, len(buckets))
+
+    def test_should_cache_computed_boundaries(self):
+        test = chi_squared.GeneralChiSquaredTest(
+            integration.Integrator(20, 1E-10))
+        expected = test.get_normal_distribution_buckets(137, 15)
+        buckets = test.get_normal_distribution_buckets(
+            137, 15, integration.Budget(max_evaluations=0))
+        self.assertEqual(
+            [each.upper_bound for each in expected],
+            [each.upper_bound for each in buckets])
+        self.assertEqual(1, chi_squared.BOUNDARY_CACHE.hits)
+
+    def test_should_share_boundaries_between_equal_integrators(self):
+        first = chi_squared.GeneralChiSquaredTest(
+            integration.Integrator(20, 1E-10))
+        second = chi_squared.GeneralChiSquaredTest(
+            integration.Integrator(20, 1E-10))
+        first.get_normal_distribution_buckets(137, 15)
+        second.get_normal_distribution_buckets(
+            137, 15, integration.Budget(max_evaluations=0))
+        self.assertEqual(1, chi_squared.BOUNDARY_CACHE.hits)
+        self.assertNotEqual(
+            chi_squared.integrator_key(integration.Integrator(20, 1E-10)),
+            chi_squared.integrator_key(integration.Integrator(20, 1E-12)))
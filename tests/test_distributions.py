@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+import math
+import os
+import shutil
+import tempfile
+import unittest
+
+from lib import distributions
+
+
+class TestIncompleteBeta(unittest.TestCase):
+    def test_should_return_limits_at_end_points(self):
+        self.assertEqual(0.0, distributions.incomplete_beta(0.0, 2, 3))
+        self.assertEqual(1.0, distributions.incomplete_beta(1.0, 2, 3))
+
+    def test_should_correctly_compute_value(self):
+        self.assertAlmostEqual(
+            0.3483, distributions.incomplete_beta(0.3, 2, 3), 10)
+
+    def test_should_raise_error_if_out_of_range(self):
+        self.assertRaises(ValueError, distributions.incomplete_beta, 1.5, 2, 3)
+
+
+class TestIncompleteGamma(unittest.TestCase):
+    def test_should_return_zero_at_origin(self):
+        self.assertEqual(0.0, distributions.incomplete_gamma(2.5, 0.0))
+
+    def test_should_match_exponential_distribution(self):
+        # P(1, x) is the exponential cdf, covering both the series and the
+        # continued fraction
+        for x in [0.1, 1.5, 2.0, 8.0, 40.0]:
+            self.assertAlmostEqual(
+                1.0 - math.exp(-x), distributions.incomplete_gamma(1, x), 14)
+
+    def test_should_raise_error_if_out_of_range(self):
+        self.assertRaises(ValueError, distributions.incomplete_gamma, 0, 1.0)
+        self.assertRaises(ValueError, distributions.incomplete_gamma, 1, -1.0)
+
+
+class TestChiSquaredDistribution(unittest.TestCase):
+    def test_should_return_zero_below_origin(self):
+        self.assertEqual(0.0, distributions.chi_squared_cdf(-1.0, 3))
+
+    def test_should_match_chi_squared_table(self):
+        # 95% values from a standard chi-squared table
+        self.assertAlmostEqual(
+            0.95, distributions.chi_squared_cdf(3.841, 1), 4)
+        self.assertAlmostEqual(
+            0.95, distributions.chi_squared_cdf(11.070, 5), 4)
+        self.assertAlmostEqual(
+            0.95, distributions.chi_squared_cdf(18.307, 10), 4)
+        self.assertAlmostEqual(
+            0.95, distributions.chi_squared_cdf(67.505, 50), 4)
+
+    def test_should_match_normal_distribution_for_one_degree(self):
+        for q in [0.01, 0.5, 3.0, 12.0]:
+            self.assertAlmostEqual(
+                math.erf(math.sqrt(q / 2.0)),
+                distributions.chi_squared_cdf(q, 1), 14)
+
+
+class TestNormalDistribution(unittest.TestCase):
+    def test_should_correctly_compute_cdf(self):
+        self.assertAlmostEqual(0.9938, distributions.normal_cdf(2.5), 4)
+        self.assertAlmostEqual(0.1357, distributions.normal_cdf(-1.1), 4)
+
+    def test_should_invert_cdf(self):
+        for p in [1E-10, 0.01, 0.3, 0.5, 0.85, 0.999]:
+            x = distributions.normal_ppf(p)
+            self.assertAlmostEqual(p, distributions.normal_cdf(x), 14)
+
+    def test_should_raise_error_for_invalid_probability(self):
+        self.assertRaises(ValueError, distributions.normal_ppf, 1.0)
+
+
+class TestTDistribution(unittest.TestCase):
+    def test_should_be_symmetric(self):
+        self.assertAlmostEqual(0.5, distributions.t_cdf(0, 5))
+        self.assertAlmostEqual(
+            1.0, distributions.t_cdf(1.3, 5) + distributions.t_cdf(-1.3, 5))
+
+    def test_should_match_t_table(self):
+        # Two-sided 95% values from a standard t table
+        self.assertAlmostEqual(12.706, distributions.t_ppf(0.975, 1), 3)
+        self.assertAlmostEqual(4.303, distributions.t_ppf(0.975, 2), 3)
+        self.assertAlmostEqual(2.306, distributions.t_ppf(0.975, 8), 3)
+        self.assertAlmostEqual(2.042, distributions.t_ppf(0.975, 30), 3)
+
+    def test_should_invert_cdf(self):
+        for df in [1, 3, 8, 30, 1000]:
+            for p in [0.05, 0.7, 0.85, 0.999]:
+                t = distributions.t_ppf(p, df)
+                self.assertAlmostEqual(p, distributions.t_cdf(t, df), 11)
+
+
+class TestCachedTDistribution(unittest.TestCase):
+    def setUp(self):
+        super(TestCachedTDistribution, self).setUp()
+        distributions.T_QUANTILE_CACHE.clear()
+        distributions.T_QUANTILE_TABLE.clear()
+        distributions.T_QUANTILE_TABLE_HITS = 0
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        super(TestCachedTDistribution, self).tearDown()
+        distributions.T_QUANTILE_TABLE.clear()
+        shutil.rmtree(self.temp_dir)
+
+    def test_should_memoize_quantiles(self):
+        first = distributions.cached_t_ppf(0.85, 8)
+        second = distributions.cached_t_ppf(0.85, 8.0)
+        self.assertEqual(first, second)
+        self.assertEqual(distributions.t_ppf(0.85, 8), first)
+        self.assertEqual(1, distributions.T_QUANTILE_CACHE.misses)
+        self.assertEqual(1, distributions.T_QUANTILE_CACHE.hits)
+
+    def test_should_use_precomputed_table(self):
+        file_path = os.path.join(self.temp_dir, 'table.csv')
+        distributions.write_t_quantile_table(file_path, [3, 8], [0.85, 0.95])
+        self.assertEqual(4, distributions.load_t_quantile_table(file_path))
+        self.assertEqual(
+            distributions.t_ppf(0.95, 8),
+            distributions.cached_t_ppf(0.95, 8))
+        self.assertEqual(0, distributions.T_QUANTILE_CACHE.misses)
+        self.assertEqual(0, distributions.T_QUANTILE_CACHE.hits)
+        self.assertEqual(1, distributions.T_QUANTILE_TABLE_HITS)
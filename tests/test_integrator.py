@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+import math
 import unittest
 
+from lib import chi_squared
 from lib import integration
 from lib import statistics
 
@@ -24,3 +26,564 @@ class TestIntegrator(unittest.TestCase):
         result = self.integrator.integrate_minus_infinity_to(
             statistics.normal_distribution, -1.1)
         self.assertAlmostEqual(result, 0.1357, 4)
+
+    def test_it_should_only_evaluate_new_points_when_refining(self):
+        evaluated = []
+
+        def func(x):
+            evaluated.append(x)
+            return statistics.normal_distribution(x)
+
+        self.integrator.integrate(func, 0, 2.5)
+        self.assertEqual(len(evaluated), self.integrator.evaluation_count)
+        self.assertEqual(len(set(evaluated)), len(evaluated))
+
+    def test_it_should_integrate_polynomial_exactly(self):
+        result = self.integrator.integrate(lambda x: x**3, 0, 2)
+        self.assertAlmostEqual(4.0, result)
+        self.assertEqual(41, self.integrator.evaluation_count)
+
+
+@unittest.skipIf(integration.numpy is None, 'NumPy is not installed')
+class TestVectorizedIntegrator(unittest.TestCase):
+    def setUp(self):
+        super(TestVectorizedIntegrator, self).setUp()
+        self.use_numpy = statistics.USE_NUMPY
+
+    def tearDown(self):
+        super(TestVectorizedIntegrator, self).tearDown()
+        statistics.USE_NUMPY = self.use_numpy
+
+    def test_it_should_match_scalar_integration(self):
+        for func in [statistics.normal_distribution,
+                     statistics.make_t_distribution(3)]:
+            scalar = integration.Integrator(20, 1E-10)
+            vectorized = integration.Integrator(20, 1E-10, vectorized=True)
+            self.assertAlmostEqual(
+                scalar.integrate_minus_infinity_to(func, 1.7),
+                vectorized.integrate_minus_infinity_to(func, 1.7), 12)
+            self.assertEqual(
+                scalar.evaluation_count, vectorized.evaluation_count)
+
+    def test_it_should_call_function_once_per_level(self):
+        calls = []
+
+        def func(x):
+            calls.append(x)
+            return statistics.normal_distribution(x)
+
+        integrator = integration.Integrator(4, 0.1, vectorized=True)
+        integrator.integrate(func, 0, 2.5)
+        # Two end points, the even and odd sums and one refinement level
+        self.assertEqual(5, len(calls))
+
+    def test_it_should_not_depend_on_regression_sums_switch(self):
+        statistics.USE_NUMPY = False
+        integrator = integration.Integrator(10, 1E-8, vectorized=True)
+        for func in [statistics.normal_distribution,
+                     statistics.make_t_distribution(5.0)]:
+            self.assertAlmostEqual(
+                integration.Integrator(10, 1E-8).integrate(func, 0.0, 2.5),
+                integrator.integrate(func, 0.0, 2.5), 12)
+
+    def test_distributions_should_accept_arrays(self):
+        points = integration.numpy.array([-1.0, 0.0, 2.0])
+        tdist = statistics.make_t_distribution(4)
+        for func in [statistics.normal_distribution, tdist]:
+            values = func(points)
+            for point, value in zip(points, values):
+                self.assertAlmostEqual(func(float(point)), value, 14)
+
+
+class TestRombergIntegrator(unittest.TestCase):
+    def setUp(self):
+        super(TestRombergIntegrator, self).setUp()
+        self.integrator = integration.RombergIntegrator(10, 1E-10)
+
+    def test_it_should_integrate_to_positive_value(self):
+        result = self.integrator.integrate_minus_infinity_to(
+            statistics.normal_distribution, 2.5)
+        self.assertAlmostEqual(math.erf(2.5 / math.sqrt(2)) / 2 + 0.5,
+                               result, 12)
+
+    def test_it_should_need_fewer_evaluations_than_simpson(self):
+        simpson = integration.Integrator(10, 1E-10)
+        for degrees_of_freedom in [1, 5, 100]:
+            tdist = statistics.make_t_distribution(degrees_of_freedom)
+            self.assertAlmostEqual(
+                simpson.integrate(tdist, 0, 2.5),
+                self.integrator.integrate(tdist, 0, 2.5), 10)
+            self.assertLess(
+                self.integrator.evaluation_count, simpson.evaluation_count)
+
+    def test_it_should_only_evaluate_new_points_when_refining(self):
+        evaluated = []
+
+        def func(x):
+            evaluated.append(x)
+            return statistics.normal_distribution(x)
+
+        self.integrator.integrate(func, 0, 2.5)
+        self.assertEqual(len(evaluated), self.integrator.evaluation_count)
+        self.assertEqual(len(set(evaluated)), len(evaluated))
+
+    def test_it_should_integrate_polynomial_exactly(self):
+        result = self.integrator.integrate(lambda x: x**5, 0, 2)
+        self.assertAlmostEqual(64 / 6.0, result, 12)
+        # Boole's rule on the second level is exact, the third confirms it
+        self.assertEqual(81, self.integrator.evaluation_count)
+
+    def test_it_should_stop_at_maximum_level(self):
+        self.integrator.MAX_LEVELS = 3
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            self.integrator.integrate(lambda x: math.sqrt(x), 0, 1)
+        result = context.exception.result
+        self.assertEqual(41, result.evaluation_count)
+        self.assertAlmostEqual(2 / 3.0, result.value, 2)
+        self.assertLess(abs(2 / 3.0 - result.value), 10 * result.error)
+
+    def test_it_should_bound_evaluations_at_maximum_level(self):
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            self.integrator.integrate(lambda x: math.sqrt(x), 0, 1)
+        self.assertEqual(
+            10 * 2 ** (self.integrator.MAX_LEVELS - 1) + 1,
+            context.exception.result.evaluation_count)
+
+
+class TestAdaptiveIntegrator(unittest.TestCase):
+    def setUp(self):
+        super(TestAdaptiveIntegrator, self).setUp()
+        self.integrator = integration.AdaptiveIntegrator(20, 0.0001)
+
+    def test_it_should_integrate_to_positive_value(self):
+        result = self.integrator.integrate_minus_infinity_to(
+            statistics.normal_distribution, 2.5)
+        self.assertAlmostEqual(result, 0.9938, 4)
+
+    def test_it_should_integrate_to_negative_value(self):
+        result = self.integrator.integrate_minus_infinity_to(
+            statistics.normal_distribution, -1.1)
+        self.assertAlmostEqual(result, 0.1357, 4)
+
+    def test_it_should_refine_peaked_function_with_fewer_evaluations(self):
+        def peak(x):
+            return math.exp(-1000 * (x - 0.3) ** 2)
+
+        simpson = integration.Integrator(10, 1E-6)
+        adaptive = integration.AdaptiveIntegrator(10, 1E-6)
+        expected = math.sqrt(math.pi / 1000)
+        self.assertAlmostEqual(expected, simpson.integrate(peak, 0, 2.5), 7)
+        self.assertAlmostEqual(expected, adaptive.integrate(peak, 0, 2.5), 7)
+        self.assertLess(adaptive.evaluation_count, simpson.evaluation_count)
+
+    def test_it_should_stop_at_evaluation_budget(self):
+        integrator = integration.AdaptiveIntegrator(10, 1E-12, 50)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            integrator.integrate(statistics.normal_distribution, 0, 2.5)
+        result = context.exception.result
+        self.assertLessEqual(result.evaluation_count, 50)
+        self.assertEqual(integrator.evaluation_count, result.evaluation_count)
+        self.assertAlmostEqual(result.value, 0.4938, 4)
+
+    def test_it_should_stop_at_maximum_depth(self):
+        self.integrator.MAX_DEPTH = 2
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            self.integrator.integrate(
+                lambda x: math.exp(-1000 * (x - 0.3) ** 2), 0, 2.5)
+        result = context.exception.result
+        self.assertAlmostEqual(math.sqrt(math.pi / 1000), result.value, 1)
+        self.assertGreater(result.error, 0)
+
+    def test_it_should_require_even_number_of_segments(self):
+        with self.assertRaises(ValueError):
+            integration.AdaptiveIntegrator(5, 0.0001)
+
+    def test_it_should_require_evaluations_for_every_segment(self):
+        with self.assertRaises(ValueError):
+            integration.AdaptiveIntegrator(10, 1E-10, 5)
+        integrator = integration.AdaptiveIntegrator(10, 1E-10, 11)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            integrator.integrate(statistics.normal_distribution, 0, 2.5)
+        self.assertEqual(11, context.exception.result.evaluation_count)
+
+
+class TestGaussKronrodIntegrator(unittest.TestCase):
+    def setUp(self):
+        super(TestGaussKronrodIntegrator, self).setUp()
+        self.integrator = integration.GaussKronrodIntegrator(1, 1E-10)
+
+    def test_it_should_integrate_to_positive_value(self):
+        result = self.integrator.integrate_minus_infinity_to(
+            statistics.normal_distribution, 2.5)
+        self.assertAlmostEqual(result, 0.99379033467, 10)
+
+    def test_it_should_integrate_to_negative_value(self):
+        result = self.integrator.integrate_minus_infinity_to(
+            statistics.normal_distribution, -1.1)
+        self.assertAlmostEqual(result, 0.13566606095, 10)
+
+    def test_it_should_need_few_evaluations_for_smooth_functions(self):
+        tdist = statistics.make_t_distribution(5)
+        self.integrator.integrate(tdist, 0, 2.5)
+        self.assertLessEqual(self.integrator.evaluation_count, 45)
+
+    def test_it_should_integrate_polynomial_with_one_rule(self):
+        result = self.integrator.integrate(lambda x: x**7 - x**2, -1, 3)
+        self.assertAlmostEqual(result, 6560 / 8.0 - 28 / 3.0, 10)
+        self.assertEqual(15, self.integrator.evaluation_count)
+
+    def test_it_should_stop_at_evaluation_budget(self):
+        integrator = integration.GaussKronrodIntegrator(1, 1E-14, 60)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            integrator.integrate(lambda x: math.exp(-1000 * x * x), -1, 4)
+        result = context.exception.result
+        self.assertLessEqual(result.evaluation_count, 60)
+        self.assertEqual(integrator.evaluation_count, result.evaluation_count)
+
+    def test_it_should_stop_at_maximum_depth(self):
+        self.integrator.MAX_DEPTH = 1
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            self.integrator.integrate(
+                lambda x: math.exp(-1000 * (x - 0.3) ** 2), 0, 2.5)
+        self.assertEqual(45, context.exception.result.evaluation_count)
+
+    def test_it_should_require_a_segment(self):
+        with self.assertRaises(ValueError):
+            integration.GaussKronrodIntegrator(0, 1E-10)
+
+    def test_it_should_require_evaluations_for_every_segment(self):
+        with self.assertRaises(ValueError):
+            integration.GaussKronrodIntegrator(10, 1E-10, 50)
+
+
+class TestCumulative(unittest.TestCase):
+    def setUp(self):
+        super(TestCumulative, self).setUp()
+        self.limits = [2.5, -1.1, 0.2, 0.0, -2.5, 1.1, 3.0]
+
+    def test_it_should_return_values_in_given_order(self):
+        for integrator in [integration.Integrator(20, 1E-10),
+                           integration.AdaptiveIntegrator(20, 1E-10),
+                           integration.GaussKronrodIntegrator(1, 1E-10)]:
+            results = integrator.cumulative(
+                statistics.normal_distribution, self.limits)
+            for limit, result in zip(self.limits, results):
+                self.assertAlmostEqual(
+                    integrator.integrate_minus_infinity_to(
+                        statistics.normal_distribution, limit), result, 9)
+
+    def test_it_should_only_integrate_the_largest_span(self):
+        evaluated = []
+
+        def func(x):
+            evaluated.append(x)
+            return statistics.normal_distribution(x)
+
+        integrator = integration.GaussKronrodIntegrator(1, 1E-10)
+        integrator.cumulative(func, self.limits)
+        self.assertEqual(len(evaluated), integrator.evaluation_count)
+        self.assertTrue(all(0 <= x <= 3.0 for x in evaluated))
+
+    def test_it_should_handle_no_limits(self):
+        integrator = integration.Integrator(20, 1E-10)
+        self.assertEqual([], integrator.cumulative(
+            statistics.normal_distribution, []))
+
+
+class TestSemiInfiniteIntegration(unittest.TestCase):
+    def setUp(self):
+        super(TestSemiInfiniteIntegration, self).setUp()
+        self.integrators = [
+            integration.Integrator(20, 1E-10),
+            integration.AdaptiveIntegrator(20, 1E-10),
+            integration.GaussKronrodIntegrator(1, 1E-10)]
+
+    def lognormal(self, x):
+        if x <= 0:
+            return 0.0
+        return statistics.normal_distribution(math.log(x)) / x
+
+    def test_it_should_integrate_without_symmetry(self):
+        for integrator in self.integrators:
+            result = integrator.integrate_minus_infinity_to(
+                statistics.normal_distribution, -1.1, symmetric=False)
+            self.assertAlmostEqual(0.135666060946, result, 10)
+
+    def test_it_should_integrate_heavy_tails(self):
+        cauchy = statistics.make_t_distribution(1)
+        for integrator in self.integrators:
+            result = integrator.integrate_minus_infinity_to(
+                cauchy, 1.5, symmetric=False)
+            self.assertAlmostEqual(
+                0.5 + math.atan(1.5) / math.pi, result, 10)
+
+    def test_it_should_integrate_skewed_density(self):
+        for integrator in self.integrators:
+            upper = integrator.integrate_to_infinity(self.lognormal, 2.0)
+            lower = integrator.integrate_minus_infinity_to(
+                self.lognormal, 2.0, symmetric=False)
+            self.assertAlmostEqual(0.244108595785, upper, 9)
+            self.assertAlmostEqual(1.0, lower + upper, 9)
+
+    def test_it_should_sweep_limits_from_the_tail(self):
+        integrator = integration.GaussKronrodIntegrator(1, 1E-12)
+        limits = [2.0, 0.5, 4.0, 0.5, 1.0]
+        results = integrator.cumulative(
+            self.lognormal, limits, symmetric=False)
+        for limit, result in zip(limits, results):
+            self.assertAlmostEqual(
+                integrator.integrate_minus_infinity_to(
+                    self.lognormal, limit, symmetric=False), result, 10)
+
+
+class TestIntegratorSelection(unittest.TestCase):
+    def test_it_should_compute_significance_with_integrator(self):
+        x_data = [1, 2, 3, 4, 5, 6]
+        y_data = [1.2, 1.9, 3.4, 3.8, 5.3, 5.9]
+        integrator = integration.AdaptiveIntegrator(20, 1E-8)
+        self.assertAlmostEqual(
+            statistics.significance(x_data, y_data),
+            statistics.significance(x_data, y_data, integrator), 6)
+
+    def test_it_should_compute_prediction_range_with_any_integrator(self):
+        x_data = [1, 2, 3, 4, 5, 6]
+        y_data = [1.2, 1.9, 3.4, 3.8, 5.3, 5.9]
+        expected = statistics.prediction_range(3.5, 0.7, x_data, y_data)
+        for integrator in [integration.Integrator(20, 1E-8),
+                           integration.AdaptiveIntegrator(20, 1E-8),
+                           integration.GaussKronrodIntegrator(1, 1E-10)]:
+            self.assertAlmostEqual(expected, statistics.prediction_range(
+                3.5, 0.7, x_data, y_data, integrator), 5)
+
+
+class TestFindRoot(unittest.TestCase):
+    def test_it_should_find_root_with_derivative(self):
+        root = integration.find_root(
+            lambda x: x**3 - 2 * x - 5, 2.0, lambda x: 3 * x**2 - 2)
+        self.assertAlmostEqual(2.0945514815, root, 9)
+
+    def test_it_should_find_root_without_derivative(self):
+        root = integration.find_root(lambda x: x**3 - 2 * x - 5, 2.0)
+        self.assertAlmostEqual(2.0945514815, root, 9)
+
+    def test_it_should_bisect_when_newton_diverges(self):
+        # Newton's method diverges for arctan from this guess
+        root = integration.find_root(
+            math.atan, 3.0, lambda x: 1 / (1 + x**2))
+        self.assertAlmostEqual(0.0, root, 8)
+
+    def test_it_should_stay_within_limits(self):
+        evaluated = []
+
+        def func(x):
+            evaluated.append(x)
+            return math.log(x) - 1
+
+        root = integration.find_root(
+            func, 20.0, lambda x: 1 / x, lower_limit=0.0)
+        self.assertAlmostEqual(math.e, root, 8)
+        self.assertTrue(all(x > 0 for x in evaluated))
+
+    def test_it_should_stop_after_max_iterations(self):
+        with self.assertRaises(RuntimeError):
+            integration.find_root(lambda x: x**2 + 1, 0.3, max_iterations=20)
+
+
+class TestApproximateInverse(unittest.TestCase):
+    def setUp(self):
+        super(TestApproximateInverse, self).setUp()
+        integrator = integration.Integrator(20, 1E-10)
+        self.evaluations = 0
+
+        def cdf(x):
+            self.evaluations += 1
+            return integrator.integrate_minus_infinity_to(
+                statistics.normal_distribution, x)
+        self.cdf = cdf
+
+    def test_it_should_invert_with_analytic_derivative(self):
+        result = integration.approximate_inverse(
+            self.cdf, 0.95, df=statistics.normal_distribution, guess=0.0)
+        self.assertAlmostEqual(1.644853627, result, 8)
+        self.assertLessEqual(self.evaluations, 8)
+
+    def test_it_should_invert_without_derivative(self):
+        result = integration.approximate_inverse(self.cdf, 0.85)
+        self.assertAlmostEqual(1.036433389, result, 8)
+
+
+class TestCumulativeDistribution(unittest.TestCase):
+    def setUp(self):
+        super(TestCumulativeDistribution, self).setUp()
+        self.integrator = integration.GaussKronrodIntegrator(1, 1E-12)
+        self.cdf = integration.CumulativeDistribution(
+            self.integrator, statistics.normal_distribution)
+
+    def test_it_should_match_direct_integration(self):
+        for x in [1.1, -0.4, 2.5, 1.2, -2.0, 0.0]:
+            self.assertAlmostEqual(
+                self.integrator.integrate_minus_infinity_to(
+                    statistics.normal_distribution, x), self.cdf(x), 10)
+
+    def test_it_should_reuse_evaluated_points(self):
+        self.cdf(1.5)
+        evaluation_count = self.cdf.evaluation_count
+        self.cdf(1.5)
+        self.assertEqual(evaluation_count, self.cdf.evaluation_count)
+
+
+class TestApproximateInverseMany(unittest.TestCase):
+    def setUp(self):
+        super(TestApproximateInverseMany, self).setUp()
+        self.points = [0.95, 0.05, 0.5, 0.7, 0.3, 0.7]
+
+    def test_it_should_return_inverses_in_given_order(self):
+        results = integration.approximate_inverse_many(
+            lambda x: x**3, [8.0, -1.0, 27.0, 8.0], lambda x: 3 * x**2, 1.0)
+        for expected, result in zip([2.0, -1.0, 3.0, 2.0], results):
+            self.assertAlmostEqual(expected, result, 8)
+
+    def test_it_should_invert_cumulative_distribution(self):
+        cdf = integration.CumulativeDistribution(
+            integration.Integrator(20, 1E-10), statistics.normal_distribution)
+        results = integration.approximate_inverse_many(
+            cdf, self.points, df=statistics.normal_distribution, guess=0.0)
+        for point, result in zip(self.points, results):
+            self.assertAlmostEqual(
+                statistics.normal_ppf(point), result, 8)
+
+
+class TestBudget(unittest.TestCase):
+    def setUp(self):
+        super(TestBudget, self).setUp()
+        self.x_data = [1, 2, 3, 4, 5, 6]
+        self.y_data = [1.2, 1.9, 3.4, 3.8, 5.3, 5.9]
+
+    def test_it_should_track_evaluations(self):
+        budget = integration.Budget(max_evaluations=10)
+        self.assertTrue(budget.can_afford(10))
+        budget.charge(4)
+        self.assertTrue(budget.can_afford(6))
+        self.assertFalse(budget.can_afford(7))
+
+    def test_it_should_expire_at_deadline(self):
+        budget = integration.Budget(timeout=-1)
+        self.assertFalse(budget.can_afford(1))
+
+    def test_integrators_should_return_best_estimate(self):
+        expected = math.erf(2.5 / math.sqrt(2)) / 2
+        for integrator in [integration.Integrator(10, 1E-14),
+                           integration.RombergIntegrator(10, 1E-15),
+                           integration.AdaptiveIntegrator(10, 1E-14),
+                           integration.GaussKronrodIntegrator(1, 1E-15)]:
+            budget = integration.Budget(max_evaluations=60)
+            with self.assertRaises(integration.BudgetExhausted) as context:
+                integrator.integrate(
+                    statistics.normal_distribution, 0, 2.5, budget)
+            result = context.exception.result
+            self.assertLessEqual(budget.evaluation_count, 60)
+            self.assertEqual(budget.evaluation_count, result.evaluation_count)
+            self.assertAlmostEqual(expected, result.value, 4)
+            self.assertLess(abs(expected - result.value), 10 * result.error)
+
+    def test_it_should_not_start_without_budget(self):
+        integrator = integration.GaussKronrodIntegrator(1, 1E-10)
+        budget = integration.Budget(max_evaluations=10)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            integrator.integrate(statistics.normal_distribution, 0, 1, budget)
+        self.assertIsNone(context.exception.result.value)
+        self.assertEqual(0, budget.evaluation_count)
+
+    def test_it_should_not_affect_converging_integration(self):
+        integrator = integration.GaussKronrodIntegrator(1, 1E-10)
+        budget = integration.Budget(max_evaluations=1000, timeout=60)
+        result = integrator.integrate_minus_infinity_to(
+            statistics.normal_distribution, 2.5, budget=budget)
+        self.assertAlmostEqual(0.99379033467, result, 10)
+        self.assertEqual(integrator.evaluation_count, budget.evaluation_count)
+
+    def test_root_finder_should_return_bracket(self):
+        budget = integration.Budget(max_evaluations=4)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            integration.find_root(
+                math.atan, 3.0, lambda x: 1 / (1 + x**2), budget=budget)
+        result = context.exception.result
+        self.assertEqual(4, result.evaluation_count)
+        self.assertLessEqual(abs(result.value), result.error)
+
+    def test_newton_raphson_should_stop(self):
+        budget = integration.Budget(max_evaluations=6)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            integration.newton_raphson(
+                lambda x: x**3 - 2 * x - 5, 10.0, budget=budget)
+        self.assertEqual(6, context.exception.result.evaluation_count)
+
+    def test_root_finder_should_count_evaluations_inside_function(self):
+        budget = integration.Budget(max_evaluations=1000)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            statistics.t_ppf(
+                0.975, 9, integration.Integrator(20, 1E-10), budget)
+        self.assertLessEqual(budget.evaluation_count, 1000)
+        self.assertEqual(
+            budget.evaluation_count,
+            context.exception.result.evaluation_count)
+
+    def test_root_finder_should_not_charge_calls_twice(self):
+        integrator = integration.Integrator(20, 1E-10)
+        budget = integration.Budget()
+        counts = []
+
+        def cdf(x):
+            result = integrator.integrate_minus_infinity_to(
+                statistics.normal_distribution, x, budget=budget)
+            counts.append(integrator.evaluation_count)
+            return result
+
+        integration.approximate_inverse(
+            cdf, 0.9, df=statistics.normal_distribution, guess=0.0,
+            budget=budget)
+        self.assertEqual(sum(counts), budget.evaluation_count)
+
+    def test_inverse_many_should_count_only_its_evaluations(self):
+        cdf = integration.CumulativeDistribution(
+            integration.Integrator(20, 1E-10), statistics.normal_distribution)
+        budget = integration.Budget(max_evaluations=100)
+        budget.charge(81)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            integration.approximate_inverse_many(
+                cdf, [0.05, 0.5, 0.95], df=statistics.normal_distribution,
+                guess=0.0, budget=budget)
+        self.assertEqual(
+            budget.evaluation_count - 81,
+            context.exception.result.evaluation_count)
+
+    def test_prediction_range_should_return_best_estimate(self):
+        integrator = integration.Integrator(10, 1E-12)
+        budget = integration.Budget(max_evaluations=200)
+        expected = statistics.prediction_range(
+            3.5, 0.7, self.x_data, self.y_data)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            statistics.prediction_range(
+                3.5, 0.7, self.x_data, self.y_data, integrator, budget)
+        self.assertAlmostEqual(expected, context.exception.result.value, 1)
+
+    def test_significance_should_return_best_estimate(self):
+        integrator = integration.Integrator(10, 1E-14)
+        budget = integration.Budget(max_evaluations=100)
+        expected = statistics.significance(self.x_data, self.y_data)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            statistics.significance(
+                self.x_data, self.y_data, integrator, budget)
+        result = context.exception.result
+        self.assertLess(abs(expected - result.value), result.error)
+
+    def test_chi_squared_should_stop(self):
+        # Unequal segments are not covered by the precomputed table
+        data = [((i * 7919) % 137) / 10.0 for i in range(137)]
+        test = chi_squared.GeneralChiSquaredTest(
+            integration.Integrator(20, 1E-10))
+        budget = integration.Budget(max_evaluations=500)
+        with self.assertRaises(integration.BudgetExhausted) as context:
+            test.execute(data, budget)
+        self.assertIsNone(context.exception.result.value)
+        self.assertLessEqual(budget.evaluation_count, 500)
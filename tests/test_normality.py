@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from lib import chi_squared
+from lib import normality
+
+
+class TestNumericColumns(unittest.TestCase):
+    def test_should_only_return_numeric_columns(self):
+        data = [
+            {'Name': 'a', 'Size': '1.5', 'Parts': '2'},
+            {'Name': 'b', 'Size': '2', 'Parts': '3'},
+        ]
+        self.assertEqual(
+            {'Size': [1.5, 2.0], 'Parts': [2.0, 3.0]},
+            normality.numeric_columns(data))
+
+    def test_should_skip_blank_values(self):
+        data = [
+            {'Size': '1.5', 'Parts': ''},
+            {'Size': ' ', 'Parts': '3'},
+            {'Size': '2', 'Parts': None},
+        ]
+        self.assertEqual(
+            {'Size': [1.5, 2.0], 'Parts': [3.0]},
+            normality.numeric_columns(data))
+
+    def test_should_keep_partly_numeric_columns_without_values(self):
+        data = [
+            {'Size': '1.5'},
+            {'Size': 'n/a'},
+        ]
+        self.assertEqual({'Size': None}, normality.numeric_columns(data))
+
+    def test_should_handle_empty_data(self):
+        self.assertEqual({}, normality.numeric_columns([]))
+
+
+class TestEvaluateColumn(unittest.TestCase):
+    def setUp(self):
+        super(TestEvaluateColumn, self).setUp()
+        generator = random.Random(3)
+        self.values = [generator.gauss(0, 1) for _ in range(60)]
+
+    def test_should_match_chi_squared_test(self):
+        result = normality.evaluate_column(('a.csv', 'x', self.values))
+        self.assertEqual('chi-squared', result['test'])
+        self.assertEqual(
+            chi_squared.ChiSquaredTest().execute(self.values),
+            (result['chi_squared'], result['p_value']))
+
+    def test_should_use_general_test_for_uneven_items(self):
+        values = self.values[:57]
+        result = normality.evaluate_column(('a.csv', 'x', values))
+        self.assertEqual('general chi-squared', result['test'])
+        self.assertEqual(
+            chi_squared.GeneralChiSquaredTest().execute(values),
+            (result['chi_squared'], result['p_value']))
+
+    def test_should_report_errors(self):
+        self.assertIn('error', normality.evaluate_column(
+            ('a.csv', 'x', None)))
+        self.assertIn('error', normality.evaluate_column(
+            ('a.csv', 'x', self.values[:10])))
+        self.assertIn('error', normality.evaluate_column(
+            ('a.csv', 'x', [1.0] * 20)))
+
+
+class TestBatchNormalityTest(unittest.TestCase):
+    def setUp(self):
+        super(TestBatchNormalityTest, self).setUp()
+        self.temp_dir = tempfile.mkdtemp()
+        generator = random.Random(5)
+        self.file_paths = []
+        for name in ['first.csv', 'second.csv']:
+            file_path = os.path.join(self.temp_dir, name)
+            with open(file_path, 'w') as csv_file:
+                csv_file.write('Name,Size,Time\n')
+                for i in range(40):
+                    csv_file.write('item{},{},{}\n'.format(
+                        i, generator.gauss(0, 1), generator.random()))
+            self.file_paths.append(file_path)
+
+    def tearDown(self):
+        super(TestBatchNormalityTest, self).tearDown()
+        shutil.rmtree(self.temp_dir)
+
+    def test_should_test_every_numeric_column(self):
+        results = list(
+            normality.BatchNormalityTest(2).execute(self.file_paths))
+        self.assertEqual(
+            [(file_path, column)
+             for file_path in self.file_paths
+             for column in ['Size', 'Time']],
+            [(each['file'], each['column']) for each in results])
+        for result in results:
+            self.assertNotIn('error', result)
+            self.assertEqual(40, result['items'])
+
+    def test_should_report_partly_numeric_columns(self):
+        with open(self.file_paths[0], 'a') as csv_file:
+            csv_file.write('extra,,n/a\n')
+        results = list(
+            normality.BatchNormalityTest(2).execute(self.file_paths[:1]))
+        self.assertEqual(
+            ['Size', 'Time'], [each['column'] for each in results])
+        self.assertEqual(40, results[0]['items'])
+        self.assertIn('error', results[1])
+
+    def test_should_test_selected_columns(self):
+        results = list(normality.BatchNormalityTest(2).execute(
+            self.file_paths[:1], ['Time', 'Name']))
+        self.assertEqual(
+            ['Time', 'Name'], [each['column'] for each in results])
+        self.assertIn('p_value', results[0])
+        self.assertIn('error', results[1])
+
+    def test_should_read_bounded_number_of_columns_ahead(self):
+        read = []
+
+        class RecordingTest(normality.BatchNormalityTest):
+            PENDING_COLUMNS_PER_PROCESS = 1
+
+            def get_tasks(self, file_paths, columns=None):
+                for task in super(RecordingTest, self).get_tasks(
+                        file_paths, columns):
+                    read.append(task)
+                    yield task
+
+        results = RecordingTest(2).execute(self.file_paths * 5)
+        next(results)
+        self.assertEqual(2, len(read))
+        self.assertEqual(19, len(list(results)))
+        self.assertEqual(20, len(read))
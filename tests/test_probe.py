@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from lib import probe
+
+
+class BaseProbeTestCase(unittest.TestCase):
+    def setUp(self):
+        super(BaseProbeTestCase, self).setUp()
+        self.historical_data = probe.HistoricalData(
+            planned_sizes=[90, 230, 40, 240, 120, 420, 90, 120, 200, 150],
+            proxy_sizes=[83, 116, 186, 81, 114, 97, 197, 87, 136, 151],
+            actual_sizes=[92, 114, 194, 80, 129, 96, 201, 91, 133, 154],
+            planned_times=[30, 60, 70, 40, 50, 45, 75, 35, 55, 60],
+            actual_times=[33, 48, 79, 36, 52, 41, 82, 38, 57, 60])
+        self.estimation = probe.ProbeEstimation(self.historical_data)
+
+
+class TestSatisfiesPreconditions(BaseProbeTestCase):
+    def test_should_accept_well_correlated_regression(self):
+        self.assertTrue(
+            probe.ProbeSizeA.satisfies_preconditions(
+                self.historical_data, 150))
+
+    def test_should_reject_poorly_correlated_regression(self):
+        self.assertFalse(
+            probe.ProbeSizeB.satisfies_preconditions(
+                self.historical_data, 150))
+
+    def test_should_reject_large_beta0_relative_to_estimate(self):
+        method = probe.ProbeSizeA(self.historical_data)
+        self.assertEqual(
+            [True, False], method.accepts_proxy_values([150, -10]))
+
+    def test_should_accept_sizes_with_missing_rows(self):
+        self.historical_data.set_value('actual_sizes', 2, None)
+        self.historical_data.set_value('planned_sizes', 5, None)
+        method = probe.ProbeSizeC(self.historical_data)
+        self.assertTrue(method.is_applicable())
+        self.assertEqual(8, len(method.x_values))
+
+    def test_should_reject_sizes_without_complete_rows(self):
+        historical_data = probe.HistoricalData([], [], [], [], [])
+        historical_data.add_row(['10', '', '', '30', '31'])
+        historical_data.add_row(['', '18', '21', '40', '42'])
+        self.assertFalse(probe.ProbeSizeC(historical_data).is_applicable())
+
+    def test_should_accept_perfectly_correlated_regression(self):
+        historical_data = probe.HistoricalData(
+            planned_sizes=[],
+            proxy_sizes=[80, 100, 120, 150, 200],
+            actual_sizes=[80, 100, 120, 150, 200],
+            planned_times=[],
+            actual_times=[])
+        self.assertTrue(
+            probe.ProbeSizeA.satisfies_preconditions(historical_data, 150))
+
+    def test_should_reject_large_beta0_of_perfect_correlation(self):
+        historical_data = probe.HistoricalData(
+            planned_sizes=[],
+            proxy_sizes=[80, 100, 120, 150, 200],
+            actual_sizes=[110, 130, 150, 180, 230],
+            planned_times=[],
+            actual_times=[])
+        self.assertFalse(
+            probe.ProbeSizeA.satisfies_preconditions(historical_data, 20))
+
+
+class TestEstimateMany(BaseProbeTestCase):
+    def test_should_match_individual_estimates(self):
+        proxy_values = [100, 150, 210]
+        estimates = self.estimation.estimate_many(proxy_values)
+        self.assertEqual(len(proxy_values), len(estimates))
+        for proxy_value, estimate in zip(proxy_values, estimates):
+            size_method = self.estimation.get_size_method(proxy_value)
+            time_method = self.estimation.get_time_method(proxy_value)
+            self.assertEqual(proxy_value, estimate.proxy_value)
+            self.assertEqual(size_method.get_name(), estimate.size_method)
+            self.assertAlmostEqual(
+                size_method.get_regression().estimate(proxy_value),
+                estimate.size_projection)
+            self.assertAlmostEqual(
+                size_method.get_upi(proxy_value), estimate.size_upi)
+            self.assertAlmostEqual(
+                size_method.get_lpi(proxy_value), estimate.size_lpi)
+            self.assertEqual(time_method.get_name(), estimate.time_method)
+            self.assertAlmostEqual(
+                time_method.get_upi(proxy_value), estimate.time_upi)
+            self.assertAlmostEqual(
+                time_method.get_lpi(proxy_value), estimate.time_lpi)
+
+    def test_should_fall_back_per_value(self):
+        estimates = self.estimation.estimate_many([150, -10])
+        self.assertEqual('A', estimates[0].size_method)
+        self.assertEqual('C', estimates[1].size_method)
+
+
+class TestCachedFits(BaseProbeTestCase):
+    def test_should_fit_regression_once(self):
+        method = probe.ProbeSizeA(self.historical_data)
+        regression = method.get_regression()
+        method.get_upi(150)
+        method.get_lpi(150)
+        self.assertIs(regression, method.get_regression())
+        self.assertIs(method.get_summary(), method.get_summary())
+
+    def test_should_not_grow_cache_per_estimated_value(self):
+        method = probe.ProbeSizeA(self.historical_data)
+        method.get_upi(150)
+        cache_size = len(method.cache)
+        for estimated_value in range(100, 200):
+            method.get_upi(estimated_value)
+            method.get_lpi(estimated_value)
+        self.assertEqual(cache_size, len(method.cache))
+
+    def test_should_refit_after_invalidation(self):
+        method = probe.ProbeSizeA(self.historical_data)
+        beta1 = method.get_regression().beta1
+        self.historical_data.set_value('actual_sizes', 0, 1000)
+        self.assertEqual(beta1, method.get_regression().beta1)
+        method.invalidate()
+        self.assertNotEqual(beta1, method.get_regression().beta1)
+
+    def test_should_refit_when_historical_data_replaced(self):
+        method = probe.ProbeSizeA(self.historical_data)
+        correlation = method.get_correlation()
+        method.historical_data = probe.HistoricalData(
+            planned_sizes=[],
+            proxy_sizes=[1, 2, 3, 4],
+            actual_sizes=[2, 4, 6, 9],
+            planned_times=[],
+            actual_times=[])
+        self.assertNotEqual(correlation, method.get_correlation())
+
+
+class TestHistoricalData(unittest.TestCase):
+    def test_should_read_columns_from_csv_file(self):
+        historical_data = probe.HistoricalData.from_csv_file(
+            'data/regression_data.csv')
+        self.assertEqual(
+            historical_data.num_rows, len(historical_data.actual_sizes))
+        self.assertLess(
+            len(historical_data.proxy_sizes), historical_data.num_rows)
+        self.assertEqual([42.0, 84.0], list(historical_data.actual_sizes[:2]))
+
+    def test_should_skip_blank_values(self):
+        historical_data = probe.HistoricalData([], [], [], [], [])
+        historical_data.add_row(['10', '', '12', '30', '31'])
+        historical_data.add_row(['20', '18', None, '', '42'])
+        self.assertEqual([10.0, 20.0], list(historical_data.planned_sizes))
+        self.assertEqual([18.0], list(historical_data.proxy_sizes))
+        self.assertEqual([12.0], list(historical_data.actual_sizes))
+        self.assertEqual([31.0, 42.0], list(historical_data.actual_times))
+
+    def test_should_align_shorter_columns_with_latest_rows(self):
+        historical_data = probe.HistoricalData(
+            planned_sizes=[1, 2, 3],
+            proxy_sizes=[3],
+            actual_sizes=[1, 2, 3],
+            planned_times=[],
+            actual_times=[])
+        self.assertEqual(3, historical_data.num_rows)
+        self.assertEqual([0, 0, 1], list(historical_data.masks['proxy_sizes']))
+
+    def test_should_update_values(self):
+        historical_data = probe.HistoricalData([1, 2], [], [], [], [])
+        historical_data.set_value('planned_sizes', 0, None)
+        self.assertEqual([2.0], list(historical_data.planned_sizes))
+        historical_data.set_value('planned_sizes', 0, 5)
+        self.assertEqual([5.0, 2.0], list(historical_data.planned_sizes))
+
+
+class TestPairs(unittest.TestCase):
+    def setUp(self):
+        super(TestPairs, self).setUp()
+        self.historical_data = probe.HistoricalData([], [], [], [], [])
+        self.historical_data.add_row(['10', '', '12', '30', '31'])
+        self.historical_data.add_row(['20', '18', '21', '40', ''])
+        self.historical_data.add_row(['30', '28', '33', '50', '52'])
+
+    def test_should_keep_rows_aligned(self):
+        x_values, y_values = self.historical_data.pairs(
+            'Proxy Size Estimate', 'Actual Time')
+        self.assertEqual([28.0], list(x_values))
+        self.assertEqual([52.0], list(y_values))
+
+    def test_should_not_copy_complete_columns(self):
+        x_values, y_values = self.historical_data.pairs(
+            'planned_sizes', 'actual_sizes')
+        self.assertIs(self.historical_data.values['planned_sizes'], x_values)
+        self.assertIs(self.historical_data.values['actual_sizes'], y_values)
+
+    def test_should_reflect_updates(self):
+        self.historical_data.set_value('actual_times', 1, 44)
+        x_values, y_values = self.historical_data.pairs(
+            'proxy_sizes', 'actual_times')
+        self.assertEqual([18.0, 28.0], list(x_values))
+        self.assertEqual([44.0, 52.0], list(y_values))
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+import array
 import unittest
 
+from lib import integration
 from lib import statistics
 
 
@@ -44,6 +46,27 @@ class TestStandardDeviation(unittest.TestCase):
             places=5)
 
 
+class TestRunningMoments(unittest.TestCase):
+    def test_should_accept_generators(self):
+        values = (each for each in range(1, 10))
+        self.assertAlmostEqual(
+            2.73861, statistics.standard_deviation(values), places=5)
+
+    def test_should_track_minimum_and_maximum(self):
+        moments = statistics.RunningMoments.from_iterable([3, -1, 7, 2])
+        self.assertEqual(4, moments.count)
+        self.assertEqual(-1, moments.minimum)
+        self.assertEqual(7, moments.maximum)
+
+    def test_should_compute_higher_moments(self):
+        moments = statistics.RunningMoments.from_iterable(
+            [2, 4, 4, 4, 5, 5, 7, 9])
+        self.assertAlmostEqual(5.0, moments.get_mean())
+        self.assertAlmostEqual(32.0 / 7, moments.get_variance())
+        self.assertAlmostEqual(0.65625, moments.get_skewness())
+        self.assertAlmostEqual(-0.21875, moments.get_kurtosis())
+
+
 class TestMedian(unittest.TestCase):
     def test_should_return_middle_value_if_odd_num_items(self):
         self.assertEqual(2, statistics.median([1, 2, 3]))
@@ -154,3 +177,179 @@ class TestCorrelationAndSignificance(unittest.TestCase):
     def test_should_correctly_compute_significance(self):
         result = statistics.significance(self.x_data, self.y_data)
         self.assertAlmostEqual(result, 2 * (1 - 0.99999), 4)
+
+
+class TestNormalQuantiles(unittest.TestCase):
+    def setUp(self):
+        super(TestNormalQuantiles, self).setUp()
+        self.probabilities = [0.1, 0.9, 0.25, 0.5, 0.75]
+
+    def test_should_compute_closed_form_quantiles(self):
+        self.assertEqual(
+            [statistics.normal_ppf(p) for p in self.probabilities],
+            statistics.normal_ppf_many(self.probabilities))
+
+    def test_should_compute_integrated_quantiles(self):
+        integrator = integration.Integrator(20, 1E-10)
+        results = statistics.normal_ppf_many(self.probabilities, integrator)
+        for p, result in zip(self.probabilities, results):
+            self.assertAlmostEqual(statistics.normal_ppf(p), result, 8)
+
+
+class TestRegressionSums(unittest.TestCase):
+    def setUp(self):
+        super(TestRegressionSums, self).setUp()
+        self.use_numpy = statistics.USE_NUMPY
+        self.x_data = [186, 699, 132, 272, 291, 331, 199, 1890, 788, 1601]
+        self.y_data = [
+            15.0, 69.9, 6.5, 22.4, 28.4, 65.9, 19.4, 198.7, 38.8, 138.2
+        ]
+
+    def tearDown(self):
+        super(TestRegressionSums, self).tearDown()
+        statistics.USE_NUMPY = self.use_numpy
+
+    def assert_correct_sums(self, sums):
+        self.assertEqual(10, sums.num_items)
+        self.assertAlmostEqual(6389, sums.sum_x)
+        self.assertAlmostEqual(603.2, sums.sum_y)
+        self.assertAlmostEqual(7604693, sums.sum_xx)
+        self.assertAlmostEqual(
+            sum([x * y for x, y in zip(self.x_data, self.y_data)]),
+            sums.sum_xy)
+        self.assertAlmostEqual(
+            sum([y**2 for y in self.y_data]), sums.sum_yy)
+
+    def test_should_compute_sums_without_numpy(self):
+        statistics.USE_NUMPY = False
+        self.assert_correct_sums(
+            statistics.regression_sums(self.x_data, self.y_data))
+
+    @unittest.skipIf(statistics.numpy is None, 'NumPy is not installed')
+    def test_should_compute_sums_with_numpy(self):
+        statistics.USE_NUMPY = True
+        self.assert_correct_sums(statistics.regression_sums(
+            array.array('d', self.x_data), array.array('d', self.y_data)))
+
+    def test_should_compute_regression_parameters(self):
+        self.assertAlmostEqual(
+            -0.3515, statistics.beta_0(self.x_data, self.y_data), 4)
+        self.assertAlmostEqual(
+            0.0950, statistics.beta_1(self.x_data, self.y_data), 4)
+
+
+class TestRegressionSummary(unittest.TestCase):
+    def setUp(self):
+        super(TestRegressionSummary, self).setUp()
+        self.x_data = [186, 699, 132, 272, 291, 331, 199, 1890, 788, 1601]
+        self.y_data = [
+            15.0, 69.9, 6.5, 22.4, 28.4, 65.9, 19.4, 198.7, 38.8, 138.2
+        ]
+        self.summary = statistics.RegressionSummary.from_data(
+            self.x_data, self.y_data)
+
+    def test_should_raise_error_on_size_mismatch(self):
+        self.assertRaises(
+            RuntimeError,
+            statistics.RegressionSummary.from_data,
+            self.x_data,
+            self.y_data[1:])
+
+    def test_should_compute_every_statistic(self):
+        self.assertAlmostEqual(-0.351494, self.summary.get_beta_0(), 6)
+        self.assertAlmostEqual(0.0949624, self.summary.get_beta_1(), 7)
+        self.assertAlmostEqual(0.9107, self.summary.get_r_squared(), 4)
+        self.assertAlmostEqual(9.033510, self.summary.get_t_value(), 6)
+        self.assertAlmostEqual(1.8032E-5, self.summary.get_significance(), 9)
+
+    def test_should_compute_variance_around_regression(self):
+        regression = self.summary.get_regression()
+        residuals = [
+            (y - regression.estimate(x))**2
+            for x, y in zip(self.x_data, self.y_data)
+        ]
+        self.assertAlmostEqual(
+            sum(residuals) / (len(residuals) - 2),
+            self.summary.get_variance())
+
+    def test_should_compute_variance_far_from_origin(self):
+        # Residuals alternate between +1 and -1 around y = 3x
+        x_data = [1E8 + i for i in range(50)]
+        y_data = [3 * x + (-1)**i for i, x in enumerate(x_data)]
+        # Σ(x - x_avg)² = 10412.5 and Σ(x - x_avg)e = -25
+        expected = (50 - 25**2 / 10412.5) / 48
+        self.assertAlmostEqual(
+            expected, statistics.variance_around_regression(x_data, y_data),
+            6)
+        first = statistics.OnlineLinearRegression()
+        second = statistics.OnlineLinearRegression()
+        for x, y in zip(x_data[:20], y_data[:20]):
+            first.add(x, y)
+        for x, y in zip(x_data[20:], y_data[20:]):
+            second.add(x, y)
+        second.add(1E8 + 60, 3E8 + 185)
+        second.remove(1E8 + 60, 3E8 + 185)
+        first.merge(second)
+        self.assertAlmostEqual(expected, first.get_variance(), 6)
+
+    def test_should_compute_prediction_range(self):
+        self.assertAlmostEqual(
+            statistics.prediction_range(
+                644.429, 0.85, self.x_data, self.y_data),
+            self.summary.get_prediction_range(644.429, 0.85))
+
+    def test_should_raise_error_if_too_few_items_for_prediction_range(self):
+        summary = statistics.RegressionSummary.from_data([1, 2], [2, 4])
+        self.assertRaises(
+            RuntimeError, summary.get_prediction_range, 1, 0.85)
+
+
+class TestOnlineLinearRegression(unittest.TestCase):
+    def setUp(self):
+        super(TestOnlineLinearRegression, self).setUp()
+        self.x_data = [186, 699, 132, 272, 291, 331, 199, 1890, 788, 1601]
+        self.y_data = [
+            15.0, 69.9, 6.5, 22.4, 28.4, 65.9, 19.4, 198.7, 38.8, 138.2
+        ]
+        self.regression = statistics.OnlineLinearRegression()
+        for x, y in zip(self.x_data, self.y_data):
+            self.regression.add(x, y)
+
+    def test_should_match_batch_fit(self):
+        summary = statistics.RegressionSummary.from_data(
+            self.x_data, self.y_data)
+        self.assertAlmostEqual(
+            summary.get_beta_0(), self.regression.get_beta_0())
+        self.assertAlmostEqual(
+            summary.get_beta_1(), self.regression.get_beta_1())
+        self.assertAlmostEqual(
+            summary.get_r_squared(), self.regression.get_r_squared())
+
+    def test_should_remove_observations(self):
+        self.regression.add(1000, 1.0)
+        self.regression.remove(1000, 1.0)
+        self.assertEqual(10, self.regression.get_num_items())
+        self.assertAlmostEqual(
+            statistics.beta_1(self.x_data, self.y_data),
+            self.regression.get_beta_1())
+
+    def test_should_raise_error_when_removing_from_empty_regression(self):
+        self.assertRaises(
+            RuntimeError, statistics.OnlineLinearRegression().remove, 1, 1)
+
+    def test_should_merge_shards(self):
+        first = statistics.OnlineLinearRegression()
+        second = statistics.OnlineLinearRegression()
+        for x, y in zip(self.x_data[:4], self.y_data[:4]):
+            first.add(x, y)
+        for x, y in zip(self.x_data[4:], self.y_data[4:]):
+            second.add(x, y)
+        first.merge(second)
+        self.assertAlmostEqual(
+            self.regression.get_prediction_range(644.429, 0.85),
+            first.get_prediction_range(644.429, 0.85))
+
+    def test_should_not_update_snapshots(self):
+        snapshot = self.regression.get_snapshot()
+        self.regression.add(1000, 1.0)
+        self.assertEqual(10, snapshot.get_num_items())